@@ -12,7 +12,8 @@ from hundredandten.engine.actions import (
     SelectTrump,
 )
 from hundredandten.engine.constants import BidAmount as EngineBidAmount
-from hundredandten.engine.player import RoundPlayer, player_by_identifier
+from hundredandten.engine.instrumentation import span
+from hundredandten.engine.player import RoundPlayer, Seats
 from hundredandten.engine.round import Round
 from hundredandten.state import (
     AvailableAction,
@@ -36,6 +37,10 @@ from hundredandten.state import (
     Unknown,
 )
 
+from .observer import PlayerObserver
+
+__all__ = ["EngineAdapter", "PlayerObserver", "UnavailableActionError"]
+
 
 class UnavailableActionError(Exception):
     """Raised when the decision function returns an action not available to the player"""
@@ -57,11 +62,13 @@ class EngineAdapter:
         not available to the player.
         """
         state = EngineAdapter.state_from_engine(game, identifier)
-        suggested_action = decision_fn(state)
-        if suggested_action not in state.available_actions:
+        with span("decision_fn"):
+            suggested_action = decision_fn(state)
+        available_actions = state.available_actions
+        if suggested_action not in available_actions:
             raise UnavailableActionError(f"""
                 decision_fn returned an action {suggested_action}
-                not in available_actions: {state.available_actions}
+                not in available_actions: {available_actions}
                 game state: {state}
                 """)
         return EngineAdapter.available_action_for_player(suggested_action, identifier)
@@ -71,13 +78,13 @@ class EngineAdapter:
         """Create a player-agnostic Action from a player-aware Action."""
         match a:
             case Bid():
-                return AvailableBid(BidAmount(a.amount))
+                return AvailableBid.of(BidAmount(a.amount))
             case SelectTrump():
-                return AvailableSelectTrump(a.suit)
+                return AvailableSelectTrump.of(a.suit)
             case Discard():
                 return AvailableDiscard(tuple(a.cards))
             case Play():
-                return AvailablePlay(a.card)
+                return AvailablePlay.of(a.card)
         raise ValueError(
             f"Could not convert engine action {a} to an internal action"
         )  # pragma: no cover
@@ -105,27 +112,53 @@ class EngineAdapter:
         All seats are rotated so that the requesting player is seat 0.
         Cards the player cannot see are marked Unknown.
         """
+        with span("state_from_engine"):
+            return EngineAdapter.__state_from_engine(game, identifier)
+
+    @staticmethod
+    def __state_from_engine(game: Game, identifier: str) -> GameState:
         game_round = game.active_round
         players = game_round.players
-        num_players = len(players)
-        non_relative_seat_by_identifier = {
-            round_player.identifier: index for index, round_player in enumerate(players)
-        }
-        player = player_by_identifier(players, identifier)
-        player_index = non_relative_seat_by_identifier[identifier]
+        seats = game_round.seats
+        player_index = seats.seat_of(identifier)
+        player = players[player_index]
+
+        with span("state_from_engine.table"):
+            table = EngineAdapter.__build_table(game, game_round, player_index)
+        with span("state_from_engine.bidding"):
+            bidding = EngineAdapter.__build_bidding(game_round, player)
+        with span("state_from_engine.tricks"):
+            tricks = EngineAdapter.__build_trick_state(game_round, player, seats)
+        with span("state_from_engine.cards"):
+            cards = EngineAdapter.__build_card_knowledge(game_round, player, seats)
 
+        return GameState(
+            status=Status(game.status.name),
+            table=table,
+            hand=tuple(player.hand),
+            bidding=bidding,
+            tricks=tricks,
+            cards=cards,
+        )
+
+    @staticmethod
+    def __build_table(game: Game, game_round: Round, player_index: int) -> TableInfo:
+        players = game_round.players
+        num_players = len(players)
+        seats = game_round.seats
+        player = players[player_index]
         current_scores = game.scores
-        table = TableInfo(
+        return TableInfo(
             num_players=num_players,
             dealer_seat=EngineAdapter.__relative_seat(
-                non_relative_seat_by_identifier,
+                seats,
                 player.identifier,
                 game_round.dealer.identifier,
                 num_players,
             ),
             bidder_seat=(
                 EngineAdapter.__relative_seat(
-                    non_relative_seat_by_identifier,
+                    seats,
                     player.identifier,
                     game_round.active_bidder.identifier,
                     num_players,
@@ -140,16 +173,21 @@ class EngineAdapter:
                 for i in range(num_players)
             ),
         )
-        bidding = BiddingState(
+
+    @staticmethod
+    def __build_bidding(game_round: Round, player: RoundPlayer) -> BiddingState:
+        seats = game_round.seats
+        num_players = len(game_round.players)
+        return BiddingState(
             bid_history=tuple(
-                BidEvent(
-                    seat=EngineAdapter.__relative_seat(
-                        non_relative_seat_by_identifier,
+                BidEvent.of(
+                    EngineAdapter.__relative_seat(
+                        seats,
                         player.identifier,
                         bid.identifier,
                         num_players,
                     ),
-                    amount=BidAmount(bid.amount),
+                    BidAmount(bid.amount),
                 )
                 for bid in game_round.bids
             ),
@@ -161,54 +199,40 @@ class EngineAdapter:
             trump=game_round.trump,
         )
 
-        return GameState(
-            status=Status(game.status.name),
-            table=table,
-            hand=tuple(player.hand),
-            bidding=bidding,
-            tricks=EngineAdapter.__build_trick_state(
-                game_round, player, non_relative_seat_by_identifier
-            ),
-            cards=EngineAdapter.__build_card_knowledge(
-                game_round, player, non_relative_seat_by_identifier
-            ),
-        )
-
     @staticmethod
     def __build_card_knowledge(
         game_round: Round,
         player: RoundPlayer,
-        non_relative_seat_by_identifier: dict[str, int],
+        seats: Seats,
     ) -> tuple[CardKnowledge, ...]:
         card_status_by_card: dict[Card, InHand | Played | Discarded] = {}
         num_players = len(game_round.players)
 
+        in_hand = InHand()
         for card in player.hand:
-            card_status_by_card[card] = InHand()
+            card_status_by_card[card] = in_hand
 
         for trick_index, trick in enumerate(game_round.tricks):
             for play in trick.plays:
-                card_status_by_card[play.card] = Played(
-                    trick_index=trick_index,
-                    seat=EngineAdapter.__relative_seat(
-                        non_relative_seat_by_identifier,
+                card_status_by_card[play.card] = Played.of(
+                    trick_index,
+                    EngineAdapter.__relative_seat(
+                        seats,
                         player.identifier,
                         play.identifier,
                         num_players,
                     ),
                 )
 
+        discarded = Discarded()
         for discard in game_round.discards:
             if discard.identifier == player.identifier:
                 for card in discard.cards:
-                    card_status_by_card[card] = Discarded()
+                    card_status_by_card[card] = discarded
 
         unknown = Unknown()
         return tuple(
-            CardKnowledge(
-                card=card,
-                status=card_status_by_card.get(card, unknown),
-            )
+            CardKnowledge.of(card, card_status_by_card.get(card, unknown))
             for card in ALL_CARDS
         )
 
@@ -216,7 +240,7 @@ class EngineAdapter:
     def __build_trick_state(
         game_round: Round,
         player: RoundPlayer,
-        non_relative_seat_by_identifier: dict[str, int],
+        seats: Seats,
     ) -> TrickState:
         completed_tricks: list[CompletedTrick] = []
         current_trick_plays: tuple[TrickPlay, ...] = ()
@@ -224,14 +248,14 @@ class EngineAdapter:
 
         for trick in game_round.tricks:
             trick_plays = tuple(
-                TrickPlay(
-                    seat=EngineAdapter.__relative_seat(
-                        non_relative_seat_by_identifier,
+                TrickPlay.of(
+                    EngineAdapter.__relative_seat(
+                        seats,
                         player.identifier,
                         play.identifier,
                         num_players,
                     ),
-                    card=play.card,
+                    play.card,
                 )
                 for play in trick.plays
             )
@@ -241,7 +265,7 @@ class EngineAdapter:
                     CompletedTrick(
                         plays=trick_plays,
                         winner_seat=EngineAdapter.__relative_seat(
-                            non_relative_seat_by_identifier,
+                            seats,
                             player.identifier,
                             winner_play.identifier,
                             num_players,
@@ -258,12 +282,11 @@ class EngineAdapter:
 
     @staticmethod
     def __relative_seat(
-        non_relative_seat_by_identifier: dict[str, int],
+        seats: Seats,
         player_identifier: str,
         other_identifier: str,
         num_players: int,
     ) -> int:
         return (
-            non_relative_seat_by_identifier[other_identifier]
-            - non_relative_seat_by_identifier[player_identifier]
+            seats.seat_of(other_identifier) - seats.seat_of(player_identifier)
         ) % num_players
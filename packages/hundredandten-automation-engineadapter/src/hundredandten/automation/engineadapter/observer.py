@@ -0,0 +1,215 @@
+"""Follow a game for one player, observing it incrementally"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from hundredandten.deck import ALL_CARDS, Card
+from hundredandten.engine import Game
+from hundredandten.engine.actions import Bid, Discard, Play, SelectTrump
+from hundredandten.engine.round import Round
+from hundredandten.state import (
+    BidAmount,
+    BiddingState,
+    BidEvent,
+    CardKnowledge,
+    CardStatus,
+    CompletedTrick,
+    Discarded,
+    GameState,
+    InHand,
+    Played,
+    Status,
+    TableInfo,
+    TrickPlay,
+    TrickState,
+    Unknown,
+)
+
+_IN_HAND = InHand()
+_DISCARDED = Discarded()
+_UNKNOWN = Unknown()
+
+
+@dataclass(slots=True)
+class _Observed:  # pylint: disable=too-many-instance-attributes
+    """
+    What the player has observed of one round, and the parts of their latest state
+    built from it. A part is dropped when what it is built from changes.
+    """
+
+    game_round: Round
+    seat: int
+    seen: int = 0
+    bid_history: list[BidEvent] = field(default_factory=list)
+    statuses: list[CardStatus] = field(
+        default_factory=lambda: [_UNKNOWN] * len(ALL_CARDS)
+    )
+    completed_tricks: list[CompletedTrick] = field(default_factory=list)
+    current_trick: list[TrickPlay] = field(default_factory=list)
+    # the engine replaces a hand rather than change it, so this is the list
+    # the hand was built from until the player discards or plays
+    held: Optional[list[Card]] = None
+    hand: tuple[Card, ...] = ()
+    table: Optional[TableInfo] = None
+    bidding: Optional[BiddingState] = None
+    completed: Optional[tuple[CompletedTrick, ...]] = None
+    tricks: Optional[TrickState] = None
+    cards: Optional[tuple[CardKnowledge, ...]] = None
+
+
+class PlayerObserver:
+    """
+    Build the GameState of one player as a game is played.
+
+    Each observation only reads the actions taken since the previous one,
+    so the game must only move forward between observations: actions are
+    appended to the active round and new rounds are appended to the game.
+    EngineAdapter.state_from_engine builds the same state from scratch.
+
+    Parts of the state that have not changed since the previous observation
+    are the same objects in the next one, and an observation where nothing
+    has changed is the previous observation itself.
+    """
+
+    def __init__(self, game: Game, identifier: str) -> None:
+        self.game = game
+        self.identifier = identifier
+        self.__observed: Optional[_Observed] = None
+        self.__state: Optional[GameState] = None
+
+    def observe(self) -> GameState:
+        """The state of the game as the player observes it now"""
+        game_round = self.game.active_round
+        observed = self.__observed
+        if observed is None or game_round is not observed.game_round:
+            observed = self.__observed = _Observed(
+                game_round, game_round.seats.seat_of(self.identifier)
+            )
+
+        actions = game_round.actions
+        for action in actions[observed.seen :]:
+            if isinstance(action, Bid):
+                observed.bid_history.append(
+                    BidEvent.of(
+                        self.__relative(action.identifier), BidAmount(action.amount)
+                    )
+                )
+                # the bid may decide the bidder as well as change the bidding
+                observed.bidding = observed.table = None
+            if isinstance(action, SelectTrump):
+                observed.bidding = None
+            if isinstance(action, Discard) and action.identifier == self.identifier:
+                for card in action.cards:
+                    _set_status(observed, card, _DISCARDED)
+            if isinstance(action, Play):
+                self.__play(observed, action)
+        observed.seen = len(actions)
+
+        self.__state = self.__next_state(observed)
+        return self.__state
+
+    def __play(self, observed: _Observed, play: Play) -> None:
+        """Record a play, completing the trick when everyone has played in it"""
+        seat = self.__relative(play.identifier)
+        trick_index = len(observed.completed_tricks)
+        _set_status(observed, play.card, Played.of(trick_index, seat))
+        observed.current_trick.append(TrickPlay.of(seat, play.card))
+        observed.tricks = None
+
+        if len(observed.current_trick) == len(observed.game_round.players):
+            winner = observed.game_round.tricks[trick_index].winning_play
+            observed.completed_tricks.append(
+                CompletedTrick(
+                    plays=tuple(observed.current_trick),
+                    winner_seat=self.__relative(winner.identifier),
+                )
+            )
+            observed.completed = None
+            observed.current_trick = []
+
+    def __next_state(self, observed: _Observed) -> GameState:
+        """
+        The state from everything observed so far, building only the parts that
+        changed, or the previous state when none did
+        """
+        previous = self.__state
+        status = Status(self.game.status.name)
+        # scores only change as a round ends, which changes the round or the status
+        changed = previous is None or previous.status != status
+        if observed.table is None or changed:
+            observed.table = self.__table(observed)
+            changed = True
+
+        held = observed.game_round.players[observed.seat].hand
+        if held is not observed.held:
+            observed.held, observed.hand = held, tuple(held)
+            for card in held:
+                _set_status(observed, card, _IN_HAND)
+            changed = True
+
+        if observed.bidding is None:
+            active_bid = observed.game_round.active_bid
+            observed.bidding = BiddingState(
+                bid_history=tuple(observed.bid_history),
+                active_bid=BidAmount(active_bid) if active_bid is not None else None,
+                trump=observed.game_round.trump,
+            )
+            changed = True
+
+        if observed.tricks is None:
+            if observed.completed is None:
+                observed.completed = tuple(observed.completed_tricks)
+            observed.tricks = TrickState(
+                completed_tricks=observed.completed,
+                current_trick_plays=tuple(observed.current_trick),
+            )
+            changed = True
+
+        if observed.cards is None:
+            observed.cards = tuple(
+                CardKnowledge.of(card, card_status)
+                for card, card_status in zip(ALL_CARDS, observed.statuses)
+            )
+            changed = True
+
+        if not changed:
+            assert previous is not None
+            return previous
+        return GameState(
+            status=status,
+            table=observed.table,
+            hand=observed.hand,
+            bidding=observed.bidding,
+            tricks=observed.tricks,
+            cards=observed.cards,
+        )
+
+    def __table(self, observed: _Observed) -> TableInfo:
+        """The table as the player observes it"""
+        players = observed.game_round.players
+        num_players = len(players)
+        scores = self.game.scores
+        bidder = observed.game_round.active_bidder
+        return TableInfo(
+            num_players=num_players,
+            dealer_seat=(observed.game_round.dealer_seat - observed.seat) % num_players,
+            bidder_seat=self.__relative(bidder.identifier) if bidder else None,
+            scores=tuple(
+                scores.get(players[(observed.seat + i) % num_players].identifier, 0)
+                for i in range(num_players)
+            ),
+        )
+
+    def __relative(self, identifier: str) -> int:
+        """The seat of the identified player relative to the observing player"""
+        assert self.__observed
+        observed = self.__observed
+        seats = observed.game_round.seats
+        return (seats.seat_of(identifier) - observed.seat) % len(seats)
+
+
+def _set_status(observed: _Observed, card: Card, status: CardStatus) -> None:
+    """Record what the player knows of the card, dropping the cards when it changes"""
+    if observed.statuses[card.index] != status:
+        observed.statuses[card.index] = status
+        observed.cards = None
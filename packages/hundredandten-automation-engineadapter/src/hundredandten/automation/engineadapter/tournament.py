@@ -0,0 +1,226 @@
+"""
+Play many games between decision functions across processes, and summarize them.
+
+Each game of a tournament is identified by its index in a range: the nth game is
+seeded with round_seed(seed, n), and the decision function at each position plays
+the seat at that position. Results are yielded in the order of the range, so the same
+deterministic decision functions always produce the same results, however many
+processes play them.
+"""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from math import sqrt
+from statistics import NormalDist
+from typing import Optional
+
+from hundredandten.deck import round_seed
+from hundredandten.engine import Game, Player
+from hundredandten.engine.constants import BidAmount, Status
+from hundredandten.engine.round import Round
+from hundredandten.state import AvailableAction, GameState
+
+from . import EngineAdapter
+
+type DecisionFn = Callable[[GameState], AvailableAction]
+
+
+@dataclass(frozen=True)
+class BidResult:
+    """The winning bid of a round that was played out"""
+
+    seat: int
+    amount: BidAmount
+    # the points the bidder earned in the round; negative when the bid was missed
+    points: int
+
+    @property
+    def made(self) -> bool:
+        """Whether the bidder took enough points to make the bid"""
+        return self.points >= 0
+
+    @property
+    def shoot_the_moon(self) -> bool:
+        """Whether the bidder tried to shoot the moon"""
+        return self.amount == BidAmount.SHOOT_THE_MOON
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """The outcome of one game of a tournament"""
+
+    index: int
+    seed: str
+    winner: int
+    # the totals of each seat before the first round and after every round
+    score_history: tuple[tuple[int, ...], ...]
+    bids: tuple[BidResult, ...]
+
+    @property
+    def scores(self) -> tuple[int, ...]:
+        """The final score of each seat"""
+        return self.score_history[-1]
+
+
+@dataclass(frozen=True)
+class SeatRecord:  # pylint: disable=too-many-instance-attributes
+    """The results of the decision function in one seat over many games"""
+
+    seat: int
+    games: int
+    wins: int
+    bids: int
+    bids_made: int
+    moon_attempts: int
+    moon_shots: int
+    # the bounds of the confidence interval of the win rate
+    low: float
+    high: float
+
+    @property
+    def win_rate(self) -> float:
+        """The fraction of games won from the seat"""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def bids_missed(self) -> int:
+        """The number of winning bids not made"""
+        return self.bids - self.bids_made
+
+
+def play(
+    decision_fns: Sequence[DecisionFn],
+    seed: str,
+    games: range,
+    workers: Optional[int] = None,
+    chunksize: int = 100,
+) -> Iterator[GameResult]:
+    """
+    Play each game in the range, yielding its result in the order of the range.
+    Games are sent to a pool of workers processes in chunks of chunksize games, so
+    the decision functions must be picklable (e.g. defined at the top of a module).
+    With a single worker, games are played in this process.
+    Raises UnavailableActionError if a decision function returns an unavailable action.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = (
+        games[start : start + chunksize] for start in range(0, len(games), chunksize)
+    )
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _play_chunk(decision_fns, seed, chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # bound the chunks in flight so results stream without queuing every game
+        pending: deque[Future[list[GameResult]]] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_play_chunk, decision_fns, seed, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def play_game(decision_fns: Sequence[DecisionFn], seed: str, index: int) -> GameResult:
+    """Play the game at the index of the tournament with the provided seed"""
+    players = [Player(str(seat)) for seat in range(len(decision_fns))]
+    game = Game(players=players, seed=round_seed(seed, index))
+    while game.status != Status.WON:
+        identifier = game.active_player.identifier
+        game.act(
+            EngineAdapter.action_for(game, identifier, decision_fns[int(identifier)])
+        )
+
+    winner = game.winner
+    assert winner
+    return GameResult(
+        index=index,
+        seed=game.seed,
+        winner=int(winner.identifier),
+        score_history=tuple(
+            tuple(scores[player.identifier] for player in players)
+            for scores in game.scores_by_round
+        ),
+        bids=tuple(
+            _bid_result(game_round)
+            for game_round in game.rounds
+            if game_round.status == Status.COMPLETED
+        ),
+    )
+
+
+def standings(
+    results: Iterable[GameResult], num_players: int, confidence: float = 0.95
+) -> tuple[SeatRecord, ...]:
+    """
+    The record of each seat over the results.
+    Win rates are bounded by the Wilson score interval at the provided confidence.
+    """
+    games = 0
+    wins = [0] * num_players
+    bids = [0] * num_players
+    bids_made = [0] * num_players
+    moon_attempts = [0] * num_players
+    moon_shots = [0] * num_players
+    for result in results:
+        games += 1
+        wins[result.winner] += 1
+        for bid in result.bids:
+            bids[bid.seat] += 1
+            bids_made[bid.seat] += bid.made
+            moon_attempts[bid.seat] += bid.shoot_the_moon
+            moon_shots[bid.seat] += bid.shoot_the_moon and bid.made
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return tuple(
+        SeatRecord(
+            seat,
+            games,
+            wins[seat],
+            bids[seat],
+            bids_made[seat],
+            moon_attempts[seat],
+            moon_shots[seat],
+            *_wilson_interval(wins[seat], games, z),
+        )
+        for seat in range(num_players)
+    )
+
+
+def _play_chunk(
+    decision_fns: Sequence[DecisionFn], seed: str, indices: range
+) -> list[GameResult]:
+    """Play each game in the range"""
+    return [play_game(decision_fns, seed, index) for index in indices]
+
+
+def _bid_result(game_round: Round) -> BidResult:
+    """The winning bid of a completed round"""
+    bidder = game_round.active_bidder
+    amount = game_round.active_bid
+    assert bidder and amount
+    return BidResult(
+        seat=int(bidder.identifier),
+        amount=amount,
+        points=sum(
+            score.value
+            for score in game_round.scores
+            if score.identifier == bidder.identifier
+        ),
+    )
+
+
+def _wilson_interval(successes: int, trials: int, z: float) -> tuple[float, float]:
+    """The Wilson score interval of a binomial proportion"""
+    if not trials:
+        return 0.0, 1.0
+    rate = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (rate + z**2 / (2 * trials)) / denominator
+    margin = z * sqrt(rate * (1 - rate) / trials + z**2 / (4 * trials**2)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
@@ -0,0 +1,132 @@
+"""
+Play many games in lockstep, with numeric observations and actions.
+Requires the numpy extra: pip install hundredandten-automation-engineadapter[numpy]
+
+Observations, masks and action indices are those of hundredandten.state.observation,
+always for the active player of each game.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from hundredandten.deck import round_seed
+from hundredandten.engine import Game, Player
+from hundredandten.engine.constants import Status
+from hundredandten.state import GameState
+from hundredandten.state.observation import (
+    ACTION_SIZE,
+    OBSERVATION_SIZE,
+    encode,
+    index_to_action,
+    legal_mask,
+)
+from numpy.typing import ArrayLike, NDArray
+
+from . import EngineAdapter, UnavailableActionError
+from .observer import PlayerObserver
+
+
+class VectorGame:  # pylint: disable=too-many-instance-attributes
+    """
+    One game for each provided seed, played a step at a time.
+
+    Each step takes an action for the active player of every game. A game that is won
+    is replaced by the next game of its seed: the nth game played from a seed is seeded
+    with round_seed(seed, n), so the same seeds and actions always play the same games.
+    """
+
+    def __init__(self, seeds: Sequence[str], num_players: int = 4) -> None:
+        self.seeds = tuple(seeds)
+        self.num_players = num_players
+        self.games: list[Game] = []
+        # the number of games each seed has started
+        self.started = [0] * len(self.seeds)
+        self.__observers: list[dict[str, PlayerObserver]] = []
+        self.__states: list[GameState] = []
+        self.__observations = np.zeros(
+            (len(self.seeds), OBSERVATION_SIZE), dtype=np.float32
+        )
+        self.__masks = np.zeros((len(self.seeds), ACTION_SIZE), dtype=np.bool)
+        self.reset()
+
+    def reset(self) -> tuple[NDArray[np.float32], NDArray[np.bool]]:
+        """Start the first game of every seed, returning its observations and masks"""
+        self.games = []
+        self.__observers = []
+        self.__states = []
+        self.started = [0] * len(self.seeds)
+        for index in range(len(self.seeds)):
+            self.games.append(self.__new_game(index))
+            self.__observers.append({})
+            self.__states.append(self.__observe(index))
+        return self.__observations.copy(), self.__masks.copy()
+
+    def step(
+        self, actions: ArrayLike
+    ) -> tuple[
+        NDArray[np.float32], NDArray[np.bool], NDArray[np.float32], NDArray[np.bool]
+    ]:
+        """
+        Take the action at each index for the active player of the matching game.
+        Returns the observations and masks of the next active players, the change in
+        every seat's score, one column per seat in the order of Game.players, and
+        whether each game was won. A round is scored all at once by its last card,
+        so every seat's change is returned rather than only the acting player's.
+        Won games are replaced before their observations are taken.
+        Raises UnavailableActionError, before acting in any game,
+        if an action is not legal in its game.
+        """
+        indices = np.asarray(actions)
+        if indices.shape != (len(self.games),):
+            raise ValueError(f"Expected {len(self.games)} actions, got {indices.shape}")
+        for index, action in enumerate(indices.tolist()):
+            if not 0 <= action < ACTION_SIZE or not self.__masks[index, action]:
+                raise UnavailableActionError(
+                    f"Action {action} is not available in game {index}"
+                )
+
+        rewards = np.zeros((len(self.games), self.num_players), dtype=np.float32)
+        dones = np.zeros(len(self.games), dtype=np.bool)
+        for index, action in enumerate(indices.tolist()):
+            game = self.games[index]
+            identifier = game.active_player.identifier
+            state = self.__states[index]
+            before = game.scores
+            game.act(
+                EngineAdapter.available_action_for_player(
+                    index_to_action(state, action), identifier
+                )
+            )
+            after = game.scores
+            rewards[index] = [
+                after.get(p.identifier, 0) - before.get(p.identifier, 0)
+                for p in game.players
+            ]
+
+            if game.status == Status.WON:
+                dones[index] = True
+                self.games[index] = self.__new_game(index)
+                self.__observers[index] = {}
+            self.__states[index] = self.__observe(index)
+
+        return self.__observations.copy(), self.__masks.copy(), rewards, dones
+
+    def __new_game(self, index: int) -> Game:
+        """The next game of the seed at the index"""
+        seed = round_seed(self.seeds[index], self.started[index])
+        self.started[index] += 1
+        return Game(
+            players=[Player(str(seat)) for seat in range(self.num_players)], seed=seed
+        )
+
+    def __observe(self, index: int) -> GameState:
+        """Record the observation and mask of the active player of the game"""
+        game = self.games[index]
+        identifier = game.active_player.identifier
+        observers = self.__observers[index]
+        if identifier not in observers:
+            observers[identifier] = PlayerObserver(game, identifier)
+        state = observers[identifier].observe()
+        encode(state, out=self.__observations[index])
+        legal_mask(state, out=self.__masks[index])
+        return state
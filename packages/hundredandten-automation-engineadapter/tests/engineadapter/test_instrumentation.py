@@ -0,0 +1,47 @@
+"""Test timing spans of the engine adapter with recorders"""
+
+from unittest import TestCase
+
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.engine.constants import Status
+from hundredandten.engine.instrumentation import HistogramRecorder, recording
+from hundredandten.state import GameState
+from hundredandten.testing import arrange
+
+STEPS = ["table", "bidding", "tricks", "cards"]
+
+
+class TestAdapterInstrumentation(TestCase):
+    """Unit tests for the spans timed by the engine adapter"""
+
+    def test_state_from_engine(self):
+        """Building a state times each part of it"""
+        game = arrange.game(Status.TRICKS)
+        recorder = HistogramRecorder()
+
+        with recording(recorder):
+            EngineAdapter.state_from_engine(game, game.active_player.identifier)
+
+        self.assertEqual(
+            {"state_from_engine", *(f"state_from_engine.{step}" for step in STEPS)},
+            set(recorder.histograms),
+        )
+        whole = recorder.histograms["state_from_engine"].total
+        for step in STEPS:
+            self.assertLess(
+                recorder.histograms[f"state_from_engine.{step}"].total, whole
+            )
+
+    def test_action_for(self):
+        """Choosing an action times the decision function"""
+        game = arrange.game(Status.BIDDING)
+        recorder = HistogramRecorder()
+
+        def first(state: GameState):
+            return state.available_actions[0]
+
+        with recording(recorder):
+            EngineAdapter.action_for(game, game.active_player.identifier, first)
+
+        self.assertEqual(1, recorder.histograms["decision_fn"].count)
+        self.assertEqual(1, recorder.histograms["state_from_engine"].count)
@@ -0,0 +1,107 @@
+"""Test observing a game incrementally against building the state from scratch"""
+
+from random import Random
+from unittest import TestCase
+
+from hundredandten.automation.engineadapter import EngineAdapter, PlayerObserver
+from hundredandten.engine import Game
+from hundredandten.engine.constants import Status as EngineStatus
+from hundredandten.engine.player import Player
+from hundredandten.testing import arrange
+
+
+def play_action(game: Game, rng: Random) -> None:
+    """Take a random available action as the active player"""
+    identifier = game.active_player.identifier
+    game.act(
+        EngineAdapter.action_for(
+            game, identifier, lambda state: rng.choice(list(state.available_actions))
+        )
+    )
+
+
+class TestPlayerObserver(TestCase):
+    """Unit tests for the incremental player observer"""
+
+    def test_matches_state_from_engine(self):
+        """Every player's observation matches the stateless state after each action"""
+        rng = Random("observer")
+        for game_number in range(12):
+            game = Game(
+                players=[Player(str(i)) for i in range(2 + game_number % 3)],
+                seed=str(game_number),
+            )
+            observers = [PlayerObserver(game, p.identifier) for p in game.players]
+
+            while game.status != EngineStatus.WON and len(game.rounds) < 6:
+                for observer in observers:
+                    self.assertEqual(
+                        EngineAdapter.state_from_engine(game, observer.identifier),
+                        observer.observe(),
+                    )
+                play_action(game, rng)
+
+    def test_observe_after_many_actions(self):
+        """Observing after several actions and rounds catches up with all of them"""
+        rng = Random("catch-up")
+        game = Game(players=[Player(str(i)) for i in range(4)], seed="catch-up")
+        observer = PlayerObserver(game, "2")
+
+        for actions in (1, 3, 10, 40, 200):
+            for _ in range(actions):
+                if game.status != EngineStatus.WON:
+                    play_action(game, rng)
+            self.assertEqual(
+                EngineAdapter.state_from_engine(game, "2"), observer.observe()
+            )
+
+    def test_observe_won_game(self):
+        """A won game is observed like any other"""
+        game = arrange.game(EngineStatus.WON)
+        observer = PlayerObserver(game, game.players[0].identifier)
+
+        self.assertEqual(
+            EngineAdapter.state_from_engine(game, game.players[0].identifier),
+            observer.observe(),
+        )
+
+    def test_unchanged_observation_is_shared(self):
+        """Observing without any new action returns the previous observation"""
+        game = arrange.game(EngineStatus.TRICKS)
+        observer = PlayerObserver(game, game.players[0].identifier)
+
+        self.assertIs(observer.observe(), observer.observe())
+
+    def test_unchanged_parts_are_shared(self):
+        """Parts of the state that an action does not change are shared"""
+        game = arrange.game(EngineStatus.TRICKS)
+        arrange.play_trick(game)
+        observer = PlayerObserver(game, game.players[0].identifier)
+        before = observer.observe()
+
+        play_action(game, Random("shared"))
+        after = observer.observe()
+
+        self.assertIsNot(before, after)
+        self.assertIs(before.table, after.table)
+        self.assertIs(before.bidding, after.bidding)
+        self.assertIs(before.tricks.completed_tricks, after.tricks.completed_tricks)
+        self.assertIsNot(before.cards, after.cards)
+        for old, new in zip(before.cards, after.cards):
+            if old == new:
+                self.assertIs(old, new)
+
+    def test_bid_only_changes_bidding(self):
+        """A bid by another player shares every part but the bidding and table"""
+        game = arrange.game(EngineStatus.BIDDING)
+        identifier = next(p.identifier for p in game.players if p != game.active_player)
+        observer = PlayerObserver(game, identifier)
+        before = observer.observe()
+
+        play_action(game, Random("bid"))
+        after = observer.observe()
+
+        self.assertIsNot(before.bidding, after.bidding)
+        self.assertIs(before.hand, after.hand)
+        self.assertIs(before.tricks, after.tricks)
+        self.assertIs(before.cards, after.cards)
@@ -0,0 +1,140 @@
+"""Test playing tournaments between decision functions"""
+
+from unittest import TestCase
+
+from hundredandten.automation.engineadapter import UnavailableActionError
+from hundredandten.automation.engineadapter.tournament import (
+    BidResult,
+    GameResult,
+    SeatRecord,
+    play,
+    play_game,
+    standings,
+)
+from hundredandten.deck import ALL_CARDS, round_seed
+from hundredandten.engine.constants import WINNING_SCORE, BidAmount
+from hundredandten.state import (
+    AvailableAction,
+    AvailableBid,
+    AvailablePlay,
+    BidAmount as StateBidAmount,
+    GameState,
+)
+
+
+def bid(amount: StateBidAmount, state: GameState) -> AvailableAction:
+    """Bid the amount whenever possible, and otherwise take the first action"""
+    available = state.available_actions
+    return next((a for a in available if a == AvailableBid.of(amount)), available[0])
+
+
+def bid_fifteen(state: GameState) -> AvailableAction:
+    """Bid fifteen whenever possible"""
+    return bid(StateBidAmount.FIFTEEN, state)
+
+
+def shoot_the_moon(state: GameState) -> AvailableAction:
+    """Try to shoot the moon whenever possible"""
+    return bid(StateBidAmount.SHOOT_THE_MOON, state)
+
+
+def play_first_card(_: GameState) -> AvailableAction:
+    """Play the first card of the deck, even when it is not available"""
+    return AvailablePlay.of(ALL_CARDS[0])
+
+
+def result(winner: int, *bids: BidResult) -> GameResult:
+    """A two player game result with the provided winner and bids"""
+    return GameResult(0, "seed", winner, ((0, 0),), bids)
+
+
+def counts(record: SeatRecord) -> tuple[int, ...]:
+    """The counts of the record"""
+    return (
+        record.seat,
+        record.games,
+        record.wins,
+        record.bids,
+        record.bids_made,
+        record.moon_attempts,
+        record.moon_shots,
+    )
+
+
+class TestTournament(TestCase):
+    """Unit tests for tournaments between decision functions"""
+
+    def test_play_game(self):
+        """A game is played to its winner, recording its scores and bids"""
+        game = play_game([bid_fifteen, shoot_the_moon, bid_fifteen], "game", 3)
+
+        self.assertEqual(3, game.index)
+        self.assertEqual(round_seed("game", 3), game.seed)
+        self.assertEqual((0, 0, 0), game.score_history[0])
+        self.assertGreaterEqual(game.scores[game.winner], WINNING_SCORE)
+        self.assertEqual(len(game.bids) + 1, len(game.score_history))
+        for bid_result, before, after in zip(
+            game.bids, game.score_history, game.score_history[1:]
+        ):
+            self.assertEqual(
+                bid_result.points, after[bid_result.seat] - before[bid_result.seat]
+            )
+        self.assertTrue(all(b.shoot_the_moon for b in game.bids if b.seat == 1))
+
+    def test_deterministic(self):
+        """The same games are played in order, however many processes play them"""
+        fns = [bid_fifteen, shoot_the_moon]
+
+        in_process = list(play(fns, "tournament", range(2, 8), workers=1, chunksize=4))
+        pooled = list(play(fns, "tournament", range(2, 8), workers=2, chunksize=1))
+
+        self.assertEqual(list(range(2, 8)), [game.index for game in in_process])
+        self.assertEqual(in_process, pooled)
+
+    def test_unavailable_action(self):
+        """A decision function returning an unavailable action ends the tournament"""
+        self.assertRaises(
+            UnavailableActionError,
+            list,
+            play(
+                [play_first_card, play_first_card], "unavailable", range(1), workers=1
+            ),
+        )
+
+    def test_standings(self):
+        """Each seat's wins, bids and shots at the moon are counted"""
+        made = BidResult(0, BidAmount.TWENTY, 25)
+        missed = BidResult(1, BidAmount.FIFTEEN, -15)
+        shot = BidResult(1, BidAmount.SHOOT_THE_MOON, 60)
+        failed = BidResult(1, BidAmount.SHOOT_THE_MOON, -60)
+        results = [result(0, made, missed), result(0, shot), result(1, failed)]
+
+        first, second = standings(results, 2)
+
+        self.assertEqual((0, 3, 2, 1, 1, 0, 0), counts(first))
+        self.assertEqual((1, 3, 1, 3, 1, 2, 1), counts(second))
+        self.assertEqual(0, first.bids_missed)
+        self.assertEqual(2, second.bids_missed)
+        self.assertAlmostEqual(2 / 3, first.win_rate)
+        for record in (first, second):
+            self.assertLess(record.low, record.win_rate)
+            self.assertGreater(record.high, record.win_rate)
+
+    def test_standings_interval(self):
+        """The interval narrows with more games and widens with more confidence"""
+        few = standings([result(0), result(1)], 2)[0]
+        many = standings([result(0), result(1)] * 50, 2)[0]
+        confident = standings([result(0), result(1)] * 50, 2, confidence=0.99)[0]
+        unanimous = standings([result(0)] * 10, 2)
+
+        self.assertLess(many.high - many.low, few.high - few.low)
+        self.assertLess(many.high - many.low, confident.high - confident.low)
+        self.assertAlmostEqual(1.0, unanimous[0].high)
+        self.assertAlmostEqual(0.0, unanimous[1].low)
+
+    def test_standings_without_games(self):
+        """Without games, nothing is known about the win rate"""
+        record = standings([], 2)[0]
+
+        self.assertEqual(0.0, record.win_rate)
+        self.assertEqual((0.0, 1.0), (record.low, record.high))
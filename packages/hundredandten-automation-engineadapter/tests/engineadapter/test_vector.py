@@ -0,0 +1,147 @@
+"""Test playing many games in lockstep through numeric observations and actions"""
+
+from unittest import TestCase
+
+import numpy as np
+from hundredandten.automation.engineadapter import EngineAdapter, UnavailableActionError
+from hundredandten.automation.engineadapter.vector import VectorGame
+from hundredandten.deck import round_seed
+from hundredandten.engine.constants import Status
+from hundredandten.state import BidAmount
+from hundredandten.state.observation import (
+    ACTION_SIZE,
+    BID_ACTIONS,
+    BIDS,
+    OBSERVATION_SIZE,
+    encode,
+    legal_mask,
+)
+from numpy.typing import NDArray
+
+FIFTEEN = BID_ACTIONS + BIDS.index(BidAmount.FIFTEEN)
+
+
+def policy(masks: NDArray[np.bool]) -> NDArray[np.intp]:
+    """Bid fifteen whenever possible, and otherwise take the first legal action"""
+    return np.where(masks[:, FIFTEEN], FIFTEEN, np.argmax(masks, axis=1))
+
+
+def assert_matches_games(vector: VectorGame, observations, masks) -> None:
+    """Each row is the observation and mask of the active player of its game"""
+    for game, observation, mask in zip(vector.games, observations, masks):
+        state = EngineAdapter.state_from_engine(game, game.active_player.identifier)
+        np.testing.assert_array_equal(encode(state), observation)
+        np.testing.assert_array_equal(legal_mask(state), mask)
+
+
+class TestVectorGame(TestCase):
+    """Unit tests for the vectorized game"""
+
+    def test_reset(self):
+        """Resetting starts the first game of each seed"""
+        vector = VectorGame(["a", "b", "c"], num_players=3)
+
+        observations, masks = vector.reset()
+
+        self.assertEqual((3, OBSERVATION_SIZE), observations.shape)
+        self.assertEqual((3, ACTION_SIZE), masks.shape)
+        self.assertEqual(
+            [round_seed(seed, 0) for seed in ("a", "b", "c")],
+            [game.seed for game in vector.games],
+        )
+        self.assertTrue(all(len(game.players) == 3 for game in vector.games))
+        assert_matches_games(vector, observations, masks)
+
+    def test_step(self):
+        """Each step acts in every game and observes its next active player"""
+        vector = VectorGame(["a", "b"])
+        observations, masks = vector.reset()
+
+        for _ in range(60):
+            observations, masks, rewards, dones = vector.step(policy(masks))
+            self.assertEqual((2, 4), rewards.shape)
+            self.assertFalse(dones.any())
+            assert_matches_games(vector, observations, masks)
+
+    def test_rewards(self):
+        """The rewards are the change in each seat's score"""
+        vector = VectorGame(["rewards"])
+        _, masks = vector.reset()
+        game = vector.games[0]
+
+        for _ in range(60):
+            before = game.scores
+            _, masks, rewards, _ = vector.step(policy(masks))
+            after = game.scores
+            np.testing.assert_array_equal(
+                [after[p.identifier] - before[p.identifier] for p in game.players],
+                rewards[0],
+            )
+
+    def test_round_rewards(self):
+        """The bidder is rewarded for a round even when another seat plays its last card"""
+        vector = VectorGame(["round-rewards"])
+        _, masks = vector.reset()
+
+        while True:
+            game = vector.games[0]
+            game_round = game.active_round
+            identifier = game.active_player.identifier
+            before = game.scores
+            _, masks, rewards, _ = vector.step(policy(masks))
+            bidder = game_round.active_bidder and game_round.active_bidder.identifier
+            if game_round.status == Status.COMPLETED and bidder != identifier:
+                break
+
+        assert bidder is not None
+        seat = [p.identifier for p in game.players].index(bidder)
+        self.assertEqual(game.scores[bidder] - before[bidder], rewards[0, seat])
+        self.assertNotEqual(0, rewards[0, seat])
+
+    def test_auto_reset(self):
+        """A won game is replaced by the next game of its seed"""
+        vector = VectorGame(["auto"])
+        observations, masks = vector.reset()
+        first = vector.games[0]
+
+        dones = np.zeros(1, dtype=np.bool)
+        while not dones.any():
+            observations, masks, _, dones = vector.step(policy(masks))
+
+        self.assertIsNot(first, vector.games[0])
+        self.assertEqual(round_seed("auto", 1), vector.games[0].seed)
+        self.assertEqual(2, vector.started[0])
+        self.assertEqual([], vector.games[0].actions)
+        assert_matches_games(vector, observations, masks)
+
+    def test_reproducible(self):
+        """The same seeds and actions play the same games"""
+        runs = []
+        for _ in range(2):
+            vector = VectorGame(["x", "y", "z"])
+            steps: list[tuple[NDArray, ...]] = [vector.reset()]
+            for _ in range(700):
+                steps.append(vector.step(policy(steps[-1][1])))
+            runs.append(steps)
+
+        self.assertGreater(sum(step[3].sum() for step in runs[0][1:]), 0)
+        for first, second in zip(*runs):
+            for left, right in zip(first, second):
+                np.testing.assert_array_equal(left, right)
+
+    def test_unavailable_action(self):
+        """An action not legal in its game is rejected before acting in any game"""
+        vector = VectorGame(["a", "b"])
+        _, masks = vector.reset()
+        illegal = int(np.argmin(masks[1]))
+
+        for actions in ([policy(masks)[0], illegal], [policy(masks)[0], ACTION_SIZE]):
+            self.assertRaises(UnavailableActionError, vector.step, actions)
+
+        self.assertEqual([[], []], [game.actions for game in vector.games])
+
+    def test_wrong_number_of_actions(self):
+        """Exactly one action is taken for each game"""
+        vector = VectorGame(["a", "b"])
+
+        self.assertRaises(ValueError, vector.step, [0])
@@ -0,0 +1,272 @@
+"""An information set Monte Carlo tree search strategy for hundred and ten games"""
+
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from random import Random
+from typing import Optional
+
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.automation.montecarlo import (
+    RolloutPolicy,
+    determinize,
+    play_out,
+    rollout_action,
+    validate_budget,
+)
+from hundredandten.deck import Card, SelectableSuit
+from hundredandten.engine.constants import Status as EngineStatus
+from hundredandten.engine.round import Round
+from hundredandten.state import (
+    AvailableAction,
+    AvailableBid,
+    AvailablePlay,
+    AvailableSelectTrump,
+    BidAmount,
+    Discarded,
+    GameState,
+)
+
+from .zobrist import ZobristKeys
+
+__all__ = [
+    "AutomationError",
+    "Budget",
+    "ISMCTSPlayer",
+    "ZobristKeys",
+    "action_for",
+]
+
+EXPLORATION = 20.0
+
+_COMPLETED = (EngineStatus.COMPLETED, EngineStatus.COMPLETED_NO_BIDDERS)
+
+
+class AutomationError(Exception):
+    """Raised when there is an error in the automation process"""
+
+
+@dataclass(frozen=True)
+class Budget:
+    """
+    How many iterations of the search to run for each decision.
+    The search stops after that many iterations or, if seconds is provided, once that
+    many seconds have passed. Without a number of iterations, the search runs until
+    the seconds have passed.
+    """
+
+    iterations: Optional[int] = 1000
+    seconds: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        validate_budget("iterations", self.iterations, self.seconds)
+
+
+@dataclass(slots=True)
+class _Edge:
+    """The statistics of taking an action from an information set"""
+
+    visits: int = 0
+    reward: float = 0.0
+    # the number of times its information set was visited with the action available
+    available: int = 0
+
+
+# the edges from an information set, by the action they take
+type _Node = dict[AvailableAction, _Edge]
+
+
+class ISMCTSPlayer:
+    """
+    Choose the available action visited most by an information set Monte Carlo
+    tree search.
+
+    Each iteration deals the cards the player cannot see at random and descends the
+    tree through actions available in that deal, choosing by the upper confidence
+    bound of each action's outcome for the player taking it. The first action not yet
+    in the tree is added to it, and the round is played out with the rollout policy.
+    Discards other than the one being decided are taken with the rollout policy,
+    since there are too many to search.
+
+    Information sets are kept in a transposition table keyed by the Zobrist hash of
+    the public information of the round, so that the statistics found by one decision
+    are reused by the player's later decisions in the same round.
+    """
+
+    def __init__(
+        self,
+        budget: Budget = Budget(),
+        exploration: float = EXPLORATION,
+        policy: RolloutPolicy = rollout_action,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.budget = budget
+        self.exploration = exploration
+        self.policy = policy
+        self.__rng = Random(seed)
+        self.__keys = ZobristKeys()
+        self.__tree: dict[int, _Node] = {}
+        self.__previous: Optional[GameState] = None
+
+    @property
+    def nodes(self) -> int:
+        """The number of information sets in the tree"""
+        return len(self.__tree)
+
+    def visits(self, state: GameState) -> int:
+        """The number of iterations that have passed through the state"""
+        node = self.__tree.get(self.__keys.state_hash(state), {})
+        return sum(edge.visits for edge in node.values())
+
+    def action_for(self, state: GameState) -> AvailableAction:
+        """Return the available action visited most by the search"""
+        available = state.available_actions
+        if not available:
+            raise AutomationError(
+                f"Cannot determine an ISMCTS action in status {state.status}"
+            )
+        if len(available) == 1:
+            return available[0]
+
+        if self.__previous is None or not _continues(self.__previous, state):
+            self.__tree = {}
+        self.__previous = state
+
+        root = self.__keys.state_hash(state)
+        self.__search(state, root)
+        node = self.__tree[root]
+        return max(available, key=lambda a: node[a].visits if a in node else -1)
+
+    def __search(self, state: GameState, root: int) -> None:
+        """Run iterations from the state until the budget is spent"""
+        budget = self.budget
+        deadline = (
+            None if budget.seconds is None else time.perf_counter() + budget.seconds
+        )
+        actions = list(state.available_actions)
+        iterations = 0
+        while budget.iterations is None or iterations < budget.iterations:
+            self.__iterate(state, root, actions)
+            iterations += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+    def __iterate(
+        self, state: GameState, root: int, actions: list[AvailableAction]
+    ) -> None:
+        """
+        Descend the tree from the state in a new deal, add an action to it and play
+        the round out. The actions are those available in the state
+        """
+        game_round = determinize(state, self.__rng)
+        value = root
+        path: list[tuple[_Edge, int]] = []
+        expanded = False
+        while not expanded and game_round.status not in _COMPLETED:
+            seat = game_round.active_seat
+            if path and game_round.status == EngineStatus.DISCARD:
+                action = self.policy(game_round, self.__rng)
+            else:
+                chosen, edge, expanded = self.__select(
+                    value, _available(game_round) if path else actions
+                )
+                path.append((edge, seat))
+                action = EngineAdapter.available_action_for_player(chosen, str(seat))
+            tricks = len(game_round.tricks)
+            game_round.act(action, validate=False)
+            value = self.__keys.after(value, game_round, action, tricks)
+
+        outcomes = play_out(game_round, self.__rng, self.policy)
+        for edge, seat in path:
+            edge.visits += 1
+            edge.reward += outcomes[seat]
+
+    def __select(
+        self, value: int, available: Sequence[AvailableAction]
+    ) -> tuple[AvailableAction, _Edge, bool]:
+        """
+        The action to take from the information set with the hash, its edge, and
+        whether it was added to the tree. Actions not yet tried are added first
+        """
+        node = self.__tree.get(value)
+        if node is None:
+            node = self.__tree[value] = {}
+        untried = []
+        for action in available:
+            if action in node:
+                node[action].available += 1
+            else:
+                untried.append(action)
+        if untried:
+            chosen = self.__rng.choice(untried)
+            node[chosen] = _Edge(available=1)
+            return chosen, node[chosen], True
+        exploration = self.exploration
+        chosen = max(available, key=lambda a: _upper_bound(node[a], exploration))
+        return chosen, node[chosen], False
+
+
+def action_for(state: GameState) -> AvailableAction:
+    """
+    Return the ISMCTS action for the game state, with the default budget.
+    The tree is only reused when the same player decides consecutively
+    """
+    return _DEFAULT_PLAYER.action_for(state)
+
+
+def _upper_bound(edge: _Edge, exploration: float) -> float:
+    """The upper confidence bound of the outcome of taking an action"""
+    return edge.reward / edge.visits + exploration * math.sqrt(
+        math.log(edge.available) / edge.visits
+    )
+
+
+def _available(game_round: Round) -> list[AvailableAction]:
+    """The actions available to the active player of a round that can be searched"""
+    player = game_round.active_player
+    match game_round.status:
+        case EngineStatus.BIDDING:
+            return [
+                AvailableBid.of(BidAmount(amount))
+                for amount in game_round.available_bids(player.identifier)
+            ]
+        case EngineStatus.TRUMP_SELECTION:
+            return [AvailableSelectTrump.of(suit) for suit in SelectableSuit]
+    trumps = player.hand_set.trumps(game_round.trump)
+    bleeding = game_round.active_trick.bleeding and trumps
+    return [AvailablePlay.of(card) for card in (trumps if bleeding else player.hand)]
+
+
+def _continues(previous: GameState, state: GameState) -> bool:
+    """Whether the state is later in the same round as a previous state of the player"""
+    history = previous.bidding.bid_history
+    plays = _plays(state)
+    # the player has held every card they were dealt, played or discarded
+    held = {
+        *state.hand,
+        *(card for seat, card in plays if seat == 0),
+        *(k.card for k in state.cards if isinstance(k.status, Discarded)),
+    }
+    return (
+        previous.table.dealer_seat == state.table.dealer_seat
+        and previous.table.scores == state.table.scores
+        and state.bidding.bid_history[: len(history)] == history
+        and _plays(previous) <= plays
+        and set(previous.hand) <= held
+    )
+
+
+def _plays(state: GameState) -> set[tuple[int, Card]]:
+    """The seat and card of every play in the round"""
+    return {
+        (play.seat, play.card)
+        for plays in (
+            *(trick.plays for trick in state.tricks.completed_tricks),
+            state.tricks.current_trick_plays,
+        )
+        for play in plays
+    }
+
+
+_DEFAULT_PLAYER = ISMCTSPlayer(seed=0)
@@ -0,0 +1,86 @@
+"""Hash the public information of a round, as seen by the player at seat 0"""
+
+from random import Random
+
+from hundredandten.deck import ALL_CARDS, SelectableSuit
+from hundredandten.engine.actions import Action, Bid, Discard, Play, SelectTrump
+from hundredandten.engine.constants import HAND_SIZE, BidAmount, Status as EngineStatus
+from hundredandten.engine.round import Round
+from hundredandten.state import Discarded, GameState, Status
+
+# games have at most four players
+_SEATS = 4
+_COMPLETED = (EngineStatus.COMPLETED, EngineStatus.COMPLETED_NO_BIDDERS)
+
+
+class ZobristKeys:
+    """
+    A random key for each piece of public information in a round.
+
+    The hash of a round is the exclusive or of the keys of the bids, trump, played
+    cards, cards in the trick in progress, number of tricks and active seat, along
+    with the number of cards the player at seat 0 discarded. Taking an action changes
+    the hash by the keys of only what the action changed.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        rng = Random(seed)
+
+        def keys(count: int) -> list[int]:
+            return [rng.getrandbits(64) for _ in range(count)]
+
+        self.bids = [dict(zip(BidAmount, keys(len(BidAmount)))) for _ in range(_SEATS)]
+        self.trumps = dict(zip(SelectableSuit, keys(len(SelectableSuit))))
+        self.discards = keys(HAND_SIZE + 1)
+        self.played = [keys(len(ALL_CARDS)) for _ in range(_SEATS)]
+        self.in_trick = [keys(len(ALL_CARDS)) for _ in range(_SEATS)]
+        self.tricks = keys(HAND_SIZE + 1)
+        self.active = keys(_SEATS)
+
+    def state_hash(self, state: GameState) -> int:
+        """The hash of the round the state observes, with seat 0 to act"""
+        completed = state.tricks.completed_tricks
+        started = len(completed) + 1 if state.status == Status.TRICKS else 0
+        value = self.tricks[started] ^ self.active[0]
+        for bid in state.bidding.bid_history:
+            value ^= self.bids[bid.seat][BidAmount(bid.amount)]
+        if state.bidding.trump is not None:
+            value ^= self.trumps[state.bidding.trump]
+        if started:
+            # the player discarded before the first trick
+            value ^= self.discards[
+                sum(isinstance(k.status, Discarded) for k in state.cards)
+            ]
+        for trick in completed:
+            for play in trick.plays:
+                value ^= self.played[play.seat][play.card.index]
+        for play in state.tricks.current_trick_plays:
+            value ^= self.in_trick[play.seat][play.card.index]
+        return value
+
+    def after(self, value: int, game_round: Round, action: Action, tricks: int) -> int:
+        """
+        The hash of the round after the action, from its hash before the action.
+        The round had the provided number of tricks before the action
+        """
+        seat = int(action.identifier)
+        value ^= self.active[seat] ^ self.tricks[tricks]
+        value ^= self.tricks[len(game_round.tricks)]
+        match action:
+            case Bid():
+                value ^= self.bids[seat][action.amount]
+            case SelectTrump():
+                value ^= self.trumps[action.suit]
+            case Discard() if seat == 0:
+                value ^= self.discards[len(action.cards)]
+            case Play():
+                value ^= self.in_trick[seat][action.card.index]
+        if 0 < tricks < len(game_round.tricks):
+            # a trick was completed, so its cards are no longer in the trick
+            for play in game_round.tricks[tricks - 1].plays:
+                index = play.card.index
+                value ^= self.in_trick[int(play.identifier)][index]
+                value ^= self.played[int(play.identifier)][index]
+        if game_round.status not in _COMPLETED:
+            value ^= self.active[game_round.active_seat]
+        return value
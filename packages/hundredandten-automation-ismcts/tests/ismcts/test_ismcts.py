@@ -0,0 +1,144 @@
+"""Test choosing actions with an information set Monte Carlo tree search"""
+
+from unittest import TestCase
+
+from hundredandten.automation import naive
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.automation.ismcts import (
+    AutomationError,
+    Budget,
+    ISMCTSPlayer,
+    action_for,
+)
+from hundredandten.engine import Game, Player
+from hundredandten.engine.constants import Status
+from hundredandten.state import GameState
+from hundredandten.testing import arrange
+
+SEED = "ismcts-seed"
+DECIDING = [Status.BIDDING, Status.TRUMP_SELECTION, Status.DISCARD, Status.TRICKS]
+
+
+def state_of(game: Game) -> GameState:
+    """The state of the game for its active player"""
+    return EngineAdapter.state_from_engine(game, game.active_player.identifier)
+
+
+def act_naive(game: Game) -> None:
+    """Act as the naive player would for the active player"""
+    identifier = game.active_player.identifier
+    game.act(EngineAdapter.action_for(game, identifier, naive.action_for))
+
+
+def act_until(game: Game, identifier: str) -> None:
+    """Act with naive players until the identified player is active"""
+    while game.active_player.identifier != identifier:
+        act_naive(game)
+
+
+class TestISMCTS(TestCase):
+    """Unit tests for the ISMCTS player"""
+
+    def test_statuses(self):
+        """An available action is chosen in every status a player decides in"""
+        for status in DECIDING:
+            player = ISMCTSPlayer(Budget(iterations=100), seed=0)
+            state = state_of(arrange.game(status, seed=SEED))
+
+            self.assertIn(player.action_for(state), state.available_actions)
+            self.assertEqual(100, player.visits(state))
+            self.assertGreater(player.nodes, 1)
+
+    def test_only_action(self):
+        """With one available action, it is chosen without searching"""
+        game = arrange.game(Status.TRICKS, seed=SEED)
+        for _ in range(4):
+            arrange.play_trick(game)
+        state = state_of(game)
+
+        player = ISMCTSPlayer(seed=0)
+
+        self.assertEqual(state.available_actions[0], player.action_for(state))
+        self.assertEqual(0, player.nodes)
+
+    def test_no_actions(self):
+        """A player that cannot act cannot choose an action"""
+        game = arrange.game(Status.WON, seed=SEED)
+        state = EngineAdapter.state_from_engine(game, game.players[0].identifier)
+
+        self.assertRaises(AutomationError, ISMCTSPlayer().action_for, state)
+
+    def test_reuse(self):
+        """Later decisions in the same round continue from the earlier search"""
+        game = Game(players=[Player(str(seat)) for seat in range(2)], seed=SEED)
+        while game.status != Status.TRICKS:
+            act_naive(game)
+        identifier = game.active_player.identifier
+        player = ISMCTSPlayer(Budget(iterations=200), seed=0)
+
+        first = state_of(game)
+        game.act(
+            EngineAdapter.available_action_for_player(
+                player.action_for(first), identifier
+            )
+        )
+        act_until(game, identifier)
+        second = state_of(game)
+        visited = player.visits(second)
+        player.action_for(second)
+
+        self.assertGreater(visited, 0)
+        self.assertEqual(visited + 200, player.visits(second))
+
+    def test_new_round(self):
+        """The search starts over in a new round"""
+        game = arrange.game(Status.BIDDING, seed=SEED)
+        identifier = game.active_player.identifier
+        player = ISMCTSPlayer(Budget(iterations=50), seed=0)
+        player.action_for(state_of(game))
+
+        arrange.pass_round(game)
+        act_until(game, identifier)
+        state = state_of(game)
+        player.action_for(state)
+
+        self.assertEqual(50, player.visits(state))
+
+    def test_seeded(self):
+        """Players with the same seed make the same decisions"""
+        states = [state_of(arrange.game(status, seed=SEED)) for status in DECIDING]
+
+        decisions = [
+            [
+                ISMCTSPlayer(Budget(iterations=50), seed=3).action_for(state)
+                for state in states
+            ]
+            for _ in range(2)
+        ]
+
+        self.assertEqual(decisions[0], decisions[1])
+
+    def test_time_budget(self):
+        """With a time budget, the search runs until it is spent"""
+        state = state_of(arrange.game(Status.TRUMP_SELECTION, seed=SEED))
+
+        player = ISMCTSPlayer(Budget(iterations=None, seconds=0.0), seed=0)
+        player.action_for(state)
+        self.assertEqual(1, player.visits(state))
+
+        player = ISMCTSPlayer(Budget(iterations=20, seconds=60.0), seed=0)
+        player.action_for(state)
+        self.assertEqual(20, player.visits(state))
+
+    def test_unbounded_budget(self):
+        """A budget needs a number of iterations or a time limit"""
+        self.assertRaises(ValueError, Budget, iterations=None)
+        self.assertEqual(None, Budget(iterations=None, seconds=1.0).iterations)
+
+    def test_action_for(self):
+        """The default player chooses available actions"""
+        game = Game(players=[Player(str(seat)) for seat in range(2)], seed=SEED)
+
+        for _ in range(4):
+            identifier = game.active_player.identifier
+            game.act(EngineAdapter.action_for(game, identifier, action_for))
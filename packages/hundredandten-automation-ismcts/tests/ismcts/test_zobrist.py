@@ -0,0 +1,78 @@
+"""Test hashing the public information of a round"""
+
+from unittest import TestCase
+
+from hundredandten.automation import naive
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.automation.ismcts import ZobristKeys
+from hundredandten.engine import Game, Player
+from hundredandten.engine.constants import Status
+
+SEED = "zobrist-seed"
+
+
+def observed_hashes(game: Game, keys: ZobristKeys) -> list[tuple[int, int]]:
+    """
+    Play the game with naive players, returning the hash of the state at each
+    decision of the player at seat 0 along with the hash of the round at that time,
+    kept up to date with each action since the player's first decision in the round
+    """
+    hashes = []
+    value = None
+    while game.status != Status.WON:
+        game_round = game.active_round
+        identifier = game.active_player.identifier
+        if identifier == "0":
+            expected = keys.state_hash(EngineAdapter.state_from_engine(game, "0"))
+            value = expected if value is None else value
+            hashes.append((expected, value))
+        action = EngineAdapter.action_for(game, identifier, naive.action_for)
+        tricks = len(game_round.tricks)
+        game.act(action)
+        if game.active_round is not game_round:
+            value = None
+        elif value is not None:
+            value = keys.after(value, game_round, action, tricks)
+    return hashes
+
+
+class TestZobrist(TestCase):
+    """Unit tests for the Zobrist keys"""
+
+    def test_incremental(self):
+        """Updating the hash with each action matches hashing the state"""
+        for num_players in (2, 3, 4):
+            game = Game(
+                players=[Player(str(seat)) for seat in range(num_players)],
+                seed=f"{SEED}-{num_players}",
+            )
+
+            hashes = observed_hashes(game, ZobristKeys())
+
+            self.assertGreater(len(hashes), 10)
+            for expected, value in hashes:
+                self.assertEqual(expected, value)
+
+    def test_distinct(self):
+        """Each decision of a player in a round has a different hash"""
+        game = Game(players=[Player(str(seat)) for seat in range(4)], seed=SEED)
+        keys = ZobristKeys()
+        hashes = []
+        rounds = 0
+        while game.status != Status.WON and rounds < 3:
+            game_round = game.active_round
+            if game.active_player.identifier == "0":
+                hashes.append(
+                    keys.state_hash(EngineAdapter.state_from_engine(game, "0"))
+                )
+            identifier = game.active_player.identifier
+            game.act(EngineAdapter.action_for(game, identifier, naive.action_for))
+            if game.active_round is not game_round:
+                self.assertEqual(len(hashes), len(set(hashes)))
+                hashes = []
+                rounds += 1
+
+    def test_seeded(self):
+        """Keys with the same seed are the same, and differ from other seeds"""
+        self.assertEqual(ZobristKeys(1).played, ZobristKeys(1).played)
+        self.assertNotEqual(ZobristKeys(1).played, ZobristKeys(2).played)
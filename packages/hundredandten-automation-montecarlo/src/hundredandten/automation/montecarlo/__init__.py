@@ -0,0 +1,231 @@
+"""A determinized Monte Carlo strategy for hundred and ten games"""
+
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from random import Random
+from types import TracebackType
+from typing import Optional
+
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.deck import SelectableSuit
+from hundredandten.engine.actions import Action, Bid, Discard, Play, SelectTrump
+from hundredandten.engine.constants import Status as EngineStatus
+from hundredandten.engine.round import Round
+from hundredandten.state import AvailableAction, GameState
+
+from .determinize import determinize
+
+__all__ = [
+    "AutomationError",
+    "Budget",
+    "MonteCarloPlayer",
+    "RolloutPolicy",
+    "action_for",
+    "determinize",
+    "play_out",
+    "rollout_action",
+    "validate_budget",
+]
+
+type RolloutPolicy = Callable[[Round, Random], Action]
+
+_COMPLETED = (EngineStatus.COMPLETED, EngineStatus.COMPLETED_NO_BIDDERS)
+
+
+class AutomationError(Exception):
+    """Raised when there is an error in the automation process"""
+
+
+def rollout_action(game_round: Round, rng: Random) -> Action:
+    """
+    A fast legal action for the active player of the round.
+    Bids and plays are random, trump is the suit the player holds the most of,
+    and every card that is not trump is discarded.
+    """
+    player = game_round.active_player
+    identifier = player.identifier
+    match game_round.status:
+        case EngineStatus.BIDDING:
+            return Bid(identifier, rng.choice(game_round.available_bids(identifier)))
+        case EngineStatus.TRUMP_SELECTION:
+            return SelectTrump(
+                identifier,
+                max(SelectableSuit, key=lambda suit: len(player.hand_set.trumps(suit))),
+            )
+        case EngineStatus.DISCARD:
+            trumps = player.hand_set.trumps(game_round.trump)
+            return Discard(identifier, [c for c in player.hand if c not in trumps])
+    trumps = player.hand_set.trumps(game_round.trump)
+    bleeding = game_round.active_trick.bleeding and trumps
+    return Play(identifier, rng.choice(list(trumps) if bleeding else player.hand))
+
+
+def play_out(
+    game_round: Round, rng: Random, policy: RolloutPolicy = rollout_action
+) -> list[float]:
+    """
+    Play a round whose players are identified by their seat to its end with the
+    policy, returning the outcome for each seat: the points it earned in the round
+    less the average earned by the other seats
+    """
+    while game_round.status not in _COMPLETED:
+        game_round.act(policy(game_round, rng), validate=False)
+    points = [0] * len(game_round.players)
+    for score in game_round.scores:
+        points[int(score.identifier)] += score.value
+    total = sum(points)
+    others = len(points) - 1
+    return [seat_points - (total - seat_points) / others for seat_points in points]
+
+
+def evaluate(
+    state: GameState, seeds: Sequence[int], policy: RolloutPolicy = rollout_action
+) -> list[float]:
+    """
+    The total outcome of each available action over one determinization per seed.
+    Every action is played out from the same determinization, and the outcome is the
+    points the player earns in the round less the average earned by the others.
+    """
+    actions = [
+        EngineAdapter.available_action_for_player(action, "0")
+        for action in state.available_actions
+    ]
+    totals = [0.0] * len(actions)
+    for seed in seeds:
+        sampled = determinize(state, Random(seed))
+        for index, action in enumerate(actions):
+            rollout = sampled.fork()
+            rollout.act(action, validate=False)
+            totals[index] += play_out(rollout, Random(f"{seed}-{index}"), policy)[0]
+    return totals
+
+
+def validate_budget(name: str, limit: Optional[int], seconds: Optional[float]) -> None:
+    """Raise if a budget without a limit on the named count has no time limit either"""
+    if limit is None and seconds is None:
+        raise ValueError(f"A budget needs a number of {name}, seconds, or both")
+
+
+@dataclass(frozen=True)
+class Budget:
+    """
+    How many rollouts to play for each decision.
+    Rollouts are played batch at a time in each worker until rollouts have been
+    played or, if seconds is provided, until that many seconds have passed.
+    Without a number of rollouts, rollouts are played until the seconds have passed.
+    """
+
+    rollouts: Optional[int] = 100
+    seconds: Optional[float] = None
+    batch: int = 10
+
+    def __post_init__(self) -> None:
+        validate_budget("rollouts", self.rollouts, self.seconds)
+        if self.batch < 1:
+            raise ValueError(
+                f"Rollouts must be played in batches of at least 1, not {self.batch}"
+            )
+
+
+class MonteCarloPlayer:
+    """
+    Choose the available action with the best average outcome over many rollouts.
+
+    Each rollout deals the cards the player cannot see at random, takes every
+    available action and plays the round out with the rollout policy.
+    Rollouts are played in batches within the budget, across a pool of worker
+    processes when there is more than one. Without a time budget, the same seed
+    makes the same decisions however many workers play the rollouts.
+    """
+
+    def __init__(
+        self,
+        budget: Budget = Budget(),
+        workers: int = 1,
+        policy: RolloutPolicy = rollout_action,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.budget = budget
+        self.workers = workers
+        self.policy = policy
+        self.__rng = Random(seed)
+        self.__executor: Optional[Executor] = None
+
+    def __enter__(self) -> "MonteCarloPlayer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started"""
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def action_for(self, state: GameState) -> AvailableAction:
+        """Return the available action with the best average outcome"""
+        available = state.available_actions
+        if not available:
+            raise AutomationError(
+                f"Cannot determine a Monte Carlo action in status {state.status}"
+            )
+        if len(available) == 1:
+            return available[0]
+
+        totals = self.__totals(state, self.__rng.getrandbits(32) << 32)
+        best = max(range(len(available)), key=totals.__getitem__)
+        return available[best]
+
+    def __totals(self, state: GameState, first_seed: int) -> list[float]:
+        """The total outcome of each available action within the budget"""
+        budget = self.budget
+        deadline = (
+            None if budget.seconds is None else time.perf_counter() + budget.seconds
+        )
+        totals = [0.0] * len(state.available_actions)
+        played = 0
+        while budget.rollouts is None or played < budget.rollouts:
+            remaining = self.workers * budget.batch
+            if budget.rollouts is not None:
+                remaining = min(remaining, budget.rollouts - played)
+            end = first_seed + played + remaining
+            batches = [
+                range(start, min(start + budget.batch, end))
+                for start in range(first_seed + played, end, budget.batch)
+            ]
+            for batch_totals in self.__map(state, batches):
+                totals = [a + b for a, b in zip(totals, batch_totals)]
+            played += remaining
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return totals
+
+    def __map(self, state: GameState, batches: list[range]) -> Iterable[list[float]]:
+        """The totals of each batch of rollouts, in order"""
+        if self.workers == 1:
+            return (evaluate(state, seeds, self.policy) for seeds in batches)
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self.__executor.map(
+            evaluate, repeat(state, len(batches)), batches, repeat(self.policy)
+        )
+
+
+def action_for(state: GameState) -> AvailableAction:
+    """
+    Return the Monte Carlo action for the game state, with the default budget,
+    played in this process
+    """
+    return _DEFAULT_PLAYER.action_for(state)
+
+
+_DEFAULT_PLAYER = MonteCarloPlayer(seed=0)
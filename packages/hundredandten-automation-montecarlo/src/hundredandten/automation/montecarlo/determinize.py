@@ -0,0 +1,113 @@
+"""Rebuild the round a player is deciding in, dealing the cards they cannot see"""
+
+from random import Random
+
+from hundredandten.deck import Card, Deck
+from hundredandten.engine import Player
+from hundredandten.engine.actions import Bid, Discard, Play, SelectTrump
+from hundredandten.engine.constants import HAND_SIZE, BidAmount as EngineBidAmount
+from hundredandten.engine.round import Round
+from hundredandten.state import Discarded, GameState, Status, Unknown
+
+
+def determinize(state: GameState, rng: Random) -> Round:
+    """
+    A round consistent with everything the player at seat 0 of the state has seen.
+
+    Players are identified by their seat relative to the observing player, so the
+    observing player is "0" and is the active player of the round.
+    Cards the player cannot see are shuffled: each other player is dealt as many of
+    them as they hold, and the rest are left in the deck to be drawn by discards still
+    to come. A player that did not follow a trump lead is dealt no trump.
+    Other players are treated as having discarded nothing.
+    """
+    num_players = state.table.num_players
+    played, trumpless = _played(state)
+
+    unknown = [k.card for k in state.cards if isinstance(k.status, Unknown)]
+    discarded = [k.card for k in state.cards if isinstance(k.status, Discarded)]
+    rng.shuffle(unknown)
+
+    # the player was dealt their discards and enough of the cards they have held since
+    held = [*state.hand, *played[0]]
+    kept = HAND_SIZE - len(discarded)
+    hands = [[*discarded, *held[:kept]]]
+    dealt: dict[int, list[Card]] = {}
+    # deal to the players without trump first, so enough other cards are left for them
+    for seat in sorted(range(1, num_players), key=lambda seat: seat not in trumpless):
+        allowed = [
+            card
+            for card in unknown
+            if seat not in trumpless
+            or not card.trump_for_selection(state.bidding.trump)
+        ]
+        dealt[seat] = allowed[: HAND_SIZE - len(played[seat])]
+        unknown = [card for card in unknown if card not in dealt[seat]]
+    for seat in range(1, num_players):
+        hands.append([*dealt[seat], *played[seat]])
+
+    order = [*(card for hand in hands for card in hand), *held[kept:], *unknown]
+    game_round = Round(
+        game_players=[Player(str(seat)) for seat in range(num_players)],
+        dealer_identifier=str(state.table.dealer_seat),
+        seed="determinized",
+        shuffled_deck=Deck(seed="determinized", order=[card.index for card in order]),
+    )
+    _replay(game_round, state, discarded)
+    return game_round
+
+
+def _played(state: GameState) -> tuple[list[list[Card]], set[int]]:
+    """
+    The cards each seat has played, and the seats that have played a card other than
+    trump when trump was led
+    """
+    trump = state.bidding.trump
+    played: list[list[Card]] = [[] for _ in range(state.table.num_players)]
+    trumpless = set[int]()
+    for plays in [
+        *(trick.plays for trick in state.tricks.completed_tricks),
+        state.tricks.current_trick_plays,
+    ]:
+        for play in plays:
+            played[play.seat].append(play.card)
+            if plays[0].card.trump_for_selection(
+                trump
+            ) and not play.card.trump_for_selection(trump):
+                trumpless.add(play.seat)
+    return played, trumpless
+
+
+def _replay(game_round: Round, state: GameState, discarded: list[Card]) -> None:
+    """Take every action the state has seen in the round, in order"""
+    for bid in state.bidding.bid_history:
+        game_round.act(Bid(str(bid.seat), EngineBidAmount(bid.amount)), validate=False)
+    if state.bidding.trump is not None:
+        game_round.act(
+            SelectTrump(str(state.table.bidder_seat), state.bidding.trump),
+            validate=False,
+        )
+    for seat in _discarders(state):
+        game_round.act(
+            Discard(str(seat), discarded if seat == 0 else []), validate=False
+        )
+    for trick in state.tricks.completed_tricks:
+        for play in trick.plays:
+            game_round.act(Play(str(play.seat), play.card), validate=False)
+    for play in state.tricks.current_trick_plays:
+        game_round.act(Play(str(play.seat), play.card), validate=False)
+
+
+def _discarders(state: GameState) -> list[int]:
+    """The seats that have discarded, in the order they discarded"""
+    num_players = state.table.num_players
+    first = (state.table.dealer_seat + 1) % num_players
+    match state.status:
+        case Status.TRICKS:
+            count = num_players
+        case Status.DISCARD:
+            # discarding starts after the dealer and has reached the player
+            count = (0 - first) % num_players
+        case _:
+            count = 0
+    return [(first + offset) % num_players for offset in range(count)]
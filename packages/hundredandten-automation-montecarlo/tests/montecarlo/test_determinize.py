@@ -0,0 +1,127 @@
+"""Test rebuilding the round a player is deciding in"""
+
+from random import Random
+from unittest import TestCase
+
+from hundredandten.automation import naive
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.automation.montecarlo import determinize
+from hundredandten.deck import ALL_CARDS, Deck
+from hundredandten.engine import Discard, Game, Player
+from hundredandten.engine.constants import Status
+from hundredandten.engine.round import Round
+from hundredandten.testing import arrange
+
+SEED = "determinize-seed"
+
+
+def relative(game: Game, seat: int, observer: int) -> int:
+    """The seat relative to the observer"""
+    return (seat - observer) % len(game.players)
+
+
+class TestDeterminize(TestCase):
+    """Unit tests for determinizing a game state"""
+
+    def assert_consistent(self, game: Game, seed: int) -> Round:
+        """A determinization is a legal round matching what the active player saw"""
+        observer = game.active_round.active_seat
+        state = EngineAdapter.state_from_engine(game, str(observer))
+        engine_round = game.active_round
+
+        sampled = determinize(state, Random(seed))
+
+        self.assertEqual(engine_round.status, sampled.status)
+        self.assertEqual(0, sampled.active_seat)
+        self.assertEqual(list(state.hand), sampled.players[0].hand)
+        for player in engine_round.players:
+            seat = relative(
+                game, engine_round.seats.seat_of(player.identifier), observer
+            )
+            self.assertEqual(len(player.hand), len(sampled.players[seat].hand))
+        self.assertEqual(engine_round.active_bid, sampled.active_bid)
+        self.assertEqual(engine_round.trump, sampled.trump)
+        self.assertEqual(
+            [
+                [(relative(game, int(p.identifier), observer), p.card) for p in t.plays]
+                for t in engine_round.tricks
+            ],
+            [[(int(p.identifier), p.card) for p in t.plays] for t in sampled.tricks],
+        )
+        self.assertEqual(
+            [int(d.identifier) for d in sampled.discards],
+            [
+                relative(game, int(d.identifier), observer)
+                for d in engine_round.discards
+            ],
+        )
+        self.assertEqual(list(range(len(ALL_CARDS))), sorted(sampled.deck.cards))
+
+        # the actions are legal when replayed from the same deck
+        replayed = Round(
+            game_players=[Player(p.identifier) for p in sampled.players],
+            dealer_identifier=sampled.dealer.identifier,
+            seed=sampled.seed,
+            shuffled_deck=Deck(seed=sampled.seed, order=list(sampled.deck.cards)),
+        )
+        for action in sampled.actions:
+            replayed.act(action)
+        self.assertEqual(
+            [p.hand for p in sampled.players], [p.hand for p in replayed.players]
+        )
+        return sampled
+
+    def test_statuses(self):
+        """Rounds are rebuilt in every status a player decides in"""
+        for status in (
+            Status.BIDDING,
+            Status.TRUMP_SELECTION,
+            Status.DISCARD,
+            Status.TRICKS,
+        ):
+            self.assert_consistent(arrange.game(status, seed=SEED), 0)
+
+    def test_naive_games(self):
+        """Rounds are rebuilt at every decision of naive games"""
+        for num_players in (2, 3, 4):
+            game = Game(
+                players=[Player(str(seat)) for seat in range(num_players)],
+                seed=f"{SEED}-{num_players}",
+            )
+            decision = 0
+            while game.status != Status.WON:
+                self.assert_consistent(game, decision)
+                decision += 1
+                identifier = game.active_player.identifier
+                game.act(EngineAdapter.action_for(game, identifier, naive.action_for))
+
+    def test_hidden_cards_shuffled(self):
+        """Different seeds deal the hidden cards differently"""
+        game = arrange.game(Status.TRICKS, seed=SEED)
+
+        hands = {
+            tuple(self.assert_consistent(game, seed).players[1].hand)
+            for seed in range(5)
+        }
+
+        self.assertEqual(5, len(hands))
+
+    def test_own_discards(self):
+        """The player's discards are dealt to them, and the cards drawn are next"""
+        game = arrange.game(Status.DISCARD, seed=SEED)
+        while game.status == Status.DISCARD:
+            player = game.active_round.active_player
+            game.act(Discard(player.identifier, player.hand[:2]))
+        observer = game.active_round.active_player.identifier
+        discard = next(
+            d for d in game.active_round.discards if d.identifier == observer
+        )
+
+        sampled = self.assert_consistent(game, 0)
+
+        own = next(d for d in sampled.discards if d.identifier == "0")
+        self.assertEqual(set(discard.cards), set(own.cards))
+        self.assertEqual([[]] * 3, [d.cards for d in sampled.discards if d is not own])
+        deck = [ALL_CARDS[index] for index in sampled.deck.cards]
+        self.assertTrue(set(own.cards) <= set(deck[:5]))
+        self.assertTrue(set(deck[20:22]) <= set(sampled.players[0].hand))
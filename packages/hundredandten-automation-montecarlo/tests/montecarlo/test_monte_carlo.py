@@ -0,0 +1,159 @@
+"""Test choosing actions by playing out determinized rounds"""
+
+from random import Random
+from unittest import TestCase
+
+from hundredandten.automation import montecarlo
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.automation.montecarlo import (
+    AutomationError,
+    Budget,
+    MonteCarloPlayer,
+    evaluate,
+    play_out,
+    rollout_action,
+)
+from hundredandten.engine import Game, Player
+from hundredandten.engine.constants import Status
+from hundredandten.engine.round import Round
+from hundredandten.state import GameState
+from hundredandten.testing import arrange
+
+SEED = "monte-carlo-seed"
+COMPLETED = (Status.COMPLETED, Status.COMPLETED_NO_BIDDERS)
+DECIDING = [Status.BIDDING, Status.TRUMP_SELECTION, Status.DISCARD, Status.TRICKS]
+
+
+def state_of(game: Game) -> GameState:
+    """The state of the game for its active player"""
+    return EngineAdapter.state_from_engine(game, game.active_player.identifier)
+
+
+class TestMonteCarlo(TestCase):
+    """Unit tests for the Monte Carlo player"""
+
+    def test_rollout_action(self):
+        """Rollout actions are legal in every status, until rounds complete"""
+        for num_players in (2, 3, 4):
+            for seed in range(20):
+                game_round = Round(
+                    game_players=[Player(str(p)) for p in range(num_players)],
+                    dealer_identifier="0",
+                    seed=f"{SEED}-{seed}",
+                )
+                rng = Random(seed)
+                while game_round.status not in COMPLETED:
+                    game_round.act(rollout_action(game_round, rng))
+
+    def test_play_out(self):
+        """Each seat's outcome is relative to the others, so the outcomes cancel out"""
+        for num_players in (2, 3, 4):
+            game_round = Round(
+                game_players=[Player(str(p)) for p in range(num_players)],
+                dealer_identifier="0",
+                seed=SEED,
+            )
+
+            outcomes = play_out(game_round, Random(num_players))
+
+            self.assertIn(game_round.status, COMPLETED)
+            self.assertEqual(num_players, len(outcomes))
+            self.assertAlmostEqual(0, sum(outcomes))
+
+    def test_evaluate(self):
+        """Each available action is totalled over the same determinizations"""
+        state = state_of(arrange.game(Status.BIDDING, seed=SEED))
+
+        totals = evaluate(state, [1, 2, 3])
+
+        self.assertEqual(len(state.available_actions), len(totals))
+        self.assertEqual(totals, evaluate(state, [1, 2, 3]))
+        self.assertNotEqual(totals, evaluate(state, [4, 5, 6]))
+
+    def test_statuses(self):
+        """An available action is chosen in every status a player decides in"""
+        player = MonteCarloPlayer(Budget(rollouts=4, batch=2), seed=0)
+        for status in DECIDING:
+            state = state_of(arrange.game(status, seed=SEED))
+            self.assertIn(player.action_for(state), state.available_actions)
+
+    def test_best_average(self):
+        """The action with the best total outcome is chosen"""
+        state = state_of(arrange.game(Status.TRUMP_SELECTION, seed=SEED))
+        # the player seeds its first rollout from the top bits of its generator
+        first = Random(5).getrandbits(32) << 32
+        totals = evaluate(state, range(first, first + 40))
+
+        action = MonteCarloPlayer(Budget(rollouts=40, batch=8), seed=5).action_for(
+            state
+        )
+
+        self.assertEqual(len(set(totals)), len(totals))
+        self.assertEqual(
+            max(range(len(totals)), key=totals.__getitem__),
+            list(state.available_actions).index(action),
+        )
+
+    def test_only_action(self):
+        """With one available action, it is chosen without rollouts"""
+        game = arrange.game(Status.TRICKS, seed=SEED)
+        for _ in range(4):
+            arrange.play_trick(game)
+        state = state_of(game)
+
+        player = MonteCarloPlayer(Budget(rollouts=0))
+
+        self.assertEqual(state.available_actions[0], player.action_for(state))
+
+    def test_no_actions(self):
+        """A player that cannot act cannot choose an action"""
+        game = arrange.game(Status.WON, seed=SEED)
+        state = EngineAdapter.state_from_engine(game, game.players[0].identifier)
+
+        self.assertRaises(AutomationError, MonteCarloPlayer().action_for, state)
+
+    def test_workers(self):
+        """The same seed makes the same decisions however many workers play"""
+        states = [
+            state_of(arrange.game(status, seed=SEED))
+            for status in (Status.BIDDING, Status.DISCARD, Status.TRICKS)
+        ]
+
+        decisions = []
+        for workers in (1, 2):
+            with MonteCarloPlayer(
+                Budget(rollouts=9, batch=2), workers=workers, seed=7
+            ) as player:
+                decisions.append([player.action_for(state) for state in states])
+
+        self.assertEqual(decisions[0], decisions[1])
+
+    def test_time_budget(self):
+        """With a time budget, rollouts are played until it is spent"""
+        state = state_of(arrange.game(Status.TRUMP_SELECTION, seed=SEED))
+
+        player = MonteCarloPlayer(Budget(rollouts=None, seconds=0.0, batch=3))
+        self.assertIn(player.action_for(state), state.available_actions)
+
+        player = MonteCarloPlayer(Budget(rollouts=2, seconds=60.0))
+        self.assertIn(player.action_for(state), state.available_actions)
+        player.close()
+
+    def test_unbounded_budget(self):
+        """A budget needs a number of rollouts or a time limit"""
+        self.assertRaises(ValueError, Budget, rollouts=None)
+        self.assertEqual(None, Budget(rollouts=None, seconds=1.0).rollouts)
+
+    def test_empty_batch(self):
+        """Rollouts are played in batches of at least one"""
+        self.assertRaises(ValueError, Budget, batch=0)
+        self.assertRaises(ValueError, Budget, batch=-1)
+        self.assertEqual(1, Budget(batch=1).batch)
+
+    def test_action_for(self):
+        """The default player chooses available actions through a whole game"""
+        game = Game(players=[Player(str(seat)) for seat in range(2)], seed=SEED)
+
+        for _ in range(20):
+            identifier = game.active_player.identifier
+            game.act(EngineAdapter.action_for(game, identifier, montecarlo.action_for))
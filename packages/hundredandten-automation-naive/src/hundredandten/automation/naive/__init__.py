@@ -182,7 +182,7 @@ def __cards_beating(
 
 def __non_trumps(cards: Sequence[Card], trump: SelectableSuit | None) -> Sequence[Card]:
     """Return all non trump cards in the list"""
-    return [card for card in cards if card.suit != trump and not card.always_trump]
+    return [card for card in cards if not card.trump_for_selection(trump)]
 
 
 def __bid_value(cards: Sequence[Card]) -> int:
@@ -213,6 +213,6 @@ def __cards_by_suit(cards: Sequence[Card]) -> dict[SelectableSuit, list[Card]]:
     Cards that are always trump will appear in all lists
     """
     return {
-        suit: [card for card in cards if card.suit == suit or card.always_trump]
+        suit: [card for card in cards if card.trump_for_selection(suit)]
         for suit in list(SelectableSuit)
     }
@@ -0,0 +1,9 @@
+"""Performance benchmarks for Hundred and Ten packages"""
+
+from timeit import Timer
+from typing import Callable
+
+
+def seconds_per_call(fn: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """The fastest time of several runs of the function, per call"""
+    return min(Timer(fn).repeat(repeat=repeat, number=number)) / number
@@ -0,0 +1,86 @@
+"""
+Compare rounds dealt and played with random legal actions by Round and by RoundBatch
+Run with: uv run python -m hundredandten.benchmark.batch
+"""
+
+import time
+from random import Random
+
+import numpy as np
+from hundredandten.deck import Deck, SelectableSuit
+from hundredandten.deck.batch import permutations
+from hundredandten.engine import Player
+from hundredandten.engine.actions import Action, Bid, Discard, Play, SelectTrump
+from hundredandten.engine.batch import RoundBatch
+from hundredandten.engine.constants import Status
+from hundredandten.engine.round import Round
+
+SEED = "batch-benchmark"
+PLAYERS = 4
+ROUNDS = 1_000
+BATCH = 50_000
+COMPLETED = (Status.COMPLETED, Status.COMPLETED_NO_BIDDERS)
+
+
+def seeds(count: int) -> list[str]:
+    """The deck seed of each benchmarked round"""
+    return [f"{SEED}-{i}" for i in range(count)]
+
+
+def random_action(game_round: Round, rng: Random) -> Action:
+    """A legal action for the active player of the round, chosen at random"""
+    player = game_round.active_player
+    identifier = player.identifier
+    match game_round.status:
+        case Status.BIDDING:
+            return Bid(identifier, rng.choice(game_round.available_bids(identifier)))
+        case Status.TRUMP_SELECTION:
+            return SelectTrump(identifier, rng.choice(list(SelectableSuit)))
+        case Status.DISCARD:
+            return Discard(identifier, [c for c in player.hand if rng.random() < 0.5])
+        case _:
+            trumps = player.hand_set.trumps(game_round.trump)
+            bleeding = game_round.active_trick.bleeding and trumps
+            return Play(
+                identifier, rng.choice(list(trumps) if bleeding else player.hand)
+            )
+
+
+def engine_rounds_per_second(count: int = ROUNDS) -> float:
+    """Rounds per second dealt and played to completion one at a time by Round"""
+    players = [Player(str(seat)) for seat in range(PLAYERS)]
+    rng = Random(SEED)
+    start = time.perf_counter()
+    for seed in seeds(count):
+        game_round = Round(
+            game_players=players,
+            dealer_identifier=players[0].identifier,
+            seed=seed,
+            shuffled_deck=Deck(seed),
+        )
+        while game_round.status not in COMPLETED:
+            game_round.act(random_action(game_round, rng))
+    return count / (time.perf_counter() - start)
+
+
+def batch_rounds_per_second(count: int = BATCH) -> float:
+    """Rounds per second dealt and played to completion together by RoundBatch"""
+    start = time.perf_counter()
+    batch = RoundBatch(
+        permutations(seeds(count)), np.zeros(count, dtype=np.int8), PLAYERS
+    )
+    batch.play_random(np.random.default_rng(0))
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Print the rounds per second of each engine"""
+    engine = engine_rounds_per_second()
+    batch = batch_rounds_per_second()
+    print(f"{'engine':<12} {'rounds/s':>10}")
+    print(f"{'Round':<12} {engine:>10.0f}")
+    print(f"{'RoundBatch':<12} {batch:>10.0f}   {batch / engine:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
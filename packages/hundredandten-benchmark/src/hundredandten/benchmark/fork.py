@@ -0,0 +1,45 @@
+"""
+Compare Game.fork against copy.deepcopy for search-style copying
+Run with: uv run python -m hundredandten.benchmark.fork
+"""
+
+from copy import deepcopy
+
+from hundredandten.engine import Game, Status
+from hundredandten.testing import arrange
+
+from . import seconds_per_call
+
+SEED = "fork-benchmark"
+STATUSES = [Status.BIDDING, Status.DISCARD, Status.TRICKS, Status.WON]
+
+
+def scenario(status: Status) -> Game:
+    """A seeded game in the provided status"""
+    return arrange.game(status, seed=SEED)
+
+
+def compare(game: Game, number: int = 2_000) -> tuple[float, float]:
+    """Seconds per copy with fork and with deepcopy"""
+    return (
+        seconds_per_call(game.fork, number),
+        seconds_per_call(lambda: deepcopy(game), number),
+    )
+
+
+def main() -> None:
+    """Print the time per copy of a game in each benchmarked status"""
+    print(
+        f"{'status':<12} {'rounds':>6} {'fork µs':>9} {'deepcopy µs':>12} {'speedup':>8}"
+    )
+    for status in STATUSES:
+        game = scenario(status)
+        fork, copied = compare(game)
+        print(
+            f"{status.name:<12} {len(game.rounds):>6} {fork * 1e6:>9.1f} "
+            f"{copied * 1e6:>12.1f} {copied / fork:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
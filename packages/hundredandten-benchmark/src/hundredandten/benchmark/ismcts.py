@@ -0,0 +1,66 @@
+"""
+Measure the speed and memory of the ISMCTS search in seeded scenarios
+Run with: uv run python -m hundredandten.benchmark.ismcts
+"""
+
+import gc
+import time
+import tracemalloc
+
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.automation.ismcts import Budget, ISMCTSPlayer
+from hundredandten.engine import Status
+from hundredandten.state import GameState
+from hundredandten.testing import arrange
+
+SEED = "ismcts-benchmark"
+ITERATIONS = 2_000
+STATUSES = [Status.BIDDING, Status.TRUMP_SELECTION, Status.DISCARD, Status.TRICKS]
+
+
+def scenario(status: Status) -> GameState:
+    """The state of the active player of a seeded game in the provided status"""
+    game = arrange.game(status, seed=SEED)
+    state = EngineAdapter.state_from_engine(game, game.active_player.identifier)
+    # the state caches its available actions, so list them before measuring
+    _ = state.available_actions
+    return state
+
+
+def speed(state: GameState) -> tuple[float, float]:
+    """The iterations and the nodes added per second of searching from the state"""
+    player = ISMCTSPlayer(Budget(iterations=ITERATIONS), seed=0)
+    start = time.perf_counter()
+    player.action_for(state)
+    elapsed = time.perf_counter() - start
+    return ITERATIONS / elapsed, player.nodes / elapsed
+
+
+def bytes_per_node(state: GameState) -> float:
+    """The memory held by the tree after searching from the state, per node"""
+    gc.collect()
+    tracemalloc.start()
+    player = ISMCTSPlayer(Budget(iterations=ITERATIONS), seed=0)
+    before, _ = tracemalloc.get_traced_memory()
+    player.action_for(state)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (retained - before) / player.nodes
+
+
+def main() -> None:
+    """Print the iterations and nodes per second and the bytes per node"""
+    print(f"{ITERATIONS} iterations of a 4 player game")
+    print(f"{'status':<16} {'iterations/s':>12} {'nodes/s':>10} {'bytes/node':>10}")
+    for status in STATUSES:
+        state = scenario(status)
+        iterations, nodes = speed(state)
+        print(
+            f"{status.name:<16} {iterations:>12.0f} {nodes:>10.0f} "
+            f"{bytes_per_node(state):>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
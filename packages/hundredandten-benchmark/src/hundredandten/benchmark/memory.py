@@ -0,0 +1,128 @@
+"""
+Measure the memory held by GameState observations, as kept in a replay buffer
+Run with: uv run python -m hundredandten.benchmark.memory
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Callable, Optional
+
+from hundredandten.automation import naive
+from hundredandten.automation.engineadapter import EngineAdapter, PlayerObserver
+from hundredandten.deck import ALL_CARDS, SelectableSuit
+from hundredandten.engine import Game, Player, Status
+from hundredandten.engine.actions import Action
+from hundredandten.state import (
+    AvailableBid,
+    AvailablePlay,
+    AvailableSelectTrump,
+    BidAmount,
+    BidEvent,
+    CardKnowledge,
+    GameState,
+    Played,
+    TrickPlay,
+)
+
+SEED = "memory-benchmark"
+PLAYERS = 4
+MAX_ROUNDS = 20
+
+type Observe = Callable[[Game, str], GameState]
+# each replay observes a new game, so is given a new way to observe it
+type ObserveFactory = Callable[[], Observe]
+
+
+def new_game() -> Game:
+    """The seeded game every measurement plays"""
+    return Game(players=[Player(str(i)) for i in range(PLAYERS)], seed=SEED)
+
+
+def naive_actions() -> list[Action]:
+    """The actions of the seeded game played by naive players"""
+    game = new_game()
+    while game.status != Status.WON and len(game.rounds) <= MAX_ROUNDS:
+        identifier = game.active_player.identifier
+        game.act(EngineAdapter.action_for(game, identifier, naive.action_for))
+    return game.actions
+
+
+def stateless(game: Game, identifier: str) -> GameState:
+    """Observe the game from scratch"""
+    return EngineAdapter.state_from_engine(game, identifier)
+
+
+def observers() -> Observe:
+    """Observe the game with a PlayerObserver for each player"""
+    following: dict[str, PlayerObserver] = {}
+
+    def observe(game: Game, identifier: str) -> GameState:
+        if identifier not in following:
+            following[identifier] = PlayerObserver(game, identifier)
+        return following[identifier].observe()
+
+    return observe
+
+
+def retained_bytes(actions: list[Action], observe: Optional[Observe]) -> int:
+    """The memory still held after replaying the actions and keeping every observation"""
+    gc.collect()
+    tracemalloc.start()
+    game = new_game()
+    kept = []
+    for action in actions:
+        if observe:
+            kept.append(observe(game, game.active_player.identifier))
+        game.act(action)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained
+
+
+def bytes_per_state(actions: list[Action], factory: ObserveFactory) -> float:
+    """The memory held by each kept observation, beyond the game itself"""
+    # populate any shared instances before measuring
+    retained_bytes(actions, factory())
+    return (retained_bytes(actions, factory()) - retained_bytes(actions, None)) / len(
+        actions
+    )
+
+
+def instance_bytes(instance: object) -> int:
+    """The size of the instance and of its attribute dictionary, if it has one"""
+    attributes = getattr(instance, "__dict__", None)
+    return sys.getsizeof(instance) + (
+        sys.getsizeof(attributes) if attributes is not None else 0
+    )
+
+
+def main() -> None:
+    """Print the bytes held per GameState and per instance of its parts"""
+    actions = naive_actions()
+    print(f"{len(actions)} observations of a {PLAYERS} player game")
+    print(f"{'observed with':<16} {'bytes per GameState':>20}")
+    for name, factory in (
+        ("state_from_engine", lambda: stateless),
+        ("PlayerObserver", observers),
+    ):
+        per_state = bytes_per_state(actions, factory)
+        print(f"{name:<16} {per_state:>20.0f}")
+
+    card = ALL_CARDS[0]
+    print()
+    print(f"{'instance':<24} {'bytes':>6}")
+    for instance in (
+        CardKnowledge(card, Played(trick_index=0, seat=0)),
+        Played(trick_index=0, seat=0),
+        TrickPlay(seat=0, card=card),
+        BidEvent(seat=0, amount=BidAmount.FIFTEEN),
+        AvailableBid(BidAmount.FIFTEEN),
+        AvailableSelectTrump(SelectableSuit.HEARTS),
+        AvailablePlay(card),
+    ):
+        print(f"{type(instance).__name__:<24} {instance_bytes(instance):>6}")
+
+
+if __name__ == "__main__":
+    main()
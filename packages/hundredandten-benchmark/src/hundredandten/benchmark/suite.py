@@ -0,0 +1,224 @@
+"""
+Time the hot paths of the engine, state, adapter and automation packages in seeded
+scenarios
+Run with: uv run python -m hundredandten.benchmark.suite
+
+Results are written as JSON. When a baseline written by an earlier run is provided,
+exits with status 1 if any benchmark is slower than it by more than the threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from dataclasses import replace
+from itertools import cycle
+from typing import Callable, Optional
+
+from hundredandten.automation import naive
+from hundredandten.automation.engineadapter import EngineAdapter
+from hundredandten.automation.engineadapter.tournament import play_game
+from hundredandten.automation.ismcts import Budget, ISMCTSPlayer
+from hundredandten.engine import Game, Status
+from hundredandten.engine.trick import Trick
+from hundredandten.testing import arrange
+
+from . import seconds_per_call
+
+SEED = "suite-benchmark"
+GAMES = 5
+ISMCTS_ITERATIONS = 100
+THRESHOLD = 0.2
+# the statuses in which a player acts, and the Round.act benchmark of each
+PHASES = {
+    Status.BIDDING: "bid",
+    Status.TRUMP_SELECTION: "select_trump",
+    Status.DISCARD: "discard",
+    Status.TRICKS: "play",
+}
+
+# a benchmark returns the function it times, and how many calls to time at once
+type Benchmark = Callable[[], tuple[Callable[[], object], int]]
+
+
+def scenario(status: Status) -> Game:
+    """A seeded game in the provided status"""
+    return arrange.game(status, seed=SEED)
+
+
+def naive_games() -> tuple[Callable[[], object], int]:
+    """Play whole games with four naive players, cycling through the same games"""
+    decision_fns = [naive.action_for] * 4
+    indices = cycle(range(GAMES))
+    return lambda: play_game(decision_fns, SEED, next(indices)), GAMES
+
+
+def round_act(status: Status) -> Benchmark:
+    """Act in the round with the naive action of its active player, then undo it"""
+
+    def benchmark() -> tuple[Callable[[], object], int]:
+        game = scenario(status)
+        game_round = game.active_round
+        action = EngineAdapter.action_for(
+            game, game.active_player.identifier, naive.action_for
+        )
+
+        def act() -> None:
+            game_round.apply(action)
+            game_round.undo()
+
+        return act, 5_000
+
+    return benchmark
+
+
+def winning_play() -> tuple[Callable[[], object], int]:
+    """Find the winner of a completed trick"""
+    game = scenario(Status.TRICKS)
+    arrange.play_trick(game)
+    trick: Trick = game.active_round.tricks[0]
+    return lambda: trick.winning_play, 20_000
+
+
+def state_from_engine(status: Status) -> Benchmark:
+    """Observe the game for its active player"""
+
+    def benchmark() -> tuple[Callable[[], object], int]:
+        game = scenario(status)
+        identifier = game.active_player.identifier
+        return lambda: EngineAdapter.state_from_engine(game, identifier), 1_000
+
+    return benchmark
+
+
+def available_actions(status: Status) -> Benchmark:
+    """
+    List the actions available to the active player.
+    Each call copies the state first, so the cached actions are computed again
+    """
+
+    def benchmark() -> tuple[Callable[[], object], int]:
+        game = scenario(status)
+        state = EngineAdapter.state_from_engine(game, game.active_player.identifier)
+        return lambda: replace(state).available_actions, 5_000
+
+    return benchmark
+
+
+def naive_action(status: Status) -> Benchmark:
+    """
+    Decide the naive action of the active player.
+    Each call copies the state first, so the cached actions are computed again
+    """
+
+    def benchmark() -> tuple[Callable[[], object], int]:
+        game = scenario(status)
+        state = EngineAdapter.state_from_engine(game, game.active_player.identifier)
+        return lambda: naive.action_for(replace(state)), 2_000
+
+    return benchmark
+
+
+def ismcts_action(status: Status) -> Benchmark:
+    """
+    Search for the ISMCTS action of the active player.
+    Each call starts a new player, so the search does not reuse an earlier tree
+    """
+
+    def benchmark() -> tuple[Callable[[], object], int]:
+        game = scenario(status)
+        state = EngineAdapter.state_from_engine(game, game.active_player.identifier)
+        budget = Budget(iterations=ISMCTS_ITERATIONS)
+        return lambda: ISMCTSPlayer(budget, seed=0).action_for(state), 5
+
+    return benchmark
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "game.naive": naive_games,
+    **{f"round.act.{name}": round_act(status) for status, name in PHASES.items()},
+    "trick.winning_play": winning_play,
+    **{
+        f"state_from_engine.{status.name.lower()}": state_from_engine(status)
+        for status in PHASES
+    },
+    **{
+        f"available_actions.{status.name.lower()}": available_actions(status)
+        for status in PHASES
+    },
+    **{
+        f"naive.action_for.{status.name.lower()}": naive_action(status)
+        for status in PHASES
+    },
+    **{
+        f"ismcts.action_for.{status.name.lower()}": ismcts_action(status)
+        for status in PHASES
+    },
+}
+
+
+def run(names: Optional[list[str]] = None) -> dict:
+    """The seconds per call of each named benchmark, or of all of them"""
+    results = {}
+    for name in names or BENCHMARKS:
+        fn, number = BENCHMARKS[name]()
+        seconds = seconds_per_call(fn, number)
+        results[name] = {"seconds": seconds, "per_second": 1 / seconds}
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def regressions(report: dict, baseline: dict, threshold: float) -> dict[str, float]:
+    """
+    The ratio of the current to the baseline time of every benchmark in both reports
+    that is slower than the baseline by more than the threshold
+    """
+    ratios = {
+        name: result["seconds"] / baseline["results"][name]["seconds"]
+        for name, result in report["results"].items()
+        if name in baseline["results"]
+    }
+    return {name: ratio for name, ratio in ratios.items() if ratio > 1 + threshold}
+
+
+def main() -> None:
+    """Run the benchmarks, write their JSON report and compare it to a baseline"""
+    parser = argparse.ArgumentParser(
+        description="Time the hot paths of the Hundred and Ten packages"
+    )
+    parser.add_argument("names", nargs="*", help="the benchmarks to run (all)")
+    parser.add_argument("-o", "--output", help="write the report to this file")
+    parser.add_argument("-b", "--baseline", help="compare to the report in this file")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"the fraction slower than the baseline to fail at ({THRESHOLD})",
+    )
+    args = parser.parse_args()
+    if unknown := set(args.names) - set(BENCHMARKS):
+        parser.error(f"unknown benchmarks {sorted(unknown)}, from {list(BENCHMARKS)}")
+
+    report = run(args.names)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            slower = regressions(report, json.load(file), args.threshold)
+        for name, ratio in slower.items():
+            print(f"{name} is {ratio:.2f}x the baseline time", file=sys.stderr)
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 """Card domain primitives for Hundred and Ten"""
 
-from dataclasses import dataclass, field
+import hashlib
+from collections.abc import Iterable, Iterator
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
 from random import Random
+from typing import Optional
 from uuid import uuid4
 
+# compact suit ids, shared by CardSuit and SelectableSuit members with the same value
+# the order matches the suit order of ALL_CARDS
+_SUIT_INDEX = {"HEARTS": 0, "DIAMONDS": 1, "SPADES": 2, "CLUBS": 3, "JOKER": 4}
+
 
 class _Suit(Enum):
     """
@@ -13,6 +20,10 @@ class _Suit(Enum):
     it is load-bearing for trump comparison throughout the game engine.
     """
 
+    def __init__(self, value: str) -> None:
+        # a plain int to compare suits without going through __eq__
+        self.index = _SUIT_INDEX[value]
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Enum):
             return self.value == other.value
@@ -143,42 +154,182 @@ _CARD_INFO = {
 }
 
 
+_CARD_INDEX = {
+    (suit, number): index
+    for index, (suit, number) in enumerate(
+        (suit, number)
+        for (suit, number_dict) in _CARD_INFO.items()
+        for number in number_dict
+    )
+}
+
+
 @dataclass(frozen=True)
 class Card:
     """A playing card"""
 
-    number: CardNumber
-    suit: CardSuit
+    number: CardNumber = field(compare=False)
+    suit: CardSuit = field(compare=False)
+    # position of the card in ALL_CARDS; equality and hashing only consider this
+    index: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        index = _CARD_INDEX.get((self.suit, self.number))
+        if index is None:
+            raise ValueError(
+                f"{self.number.name} of {self.suit.name} is not a valid card"
+            )
+        object.__setattr__(self, "index", index)
 
     def __repr__(self) -> str:
         return f"{self.number.name} of {self.suit.name}"
 
     def trump_for_selection(self, trump: SelectableSuit | None) -> bool:
         """Return true if the card is a trump under the provided trump suit"""
-        return self.suit == trump or self.always_trump
+        return ALWAYS_TRUMP[self.index] or (
+            trump is not None and SUIT_INDICES[self.index] == trump.index
+        )
 
     @property
     def trump_value(self) -> int:
         """The value of this card as a trump"""
-        return _CARD_INFO[self.suit][self.number].trump_value
+        return TRUMP_VALUES[self.index]
 
     @property
     def weak_trump_value(self) -> int:
         """The value of this card in a suit with no trumps where its suit leads"""
-        return _CARD_INFO[self.suit][self.number].weak_trump_value
+        return WEAK_TRUMP_VALUES[self.index]
 
     @property
     def always_trump(self) -> bool:
         """Whether the card is always considered trump"""
-        return _CARD_INFO[self.suit][self.number].always_trump
+        return ALWAYS_TRUMP[self.index]
 
 
 ALL_CARDS: tuple[Card, ...] = tuple(
-    Card(number, suit)
-    for (suit, number_dict) in _CARD_INFO.items()
-    for number in number_dict
+    Card(number, suit) for (suit, number) in _CARD_INDEX
+)
+
+# Flat per-card tables indexed by Card.index.
+# Suits are indexed by CardSuit.index / SelectableSuit.index.
+
+SUIT_INDICES: tuple[int, ...] = tuple(card.suit.index for card in ALL_CARDS)
+
+TRUMP_VALUES: tuple[int, ...] = tuple(
+    _CARD_INFO[card.suit][card.number].trump_value for card in ALL_CARDS
 )
 
+WEAK_TRUMP_VALUES: tuple[int, ...] = tuple(
+    _CARD_INFO[card.suit][card.number].weak_trump_value for card in ALL_CARDS
+)
+
+ALWAYS_TRUMP: tuple[bool, ...] = tuple(
+    _CARD_INFO[card.suit][card.number].always_trump for card in ALL_CARDS
+)
+
+# value of each card as a trump under each selectable suit, -1 when it is not a trump
+TRUMP_VALUES_BY_SELECTION: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        (TRUMP_VALUES[card.index] if card.trump_for_selection(suit) else -1)
+        for card in ALL_CARDS
+    )
+    for suit in sorted(SelectableSuit, key=lambda suit: suit.index)
+)
+
+# rank of each card in a trick under each selectable suit, led with each card suit,
+# where the highest rank wins: any trump outranks every other card, then cards of
+# the led suit rank by weak trump value, and any other card is -1
+TRICK_RANKS: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(
+            (
+                100 + values[card]
+                if values[card] >= 0
+                else WEAK_TRUMP_VALUES[card] if SUIT_INDICES[card] == led else -1
+            )
+            for card in range(len(ALL_CARDS))
+        )
+        for led in range(len(CardSuit))
+    )
+    for values in TRUMP_VALUES_BY_SELECTION
+)
+
+
+# Bitmasks over Card.index for use with CardSet.
+
+ALL_CARDS_MASK = (1 << len(ALL_CARDS)) - 1
+
+ALWAYS_TRUMP_MASK = sum(1 << card.index for card in ALL_CARDS if card.always_trump)
+
+# cards of each suit, indexed by CardSuit.index
+SUIT_MASKS: tuple[int, ...] = tuple(
+    sum(1 << card.index for card in ALL_CARDS if card.suit.index == suit.index)
+    for suit in sorted(CardSuit, key=lambda suit: suit.index)
+)
+
+# cards that are trump under each selectable suit, indexed by SelectableSuit.index
+TRUMP_MASKS: tuple[int, ...] = tuple(
+    SUIT_MASKS[suit.index] | ALWAYS_TRUMP_MASK
+    for suit in sorted(SelectableSuit, key=lambda suit: suit.index)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CardSet:
+    """
+    An immutable set of cards stored as a bitmask over Card.index.
+    Iteration yields cards in ALL_CARDS order.
+    """
+
+    mask: int = 0
+
+    @classmethod
+    def of(cls, cards: Iterable[Card]) -> "CardSet":
+        """Build the set holding the provided cards"""
+        mask = 0
+        for card in cards:
+            mask |= 1 << card.index
+        return cls(mask)
+
+    def __contains__(self, card: object) -> bool:
+        return isinstance(card, Card) and bool(self.mask >> card.index & 1)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __iter__(self) -> Iterator[Card]:
+        mask = self.mask
+        while mask:
+            lowest = mask & -mask
+            yield ALL_CARDS[lowest.bit_length() - 1]
+            mask ^= lowest
+
+    def __or__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask | other.mask)
+
+    def __and__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask & other.mask)
+
+    def __sub__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask & ~other.mask)
+
+    def __le__(self, other: "CardSet") -> bool:
+        return not self.mask & ~other.mask
+
+    def __repr__(self) -> str:
+        return f"CardSet({list(self)})"
+
+    def of_suit(self, suit: CardSuit | SelectableSuit) -> "CardSet":
+        """The cards in this set of the provided suit"""
+        return CardSet(self.mask & SUIT_MASKS[suit.index])
+
+    def trumps(self, trump: SelectableSuit | None) -> "CardSet":
+        """The cards in this set that are trump under the provided trump suit"""
+        return CardSet(
+            self.mask
+            & (ALWAYS_TRUMP_MASK if trump is None else TRUMP_MASKS[trump.index])
+        )
+
 
 @dataclass
 class Deck:
@@ -187,10 +338,13 @@ class Deck:
     seed: str = field(default_factory=lambda: str(uuid4()))
     pulled: int = 0
     cards: list[int] = field(init=False)
+    # the shuffled order for this seed, when it is already known
+    order: InitVar[Optional[list[int]]] = None
 
-    def __post_init__(self):
-        self.cards = [*range(len(ALL_CARDS))]
-        Random(self.seed).shuffle(self.cards)
+    def __post_init__(self, order: Optional[list[int]]):
+        self.cards = (
+            order if order is not None else _shuffled_indices(Random(self.seed))
+        )
 
     def draw(self, amount: int) -> list[Card]:
         """Draw the specified amount of cards from the deck"""
@@ -203,3 +357,82 @@ class Deck:
 
         self.pulled = end
         return [ALL_CARDS[num] for num in self.cards[start:end]]
+
+
+def round_seed(game_seed: str, round_index: int) -> str:
+    """The deck seed for the identified round of the game with the provided seed"""
+    return _round_seed(Random(_round_key(game_seed, round_index)))
+
+
+def round_deck(game_seed: str, round_index: int) -> Deck:
+    """The deck for the identified round of the game with the provided seed"""
+    return _round_deck(Random(_round_key(game_seed, round_index)))
+
+
+def round_decks(game_seed: str, count: int, start: int = 0) -> list[Deck]:
+    """
+    The decks for count rounds of the game with the provided seed,
+    beginning with the round at index start.
+    One generator is reseeded for every round rather than building new ones.
+    """
+    rng: Optional[Random] = None
+    decks: list[Deck] = []
+    for round_index in range(start, start + count):
+        key = _round_key(game_seed, round_index)
+        if rng is None:
+            rng = Random(key)
+        else:
+            rng.seed(key)
+        decks.append(_round_deck(rng))
+    return decks
+
+
+def _round_key(game_seed: str, round_index: int) -> str:
+    """The digest seeding the generator that derives a round's deck seed"""
+    return hashlib.sha256(
+        f"deck-seed|{game_seed}|round:{round_index}".encode()
+    ).hexdigest()
+
+
+def _round_deck(rng: Random) -> Deck:
+    """Build a round's deck from a generator seeded with the round key"""
+    seed = _round_seed(rng)
+    rng.seed(seed)
+    return Deck(seed=seed, order=_shuffled_indices(rng))
+
+
+def _round_seed(rng: Random) -> str:
+    """
+    Derive a round's deck seed from a generator seeded with the round key.
+    The result is the string of a version 4 UUID built from 128 random bits.
+    """
+    bits = rng.getrandbits(128)
+    # set the variant and version fields the same way uuid.UUID(version=4) does
+    bits = (bits & ~(0xC000 << 48)) | (0x8000 << 48)
+    bits = (bits & ~(0xF000 << 64)) | (4 << 76)
+    digits = f"{bits:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+# bits drawn for each swap index in Random.shuffle, indexed by position
+_SHUFFLE_BITS = tuple((i + 1).bit_length() for i in range(len(ALL_CARDS)))
+
+
+def _shuffled_indices(rng: Random) -> list[int]:
+    """
+    Card indices shuffled exactly as rng.shuffle would shuffle them,
+    inlining Random._randbelow to skip a method call per swap
+    """
+    # this depends on a private detail of CPython: shuffle draws each swap index
+    # with Random._randbelow, as getrandbits of the index's bit length until the
+    # draw is in range. If that changes, so does every seeded deal, which
+    # test_shuffled_indices_match_random_shuffle checks against rng.shuffle
+    cards = list(range(len(ALL_CARDS)))
+    getrandbits = rng.getrandbits
+    for i in range(len(cards) - 1, 0, -1):
+        bits = _SHUFFLE_BITS[i]
+        j = getrandbits(bits)
+        while j > i:
+            j = getrandbits(bits)
+        cards[i], cards[j] = cards[j], cards[i]
+    return cards
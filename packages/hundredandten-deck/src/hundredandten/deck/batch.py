@@ -0,0 +1,53 @@
+"""
+Batch deck generation backed by NumPy.
+Requires the numpy extra: pip install hundredandten-deck[numpy]
+"""
+
+from collections.abc import Sequence
+from random import Random
+
+import numpy as np
+from numpy.typing import NDArray
+
+from . import ALL_CARDS, _shuffled_indices, round_decks
+
+HAND_SIZE = 5
+MIN_PLAYERS = 2
+MAX_PLAYERS = 4
+
+
+def permutations(seeds: Sequence[str]) -> NDArray[np.int8]:
+    """
+    The card orders of Deck(seed) for every provided seed.
+    Row i holds Deck(seeds[i]).cards as indices into ALL_CARDS.
+    """
+    matrix = np.empty((len(seeds), len(ALL_CARDS)), dtype=np.int8)
+    for row, seed in enumerate(seeds):
+        matrix[row] = _shuffled_indices(Random(seed))
+    return matrix
+
+
+def round_permutations(game_seed: str, count: int, start: int = 0) -> NDArray[np.int8]:
+    """
+    The card orders of count consecutive rounds of the game with the provided seed,
+    beginning with the round at index start.
+    Row i holds round_deck(game_seed, start + i).cards.
+    """
+    matrix = np.empty((count, len(ALL_CARDS)), dtype=np.int8)
+    for row, deck in enumerate(round_decks(game_seed, count, start)):
+        matrix[row] = deck.cards
+    return matrix
+
+
+def deal_hands(matrix: NDArray[np.int8], num_players: int) -> NDArray[np.int8]:
+    """
+    The opening hands dealt from each permutation, shaped (N, num_players, HAND_SIZE).
+    Players are dealt in seat order, HAND_SIZE cards at a time, as a round deals them.
+    The result is a view into the provided matrix.
+    """
+    if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+        raise ValueError(
+            f"Cannot deal hands for {num_players} players; "
+            f"expected {MIN_PLAYERS} to {MAX_PLAYERS}"
+        )
+    return matrix[:, : num_players * HAND_SIZE].reshape(-1, num_players, HAND_SIZE)
@@ -0,0 +1,71 @@
+"""Tests for the NumPy batch deck helpers"""
+
+from unittest import TestCase
+
+import numpy as np
+from hundredandten.deck import ALL_CARDS, Deck, round_decks
+from hundredandten.deck.batch import (
+    HAND_SIZE,
+    deal_hands,
+    permutations,
+    round_permutations,
+)
+
+
+class TestPermutations(TestCase):
+    """Unit tests for building permutation matrices"""
+
+    def test_permutations_match_decks(self):
+        """Each row is the card order of the deck with that seed"""
+        seeds = [f"seed-{i}" for i in range(100)]
+        matrix = permutations(seeds)
+
+        self.assertEqual(matrix.shape, (100, len(ALL_CARDS)))
+        self.assertEqual(matrix.dtype, np.int8)
+        for row, seed in zip(matrix, seeds):
+            self.assertEqual(row.tolist(), Deck(seed).cards)
+
+    def test_permutations_empty(self):
+        """No seeds produce an empty matrix"""
+        self.assertEqual(permutations([]).shape, (0, len(ALL_CARDS)))
+
+    def test_round_permutations_match_round_decks(self):
+        """Each row is the card order of the matching round deck"""
+        matrix = round_permutations("game-seed", 20, start=5)
+
+        self.assertEqual(matrix.shape, (20, len(ALL_CARDS)))
+        self.assertEqual(matrix.dtype, np.int8)
+        self.assertEqual(
+            matrix.tolist(),
+            [deck.cards for deck in round_decks("game-seed", 20, start=5)],
+        )
+
+
+class TestDealHands(TestCase):
+    """Unit tests for slicing hands out of a permutation matrix"""
+
+    def test_deal_hands_matches_draw(self):
+        """Hands are drawn in seat order, HAND_SIZE cards at a time"""
+        seeds = [f"seed-{i}" for i in range(25)]
+        matrix = permutations(seeds)
+
+        for num_players in range(2, 5):
+            hands = deal_hands(matrix, num_players)
+            self.assertEqual(hands.shape, (25, num_players, HAND_SIZE))
+            for dealt, seed in zip(hands, seeds):
+                deck = Deck(seed)
+                self.assertEqual(
+                    [[ALL_CARDS[i] for i in hand] for hand in dealt.tolist()],
+                    [deck.draw(HAND_SIZE) for _ in range(num_players)],
+                )
+
+    def test_deal_hands_is_a_view(self):
+        """Dealing hands does not copy the matrix"""
+        matrix = permutations(["seed"])
+        self.assertTrue(np.shares_memory(deal_hands(matrix, 4), matrix))
+
+    def test_deal_hands_player_bounds(self):
+        """Only two to four players can be dealt"""
+        matrix = permutations(["seed"])
+        self.assertRaises(ValueError, deal_hands, matrix, 1)
+        self.assertRaises(ValueError, deal_hands, matrix, 5)
@@ -1,16 +1,32 @@
 """Tests for hundredandten-deck"""
 
+import hashlib
+from random import Random
 from unittest import TestCase
+from uuid import UUID
 
 from hundredandten.deck import (
     _CARD_INFO,
     ALL_CARDS,
+    ALL_CARDS_MASK,
+    ALWAYS_TRUMP,
+    ALWAYS_TRUMP_MASK,
+    SUIT_INDICES,
+    TRICK_RANKS,
+    TRUMP_VALUES,
+    TRUMP_VALUES_BY_SELECTION,
+    WEAK_TRUMP_VALUES,
     Card,
     CardNumber,
+    CardSet,
     CardSuit,
     Deck,
     SelectableSuit,
     _CardInfo,
+    _shuffled_indices,
+    round_deck,
+    round_decks,
+    round_seed,
 )
 
 
@@ -51,6 +67,15 @@ class TestCardEnums(TestCase):
         self.assertEqual(hash(CardSuit.HEARTS), hash(SelectableSuit.HEARTS))
         self.assertEqual(hash(CardSuit.SPADES), hash(SelectableSuit.SPADES))
 
+    def test_suit_cross_type_index(self):
+        """CardSuit and SelectableSuit share an index when values match"""
+        for suit in SelectableSuit:
+            self.assertEqual(suit.index, CardSuit[suit.name].index)
+
+    def test_suit_indices_are_distinct(self):
+        """Every card suit has its own index"""
+        self.assertEqual(sorted(s.index for s in CardSuit), list(range(len(CardSuit))))
+
     def test_suit_not_equal_to_non_enum(self):
         """CardSuit does not compare equal to non-Enum types"""
         self.assertNotEqual(CardSuit.HEARTS, "HEARTS")
@@ -172,6 +197,156 @@ class TestAllCards(TestCase):
         self.assertIn(ace_of_hearts, ALL_CARDS)
 
 
+class TestCardIndex(TestCase):
+    """Unit tests for Card.index and the flat card tables"""
+
+    def test_index_matches_all_cards_position(self):
+        """Every card's index is its position in ALL_CARDS"""
+        for position, card in enumerate(ALL_CARDS):
+            self.assertEqual(card.index, position)
+
+    def test_constructed_card_index(self):
+        """A constructed card carries the index of its ALL_CARDS counterpart"""
+        card = Card(CardNumber.ACE, CardSuit.HEARTS)
+        self.assertIs(ALL_CARDS[card.index].number, CardNumber.ACE)
+        self.assertIs(ALL_CARDS[card.index].suit, CardSuit.HEARTS)
+
+    def test_joker_is_last(self):
+        """The Joker is the last card"""
+        self.assertEqual(Card(CardNumber.JOKER, CardSuit.JOKER).index, 52)
+
+    def test_invalid_card_raises(self):
+        """A number and suit pairing outside the deck cannot be constructed"""
+        with self.assertRaises(ValueError):
+            Card(CardNumber.JOKER, CardSuit.HEARTS)
+        with self.assertRaises(ValueError):
+            Card(CardNumber.ACE, CardSuit.JOKER)
+
+    def test_equality_and_hash_follow_index(self):
+        """Cards built separately compare and hash equal"""
+        self.assertEqual(
+            Card(CardNumber.TWO, CardSuit.CLUBS), Card(CardNumber.TWO, CardSuit.CLUBS)
+        )
+        self.assertEqual(
+            hash(Card(CardNumber.TWO, CardSuit.CLUBS)),
+            hash(Card(CardNumber.TWO, CardSuit.CLUBS)),
+        )
+        self.assertNotEqual(
+            Card(CardNumber.TWO, CardSuit.CLUBS), Card(CardNumber.TWO, CardSuit.SPADES)
+        )
+
+    def test_tables_match_card_info(self):
+        """Flat tables agree with the card metadata"""
+        for card in ALL_CARDS:
+            info = _CARD_INFO[card.suit][card.number]
+            self.assertEqual(TRUMP_VALUES[card.index], info.trump_value)
+            self.assertEqual(WEAK_TRUMP_VALUES[card.index], info.weak_trump_value)
+            self.assertEqual(ALWAYS_TRUMP[card.index], info.always_trump)
+            self.assertEqual(SUIT_INDICES[card.index], card.suit.index)
+
+    def test_trump_values_by_selection(self):
+        """Selection table holds the trump value for trumps and -1 otherwise"""
+        for suit in SelectableSuit:
+            for card in ALL_CARDS:
+                expected = card.trump_value if card.trump_for_selection(suit) else -1
+                self.assertEqual(
+                    TRUMP_VALUES_BY_SELECTION[suit.index][card.index], expected
+                )
+
+    def test_trick_ranks(self):
+        """Trumps outrank every other card, then the led suit ranks by weak value"""
+        for suit in SelectableSuit:
+            for led in CardSuit:
+                ranks = TRICK_RANKS[suit.index][led.index]
+                for card in ALL_CARDS:
+                    if card.trump_for_selection(suit):
+                        self.assertEqual(100 + card.trump_value, ranks[card.index])
+                    elif card.suit == led:
+                        self.assertEqual(card.weak_trump_value, ranks[card.index])
+                    else:
+                        self.assertEqual(-1, ranks[card.index])
+
+
+class TestCardSet(TestCase):
+    """Unit tests for the CardSet bitboard"""
+
+    def setUp(self):
+        self.ace_hearts = Card(CardNumber.ACE, CardSuit.HEARTS)
+        self.five_spades = Card(CardNumber.FIVE, CardSuit.SPADES)
+        self.two_clubs = Card(CardNumber.TWO, CardSuit.CLUBS)
+        self.joker = Card(CardNumber.JOKER, CardSuit.JOKER)
+
+    def test_empty(self):
+        """The default set is empty"""
+        self.assertEqual(len(CardSet()), 0)
+        self.assertFalse(CardSet())
+        self.assertEqual(list(CardSet()), [])
+
+    def test_of_and_membership(self):
+        """A set built from cards contains exactly those cards"""
+        cards = CardSet.of([self.ace_hearts, self.five_spades])
+        self.assertIn(self.ace_hearts, cards)
+        self.assertIn(self.five_spades, cards)
+        self.assertNotIn(self.two_clubs, cards)
+        self.assertNotIn("ACE of HEARTS", cards)
+
+    def test_duplicates_collapse(self):
+        """Duplicate cards count once"""
+        self.assertEqual(len(CardSet.of([self.two_clubs, self.two_clubs])), 1)
+
+    def test_iterates_in_deck_order(self):
+        """Iteration yields cards in ALL_CARDS order"""
+        cards = CardSet.of([self.joker, self.two_clubs, self.ace_hearts])
+        self.assertEqual(list(cards), [self.ace_hearts, self.two_clubs, self.joker])
+
+    def test_full_set(self):
+        """The full mask holds every card"""
+        self.assertEqual(list(CardSet(ALL_CARDS_MASK)), list(ALL_CARDS))
+        self.assertEqual(CardSet.of(ALL_CARDS).mask, ALL_CARDS_MASK)
+
+    def test_set_operations(self):
+        """Union, intersection and difference behave like set operations"""
+        left = CardSet.of([self.ace_hearts, self.five_spades])
+        right = CardSet.of([self.five_spades, self.two_clubs])
+        self.assertEqual(
+            set(left | right), {self.ace_hearts, self.five_spades, self.two_clubs}
+        )
+        self.assertEqual(set(left & right), {self.five_spades})
+        self.assertEqual(set(left - right), {self.ace_hearts})
+
+    def test_subset(self):
+        """<= checks containment"""
+        small = CardSet.of([self.five_spades])
+        large = CardSet.of([self.five_spades, self.two_clubs])
+        self.assertTrue(small <= large)
+        self.assertTrue(CardSet.of([self.five_spades]) <= small)
+        self.assertFalse(large <= small)
+
+    def test_of_suit(self):
+        """of_suit keeps only cards of that suit, for either suit enum"""
+        cards = CardSet.of([self.ace_hearts, self.five_spades, self.joker])
+        self.assertEqual(set(cards.of_suit(CardSuit.HEARTS)), {self.ace_hearts})
+        self.assertEqual(set(cards.of_suit(SelectableSuit.SPADES)), {self.five_spades})
+        self.assertEqual(set(cards.of_suit(CardSuit.JOKER)), {self.joker})
+
+    def test_trumps_match_trump_for_selection(self):
+        """trumps agrees with Card.trump_for_selection for every suit"""
+        everything = CardSet(ALL_CARDS_MASK)
+        for suit in [*SelectableSuit, None]:
+            self.assertEqual(
+                list(everything.trumps(suit)),
+                [card for card in ALL_CARDS if card.trump_for_selection(suit)],
+            )
+
+    def test_always_trump_mask(self):
+        """Only the Ace of Hearts and Joker are always trump"""
+        self.assertEqual(set(CardSet(ALWAYS_TRUMP_MASK)), {self.ace_hearts, self.joker})
+
+    def test_repr_lists_cards(self):
+        """repr shows the contained cards"""
+        self.assertIn("ACE of HEARTS", repr(CardSet.of([self.ace_hearts])))
+
+
 class TestDeck(TestCase):
     """Unit tests for Deck"""
 
@@ -232,6 +407,72 @@ class TestDeck(TestCase):
         deck_1.draw(amt)
         self.assertEqual(deck_1.draw(amt), deck_2.draw(amt))
 
+    def test_matches_random_shuffle(self):
+        """The deck order is the one Random.shuffle produces for the seed"""
+        for index in range(200):
+            seed = f"deck-shuffle-{index}"
+            expected = list(range(len(ALL_CARDS)))
+            Random(seed).shuffle(expected)
+            self.assertEqual(Deck(seed).cards, expected)
+
+    def test_shuffled_indices_match_random_shuffle(self):
+        """Inlined shuffling draws the same swaps as Random.shuffle for many seeds"""
+        for seed in [*range(500), *(f"shuffle-{index}" for index in range(500))]:
+            rng, reference = Random(seed), Random(seed)
+            # shuffle several times from each generator to compare its later state too
+            for _ in range(3):
+                expected = list(range(len(ALL_CARDS)))
+                reference.shuffle(expected)
+                self.assertEqual(expected, _shuffled_indices(rng))
+
+    def test_initialize_with_order(self):
+        """A known order is used as-is instead of shuffling"""
+        deck = Deck(seed="ignored", order=list(range(len(ALL_CARDS))))
+        self.assertEqual(deck.draw(2), list(ALL_CARDS[:2]))
+
+
+class TestRoundDecks(TestCase):
+    """Unit tests for deriving round decks from a game seed"""
+
+    @staticmethod
+    def __reference_seed(game_seed: str, round_index: int) -> str:
+        """The original derivation: sha256, then a UUID from a fresh Random"""
+        round_deck_seed = hashlib.sha256(
+            f"deck-seed|{game_seed}|round:{round_index}".encode()
+        ).hexdigest()
+        return str(UUID(int=Random(round_deck_seed).getrandbits(128), version=4))
+
+    def test_round_seed_matches_reference(self):
+        """round_seed is a version 4 UUID string from the original derivation"""
+        for round_index in range(200):
+            self.assertEqual(
+                round_seed("game-seed", round_index),
+                self.__reference_seed("game-seed", round_index),
+            )
+
+    def test_round_deck_matches_seeded_deck(self):
+        """round_deck has the same seed and order as a deck built from its seed"""
+        for round_index in range(50):
+            deck = round_deck("game-seed", round_index)
+            self.assertEqual(deck.seed, round_seed("game-seed", round_index))
+            self.assertEqual(deck.cards, Deck(deck.seed).cards)
+            self.assertEqual(deck.pulled, 0)
+
+    def test_round_decks_batch(self):
+        """round_decks derives consecutive rounds up front"""
+        decks = round_decks("game-seed", 10, start=3)
+        self.assertEqual(
+            [(d.seed, d.cards) for d in decks],
+            [
+                (d.seed, d.cards)
+                for d in (round_deck("game-seed", i) for i in range(3, 13))
+            ],
+        )
+
+    def test_round_decks_empty(self):
+        """Asking for no rounds returns no decks"""
+        self.assertEqual(round_decks("game-seed", 0), [])
+
 
 class TestTrumpForSelection(TestCase):
     """Unit tests for Card.trump_for_selection()"""
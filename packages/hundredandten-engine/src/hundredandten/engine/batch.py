@@ -0,0 +1,416 @@
+"""
+Many rounds played at once, with their state held in NumPy arrays.
+Requires the numpy extra: pip install hundredandten-engine[numpy]
+
+Every round in a batch follows the rules of Round, for the same number of players.
+Hands are bitmasks over Card.index, as in CardSet, and seats, suits and cards are
+indices. Each call to act takes one action for each round, read by the round's status:
+
+    status           action
+    BIDDING          the bid amount
+    TRUMP_SELECTION  the suit index
+    DISCARD          the bitmask of the cards to discard
+    TRICKS           the index of the card to play
+
+Rounds that are completed ignore their action.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from hundredandten.deck import (
+    ALL_CARDS,
+    SUIT_INDICES,
+    TRICK_RANKS,
+    TRUMP_MASKS,
+    TRUMP_VALUES_BY_SELECTION,
+    CardSuit,
+)
+from hundredandten.deck.batch import deal_hands, permutations
+from numpy.typing import ArrayLike, NDArray
+
+from .constants import HAND_SIZE, TRICK_VALUE, BidAmount, Status
+from .errors import HundredAndTenError
+
+# the bid amounts in increasing order, as the columns of legal_bids
+BIDS = np.array(sorted(BidAmount), dtype=np.int8)
+NO_SEAT = -1
+
+_BIDDING = Status.BIDDING.value
+_TRUMP_SELECTION = Status.TRUMP_SELECTION.value
+_DISCARD = Status.DISCARD.value
+_TRICKS = Status.TRICKS.value
+_COMPLETED = Status.COMPLETED.value
+_COMPLETED_NO_BIDDERS = Status.COMPLETED_NO_BIDDERS.value
+
+_CARD_BITS = np.left_shift(np.uint64(1), np.arange(len(ALL_CARDS), dtype=np.uint64))
+_SEAT_BITS = np.left_shift(np.uint8(1), np.arange(8, dtype=np.uint8))
+_SUITS = np.array(SUIT_INDICES, dtype=np.int8)
+_TRUMP_MASKS = np.array(TRUMP_MASKS, dtype=np.uint64)
+# the trump value of each card under each trump, -1 when it is not a trump
+_TRUMP_VALUES = np.array(TRUMP_VALUES_BY_SELECTION, dtype=np.int16)
+# indexed [trump, led suit, card]
+_TRICK_RANKS = np.asarray(TRICK_RANKS, dtype=np.int16)
+# the column of each bid amount in BIDS, -1 for any other amount
+_BID_COLUMNS = np.full(int(BIDS.max()) + 1, -1, dtype=np.int8)
+_BID_COLUMNS[BIDS] = np.arange(len(BIDS))
+
+
+class RoundBatch:  # pylint: disable=too-many-instance-attributes
+    """
+    The state of many rounds, one row per round.
+    A round starts from the deck of the seed in the matching row, as Round(seed=...) would.
+    """
+
+    def __init__(
+        self, decks: NDArray[np.int8], dealers: ArrayLike, num_players: int
+    ) -> None:
+        """
+        Deal rounds from card orders, such as those of deck.batch.permutations,
+        with the dealer of each round in the matching row of dealers
+        """
+        count = len(decks)
+        self.num_players = num_players
+        self.decks = np.asarray(decks, dtype=np.int8)
+        self.dealer = np.asarray(dealers, dtype=np.int8)
+        if self.dealer.shape != (count,):
+            raise ValueError(f"Expected {count} dealers, got {self.dealer.shape}")
+        self.pulled = np.full(count, num_players * HAND_SIZE, dtype=np.int8)
+        self.hands = np.bitwise_or.reduce(
+            _CARD_BITS[deal_hands(self.decks, num_players)], axis=2
+        )
+
+        self.status = np.full(count, _BIDDING, dtype=np.int8)
+        self.__next_seat = ((np.arange(num_players) + 1) % num_players).astype(np.int8)
+        # bidding starts with the player after the dealer
+        self.active = self.__next_seat[self.dealer]
+        # a bitmask of the seats that can still bid
+        self.bidders = np.full(count, (1 << num_players) - 1, dtype=np.uint8)
+        # -1 until the first bid, as a round's active_bid is None
+        self.active_bid = np.full(count, -1, dtype=np.int8)
+        self.bidder = np.full(count, NO_SEAT, dtype=np.int8)
+        self.trump = np.full(count, -1, dtype=np.int8)
+        self.discards = np.zeros(count, dtype=np.int8)
+
+        # the card each seat played most recently; the current trick is the cards
+        # of the plays seats before the active one
+        self.trick = np.full((count, num_players), -1, dtype=np.int8)
+        self.plays = np.zeros(count, dtype=np.int8)
+        # the seat and card winning each completed trick
+        self.tricks = np.zeros(count, dtype=np.int8)
+        self.winners = np.full((count, HAND_SIZE), NO_SEAT, dtype=np.int8)
+        self.winning_cards = np.full((count, HAND_SIZE), -1, dtype=np.int8)
+
+        # the points each seat earned, once the round is completed
+        self.scores = np.zeros((count, num_players), dtype=np.int16)
+
+    @classmethod
+    def of_seeds(
+        cls, seeds: Sequence[str], dealers: ArrayLike, num_players: int
+    ) -> "RoundBatch":
+        """Deal the round of each seed, with the dealer in the matching row of dealers"""
+        return cls(permutations(seeds), dealers, num_players)
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    @property
+    def completed(self) -> NDArray[np.bool]:
+        """Whether each round is completed, with or without a bidder"""
+        return (self.status == _COMPLETED) | (self.status == _COMPLETED_NO_BIDDERS)
+
+    def legal_bids(self) -> NDArray[np.bool]:
+        """Whether each amount in BIDS is available to the active player of each round"""
+        legal = np.zeros((len(self), len(BIDS)), dtype=np.bool)
+        rows = np.flatnonzero(self.status == _BIDDING)
+        legal[rows] = self.__legal_bids(rows)
+        return legal
+
+    def legal_plays(self) -> NDArray[np.uint64]:
+        """The bitmask of the cards the active player of each round can play"""
+        legal = np.zeros(len(self), dtype=np.uint64)
+        rows = np.flatnonzero(self.status == _TRICKS)
+        legal[rows] = self.__legal_plays(rows)
+        return legal
+
+    def __legal_bids(self, rows: NDArray[np.intp]) -> NDArray[np.bool]:
+        """Whether each amount in BIDS is available in each of the bidding rounds"""
+        active_bid = self.active_bid[rows, None]
+        dealing = (self.active[rows] == self.dealer[rows])[:, None]
+        return (
+            # pass is always available, and every bid is before a bid above pass
+            (BIDS == BidAmount.PASS)
+            | (active_bid <= 0)
+            | (BIDS > active_bid)
+            # the dealer can take the active bid
+            | (dealing & (BIDS == active_bid))
+        )
+
+    def __legal_plays(self, rows: NDArray[np.intp]) -> NDArray[np.uint64]:
+        """The bitmask of the cards playable in each of the rounds playing tricks"""
+        hands = self.hands.reshape(-1)[self.__cells(rows, self.active[rows])]
+        trump = self.trump[rows]
+        lead = self.trick.reshape(-1)[self.__cells(rows, self.__leaders(rows))]
+        # a trick led with a trump is bleeding, and players must follow with a trump
+        bleeding = (self.plays[rows] > 0) & (_TRUMP_VALUES[trump, lead] >= 0)
+        trumps = hands & _TRUMP_MASKS[trump]
+        return np.where(bleeding & (trumps != 0), trumps, hands)
+
+    def random_actions(self, rng: np.random.Generator) -> NDArray[np.int64]:
+        """A legal action for each round chosen uniformly at random, 0 when completed"""
+        actions = np.zeros(len(self), dtype=np.int64)
+
+        rows = np.flatnonzero(self.status == _BIDDING)
+        bids = self.__legal_bids(rows)
+        choices = np.where(bids, rng.random(bids.shape), -1)
+        actions[rows] = BIDS[np.argmax(choices, axis=1)]
+
+        rows = np.flatnonzero(self.status == _TRUMP_SELECTION)
+        actions[rows] = rng.integers(0, len(TRUMP_MASKS), len(rows))
+
+        rows = np.flatnonzero(self.status == _DISCARD)
+        subsets = rng.integers(0, 1 << len(ALL_CARDS), len(rows), dtype=np.uint64)
+        actions[rows] = (
+            self.hands.reshape(-1)[self.__cells(rows, self.active[rows])] & subsets
+        )
+
+        rows = np.flatnonzero(self.status == _TRICKS)
+        actions[rows] = _random_card(self.__legal_plays(rows), rng)
+
+        return actions
+
+    def play_random(self, rng: np.random.Generator) -> None:
+        """Take random legal actions in every round until all of them are completed"""
+        while not self.completed.all():
+            self.act(self.random_actions(rng), validate=False)
+
+    def act(self, actions: ArrayLike, validate: bool = True) -> None:
+        """
+        Take the action in each row for the active player of the matching round.
+        Validation should only be skipped for actions already known to be legal;
+        when it fails, no round is changed.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (len(self),):
+            raise ValueError(f"Expected {len(self)} actions, got {actions.shape}")
+        if validate:
+            self.__validate(actions)
+
+        # find every phase's rounds before any of them move on to the next phase
+        bidding = np.flatnonzero(self.status == _BIDDING)
+        selecting = np.flatnonzero(self.status == _TRUMP_SELECTION)
+        discarding = np.flatnonzero(self.status == _DISCARD)
+        playing = np.flatnonzero(self.status == _TRICKS)
+
+        self.__bid(bidding, actions[bidding])
+        self.__select_trump(selecting, actions[selecting])
+        self.__discard(discarding, actions[discarding].astype(np.uint64))
+        self.__play(playing, actions[playing])
+
+    def __validate(self, actions: NDArray[np.int64]) -> None:
+        """Raise if the action of any round is not available to its active player"""
+        legal = self.completed.copy()
+
+        rows = np.flatnonzero(self.status == _BIDDING)
+        amounts = actions[rows]
+        known = (amounts >= 0) & (amounts < len(_BID_COLUMNS))
+        columns = _BID_COLUMNS[np.where(known, amounts, 0)]
+        legal[rows] = (
+            known
+            & (columns >= 0)
+            & self.__legal_bids(rows)[np.arange(len(rows)), np.maximum(columns, 0)]
+        )
+
+        rows = np.flatnonzero(self.status == _TRUMP_SELECTION)
+        legal[rows] = (actions[rows] >= 0) & (actions[rows] < len(TRUMP_MASKS))
+
+        rows = np.flatnonzero(self.status == _DISCARD)
+        discarded = actions[rows].astype(np.uint64)
+        legal[rows] = (actions[rows] >= 0) & (
+            discarded & ~self.hands.reshape(-1)[self.__cells(rows, self.active[rows])]
+            == 0
+        )
+
+        rows = np.flatnonzero(self.status == _TRICKS)
+        cards = actions[rows]
+        known = (cards >= 0) & (cards < len(ALL_CARDS))
+        legal[rows] = known & (
+            self.__legal_plays(rows) & _CARD_BITS[np.where(known, cards, 0)] != 0
+        )
+
+        if not legal.all():
+            raise HundredAndTenError(
+                f"Unavailable actions in rounds {np.flatnonzero(~legal).tolist()}"
+            )
+
+    def __bid(self, rows: NDArray[np.intp], amounts: NDArray[np.int64]) -> None:
+        """Record a bid from the active player of each round"""
+        seats = self.active[rows]
+        bidders = self.bidders[rows] & ~np.where(
+            amounts == BidAmount.PASS, _SEAT_BITS[seats], np.uint8(0)
+        )
+        self.bidders[rows] = bidders
+        active_bid = self.active_bid[rows]
+        active_bid = np.where(
+            (active_bid < 0) | (amounts > active_bid), amounts, active_bid
+        )
+        self.active_bid[rows] = active_bid
+
+        remaining = np.bitwise_count(bidders)
+        won = (active_bid > 0) & (remaining == 1)
+        ended = remaining == 0
+        waiting = ~(won | ended)
+
+        bidder = _lowest_bit(bidders[won])
+        self.status[rows[won]] = _TRUMP_SELECTION
+        self.active[rows[won]] = bidder
+        self.bidder[rows[won]] = bidder
+
+        self.status[rows[ended]] = _COMPLETED_NO_BIDDERS
+        self.active[rows[ended]] = NO_SEAT
+
+        # the next player around the table that can still bid,
+        # returning to the bidder when no one else can:
+        # rotate the seats so that bit k is the kth seat after the bidder's
+        players = self.num_players
+        seats = seats[waiting].astype(np.int16)
+        bidders = bidders[waiting].astype(np.int16)
+        after = (bidders >> (seats + 1)) | (bidders << (players - seats - 1))
+        offsets = _lowest_bit(after | (1 << (players - 1)))
+        self.active[rows[waiting]] = (seats + 1 + offsets) % players
+
+    def __select_trump(self, rows: NDArray[np.intp], suits: NDArray[np.int64]) -> None:
+        """Select the suit of each round as trump"""
+        self.trump[rows] = suits
+        # discarding starts with the player after the dealer
+        self.status[rows] = _DISCARD
+        self.active[rows] = self.__next_seat[self.dealer[rows]]
+
+    def __discard(self, rows: NDArray[np.intp], discarded: NDArray[np.uint64]) -> None:
+        """Discard cards from the active player's hand in each round and replace them"""
+        seats = self.active[rows]
+        cells = self.__cells(rows, seats)
+        drawn = np.bitwise_count(discarded)
+        # the next cards of the deck, of which only as many as were discarded are drawn
+        positions = np.minimum(
+            self.pulled[rows, None] + np.arange(HAND_SIZE), len(ALL_CARDS) - 1
+        )
+        replacements = np.where(
+            np.arange(HAND_SIZE) < drawn[:, None],
+            _CARD_BITS[
+                self.decks.reshape(-1)[rows[:, None] * len(ALL_CARDS) + positions]
+            ],
+            np.uint64(0),
+        )
+        hands = self.hands.reshape(-1)
+        hands[cells] = (hands[cells] & ~discarded) | np.bitwise_or.reduce(
+            replacements, axis=1
+        )
+        self.pulled[rows] += drawn.astype(np.int8)
+        self.discards[rows] += 1
+
+        done = self.discards[rows] == self.num_players
+        self.active[rows[~done]] = self.__next_seat[seats[~done]]
+        # the player after the bidder leads the first trick
+        rows = rows[done]
+        self.status[rows] = _TRICKS
+        self.active[rows] = self.__next_seat[self.bidder[rows]]
+
+    def __play(self, rows: NDArray[np.intp], cards: NDArray[np.int64]) -> None:
+        """Play the card from the active player's hand in each round"""
+        seats = self.active[rows]
+        cells = self.__cells(rows, seats)
+        self.hands.reshape(-1)[cells] &= ~_CARD_BITS[cards]
+        self.trick.reshape(-1)[cells] = cards
+        plays = self.plays[rows] + 1
+        self.plays[rows] = plays
+        self.active[rows] = self.__next_seat[seats]
+
+        rows = rows[plays == self.num_players]
+        winners = self.__trick_winners(rows)
+        won = rows * HAND_SIZE + self.tricks[rows]
+        self.winners.reshape(-1)[won] = winners
+        self.winning_cards.reshape(-1)[won] = self.trick.reshape(-1)[
+            self.__cells(rows, winners)
+        ]
+        self.tricks[rows] += 1
+        # the winner of a trick leads the next one
+        self.active[rows] = winners
+        self.plays[rows] = 0
+
+        rows = rows[self.tricks[rows] == HAND_SIZE]
+        self.status[rows] = _COMPLETED
+        self.active[rows] = NO_SEAT
+        self.scores[rows] = self.__scores(rows)
+
+    def __cells(
+        self, rows: NDArray[np.intp], seats: NDArray[np.int8]
+    ) -> NDArray[np.intp]:
+        """
+        The position of each row and seat in a flattened array with a column per seat,
+        which is quicker to index than the pairs of rows and seats
+        """
+        return rows * self.num_players + seats
+
+    def __leaders(self, rows: NDArray[np.intp]) -> NDArray[np.int8]:
+        """The seat that led the current trick of each round"""
+        return (self.active[rows] - self.plays[rows]) % self.num_players
+
+    def __trick_winners(self, rows: NDArray[np.intp]) -> NDArray[np.int8]:
+        """The seat winning the current, full trick of each round, as Trick.winning_play"""
+        cards = np.take(self.trick, rows, axis=0)
+        lead = self.trick.reshape(-1)[self.__cells(rows, self.__leaders(rows))]
+        # the first rank of the trump and led suit of each trick
+        ranks = (self.trump[rows].astype(np.intp) * len(CardSuit) + _SUITS[lead]) * len(
+            ALL_CARDS
+        )
+        return np.argmax(
+            _TRICK_RANKS.reshape(-1)[ranks[:, None] + cards], axis=1
+        ).astype(np.int8)
+
+    def __scores(self, rows: NDArray[np.intp]) -> NDArray[np.int16]:
+        """The points each seat earned in each completed round, as Round.scores"""
+        count = len(rows)
+        winners = np.take(self.winners, rows, axis=0)
+        trump_values = _TRUMP_VALUES[
+            self.trump[rows, None], np.take(self.winning_cards, rows, axis=0)
+        ]
+        # the trick won with the highest trump counts as two tricks
+        highest = np.argmax(trump_values, axis=1)
+        doubled = (np.arange(HAND_SIZE) == highest[:, None]) & (
+            trump_values.max(axis=1) >= 0
+        )[:, None]
+        scores = np.zeros((count, self.num_players), dtype=np.int16)
+        flat = scores.reshape(-1)
+        for trick in range(HAND_SIZE):
+            flat[self.__cells(np.arange(count), winners[:, trick])] += TRICK_VALUE * (
+                1 + doubled[:, trick]
+            )
+
+        bidders = self.__cells(np.arange(count), self.bidder[rows])
+        bids = self.active_bid[rows].astype(np.int16)
+        missed = flat[bidders] < bids
+        flat[bidders[missed]] = -bids[missed]
+
+        shot_the_moon = (bids == BidAmount.SHOOT_THE_MOON) & (
+            winners == self.bidder[rows, None]
+        ).all(axis=1)
+        scores[shot_the_moon] = 0
+        flat[bidders[shot_the_moon]] = BidAmount.SHOOT_THE_MOON
+        return scores
+
+
+def _random_card(masks: NDArray[np.uint64], rng: np.random.Generator) -> NDArray:
+    """The index of a card chosen uniformly at random from each nonempty bitmask"""
+    skip = (rng.random(len(masks)) * np.bitwise_count(masks)).astype(np.int8)
+    # clear the lowest card as many times as there are cards to skip
+    for _ in range(HAND_SIZE - 1):
+        masks = np.where(skip > 0, masks & (masks - np.uint64(1)), masks)
+        skip -= 1
+    return _lowest_bit(masks)
+
+
+def _lowest_bit[T: np.integer](masks: NDArray[T]) -> NDArray[np.uint8]:
+    """The index of the lowest set bit of each nonzero mask"""
+    one = masks.dtype.type(1)
+    return np.bitwise_count((masks & (~masks + one)) - one)
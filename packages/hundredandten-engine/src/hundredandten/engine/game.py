@@ -1,10 +1,11 @@
 """Represent a game of Hundred and Ten"""
 
-import hashlib
+from copy import copy
 from dataclasses import dataclass, field
-from random import Random
 from typing import Optional, Sequence
-from uuid import UUID, uuid4
+from uuid import uuid4
+
+from hundredandten.deck import round_deck
 
 from .actions import Action
 from .constants import (
@@ -12,22 +13,32 @@ from .constants import (
     Status,
 )
 from .errors import HundredAndTenError
+from .instrumentation import active_recorder, span
 from .player import (
     Player,
-    player_after,
-    player_by_identifier,
+    Seats,
 )
 from .round import Round
 from .trick import Score
 
 
 @dataclass
-class Game:
+class Game:  # pylint: disable=too-many-instance-attributes
     """A game of Hundred and Ten"""
 
     players: list[Player] = field(default_factory=list)
     seed: str = field(default_factory=lambda: str(uuid4()))
     _rounds: list[Round] = field(default_factory=list, init=False, repr=False)
+    _seats: Seats = field(init=False, repr=False)
+    # running totals, updated as each round ends
+    _scores: dict[str, int] = field(init=False, repr=False)
+    _score_history: list[Score] = field(default_factory=list, init=False, repr=False)
+    # the totals before each round and after the last one to end
+    _scores_by_round: list[dict[str, int]] = field(init=False, repr=False)
+    # identifiers in the order they first reached the winning score
+    _winning_identifiers: list[str] = field(
+        default_factory=list, init=False, repr=False
+    )
 
     def __post_init__(self):
         if len(self.players) < 2:
@@ -35,8 +46,12 @@ class Game:
         if len(self.players) > 4:
             raise HundredAndTenError("Cannot have a game with more than 4 players")
 
+        self._seats = Seats.of(self.players)
+        self._scores = {player.identifier: 0 for player in self.players}
+        self._scores_by_round = [dict(self._scores)]
+
         # manually create the first round
-        self.__new_round(self.players[0].identifier)
+        self.__new_round(0)
 
     @property
     def status(self) -> Status:
@@ -45,6 +60,11 @@ class Game:
             return Status.WON
         return self.active_round.status
 
+    @property
+    def seats(self) -> Seats:
+        """The seat of each player in the game"""
+        return self._seats
+
     @property
     def rounds(self) -> Sequence[Round]:
         """All the rounds in the game, ordered"""
@@ -59,11 +79,8 @@ class Game:
     @property
     def active_player(self) -> Player:
         """The active player"""
-        return next(
-            p
-            for p in self.players
-            if p.identifier == self.active_round.active_player.identifier
-        )
+        # every round seats its players in the same order as the game
+        return self.players[self.active_round.active_seat]
 
     @property
     def winner(self) -> Optional[Player]:
@@ -74,28 +91,14 @@ class Game:
         if not self._rounds or self.active_round.status != Status.COMPLETED:
             return None
 
-        winning_scores = [
-            score for score in self.score_history if score.value >= WINNING_SCORE
-        ]
-        ordered_winning_players = list(
-            map(
-                lambda score: player_by_identifier(
-                    self.active_round.players, score.identifier
-                ),
-                winning_scores,
-            )
-        )
-
+        bidder = self.active_round.active_bidder
         winner = (
-            self.active_round.active_bidder
-            if (self.active_round.active_bidder in ordered_winning_players)
-            else next(iter(ordered_winning_players), None)
+            bidder.identifier
+            if bidder and bidder.identifier in self._winning_identifiers
+            else next(iter(self._winning_identifiers), None)
         )
 
-        return next(
-            (p for p in self.players if winner and p.identifier == winner.identifier),
-            None,
-        )
+        return self.players[self._seats.seat_of(winner)] if winner else None
 
     @property
     def actions(self) -> list[Action]:
@@ -106,7 +109,7 @@ class Game:
     def score_history(self) -> list[Score]:
         """A list of all players' scores over time"""
 
-        return self.__score_history(len(self._rounds))
+        return list(self._score_history)
 
     @property
     def scores_by_round(self) -> list[dict[str, int]]:
@@ -116,14 +119,8 @@ class Game:
         key: player identifier
         value: the player's score
         """
-        return [
-            self.__scores(round_num)
-            for round_num in range(
-                len(self._rounds)
-                # get the score "after" the round if it is completed
-                + (self.active_round.status == Status.COMPLETED)
-            )
-        ]
+        # the totals "after" the active round are only present once it is completed
+        return [dict(scores) for scores in self._scores_by_round]
 
     @property
     def scores(self) -> dict[str, int]:
@@ -133,94 +130,90 @@ class Game:
         key: player identifier
         value: the player's score
         """
-        return self.__scores(len(self._rounds))
+        return dict(self._scores)
 
-    def act(self, action: Action) -> None:
-        """Perform an action as a player of the game"""
-        self.__act(action)
+    def fork(self) -> "Game":
+        """
+        A copy of this game that can act independently of it
+        Completed rounds are shared; only the active round is copied
+        """
+        fork = copy(self)
+        vars(fork).update(
+            players=list(self.players),
+            _rounds=[*self._rounds[:-1], self.active_round.fork()],
+            _scores=dict(self._scores),
+            _score_history=list(self._score_history),
+            _scores_by_round=list(self._scores_by_round),
+            _winning_identifiers=list(self._winning_identifiers),
+        )
+        return fork
 
-    def __act(self, action: Action) -> None:
+    def act(self, action: Action, validate: bool = True) -> None:
+        """
+        Perform an action as a player of the game
+        Validation should only be skipped for actions already known to be legal
+        """
+        if active_recorder() is None:
+            self.__act(action, validate)
+        else:
+            with span("game.act"):
+                self.__act(action, validate)
+
+    def __act(self, action: Action, validate: bool) -> None:
         """Perform an action as a player of the game"""
         if self.status == Status.WON:
             return
-        self.active_round.act(action)
+        self.active_round.act(action, validate)
+        self.__end_round()
         # handle creation of new round if appropriate
         self.__end_bid()
         self.__end_play()
 
+    def __end_round(self) -> None:
+        """Add the scores of the active round to the totals once it ends"""
+        status = self.active_round.status
+        if status == Status.COMPLETED:
+            with span("game.end_round"):
+                for score in self.active_round.scores:
+                    total = self._scores.get(score.identifier, 0) + score.value
+                    self._scores[score.identifier] = total
+                    self._score_history.append(Score(score.identifier, total))
+                    if (
+                        total >= WINNING_SCORE
+                        and score.identifier not in self._winning_identifiers
+                    ):
+                        self._winning_identifiers.append(score.identifier)
+        if status in (Status.COMPLETED, Status.COMPLETED_NO_BIDDERS):
+            self._scores_by_round.append(dict(self._scores))
+
     def __end_bid(self):
         if self.status == Status.COMPLETED_NO_BIDDERS:
-            current_dealer = self.active_round.dealer.identifier
+            current_dealer = self.active_round.dealer_seat
             # dealer doesn't rotate on a round with no bidders
             # unless the current dealer has been dealer 3x in a row
             keep_same_dealer = len(self._rounds) < 3 or any(
-                r.dealer.identifier != current_dealer for r in self._rounds[-3:]
+                r.dealer_seat != current_dealer for r in self._rounds[-3:]
             )
             next_dealer = (
                 current_dealer
                 if keep_same_dealer
-                else player_after(self.active_round.players, current_dealer).identifier
+                else self._seats.seat_after(current_dealer)
             )
             self.__new_round(next_dealer)
 
     def __end_play(self):
         if self.status == Status.COMPLETED:
-            self.__new_round(
-                player_after(
-                    self.active_round.players, self.active_round.dealer.identifier
-                ).identifier
-            )
-
-    def __new_round(self, dealer: str) -> None:
-        r_deck_seed = hashlib.sha256(
-            f"deck-seed|{self.seed}|round:{len(self._rounds)}".encode()
-        ).hexdigest()
-
-        deck_seed = str(UUID(int=Random(r_deck_seed).getrandbits(128), version=4))
-
-        self._rounds.append(
-            Round(
-                game_players=self.players,
-                dealer_identifier=dealer,
-                seed=deck_seed,
+            self.__new_round(self._seats.seat_after(self.active_round.dealer_seat))
+
+    def __new_round(self, dealer_seat: int) -> None:
+        with span("game.new_round"):
+            deck = round_deck(self.seed, len(self._rounds))
+
+            self._rounds.append(
+                Round(
+                    game_players=self.players,
+                    dealer_identifier=self.players[dealer_seat].identifier,
+                    seed=deck.seed,
+                    shuffled_deck=deck,
+                )
             )
-        )
-
-    def __score_history(self, to_round: int) -> list[Score]:
-        """A list of all players' scores up to the provided round"""
-
-        scores = {}
-        score_history = []
-
-        all_final_scores = [
-            score
-            for game_round in self._rounds[:to_round]
-            for score in game_round.scores
-            if game_round.status == Status.COMPLETED
-        ]
-
-        for score in all_final_scores:
-            new_score = scores.get(score.identifier, 0) + score.value
-            scores[score.identifier] = new_score
-            score_history.append(Score(score.identifier, new_score))
-
-        return score_history
-
-    def __scores(self, to_round: int) -> dict[str, int]:
-        """
-        The scores each player earned for this game up to the provided round
-        A dictionary in the form
-        key: player identifier
-        value: the player's score
-        """
-
-        scores = {player.identifier: 0 for player in self.players}
-
-        for game_round in self._rounds[:to_round]:
-            if game_round.status != Status.COMPLETED:
-                continue
-
-            for score in game_round.scores:
-                scores[score.identifier] = scores.get(score.identifier, 0) + score.value
-
-        return scores
@@ -0,0 +1,170 @@
+"""
+Opt-in timing of the hot paths of the engine and the packages built on it.
+
+While a recorder is active, instrumented code sends it the duration of each span it
+times. Without one, instrumented code only checks whether one is active.
+Recorders are active in the context they are installed in, so each thread and
+asyncio task records to its own.
+
+Spans sent by the engine:
+    game.act                 each action taken in a game
+    game.end_round           totalling the scores of a round that ended with a bid
+    game.new_round           dealing the next round of a game
+    round.act.<action>       each bid, select_trump, discard or play in a round
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from itertools import accumulate
+from math import frexp, inf
+from time import perf_counter
+from types import TracebackType
+from typing import Optional, Protocol
+
+# each power of two is split into this many histogram buckets
+_BUCKETS_PER_DOUBLING = 4
+# the upper bound of the mantissa of each bucket within a doubling
+_MANTISSA_BOUNDS = [
+    2 ** ((step + 1) / _BUCKETS_PER_DOUBLING) / 2
+    for step in range(_BUCKETS_PER_DOUBLING - 1)
+]
+# durations too short for the clock to measure, below every other bucket
+_ZERO_BUCKET = -(2**31)
+_NO_SPAN = nullcontext()
+
+
+class Recorder(Protocol):
+    """Receives the duration of each timed span"""
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record that the named span took the provided number of seconds"""
+
+
+_RECORDER: ContextVar[Optional[Recorder]] = ContextVar("recorder", default=None)
+
+
+def active_recorder() -> Optional[Recorder]:
+    """The recorder spans are sent to, if any"""
+    return _RECORDER.get()
+
+
+@contextmanager
+def recording[R: Recorder](recorder: R) -> Iterator[R]:
+    """Send the spans timed within the block to the recorder"""
+    token = _RECORDER.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _RECORDER.reset(token)
+
+
+def span(name: str) -> AbstractContextManager:
+    """Time the block as the named span, if a recorder is active"""
+    recorder = _RECORDER.get()
+    if recorder is None:
+        return _NO_SPAN
+    return _Span(recorder, name)
+
+
+class _Span:
+    """Time a block and send its duration to a recorder"""
+
+    __slots__ = ("recorder", "name", "start")
+
+    def __init__(self, recorder: Recorder, name: str) -> None:
+        self.recorder = recorder
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.recorder.record(self.name, perf_counter() - self.start)
+
+
+@dataclass
+class Histogram:
+    """
+    The distribution of the durations of one span.
+    Durations are counted in buckets a fraction of a power of two wide, so
+    percentiles are estimates within that fraction.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    minimum: float = inf
+    maximum: float = 0.0
+    # the number of durations in each bucket, by bucket index
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def mean(self) -> float:
+        """The mean duration, in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, seconds: float) -> None:
+        """Count a duration, in seconds"""
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        bucket = _bucket(seconds)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction: float) -> float:
+        """An estimate of the duration the fraction of durations are at most"""
+        if not self.count:
+            return 0.0
+        indices = sorted(self.buckets)
+        counted = list(accumulate(self.buckets[index] for index in indices))
+        found = bisect_left(counted, fraction * self.count)
+        index = indices[min(found, len(indices) - 1)]
+        # the upper bound of the bucket the fraction of durations are within
+        estimate = 2 ** ((index + 1) / _BUCKETS_PER_DOUBLING)
+        return min(max(estimate, self.minimum), self.maximum)
+
+
+class HistogramRecorder:
+    """Keep a histogram of the durations of each span in memory"""
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, Histogram] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Count the duration in the histogram of the named span"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(seconds)
+
+    def summary(self, fractions: tuple[float, ...] = (0.5, 0.9, 0.99)) -> str:
+        """A table of the count, mean and percentiles of each span, in microseconds"""
+        header = ["span", "count", "mean", *(f"p{f * 100:g}" for f in fractions)]
+        width = max(map(len, [header[0], *self.histograms]))
+        lines = [f"{header[0]:<{width}}" + "".join(f"{h:>10}" for h in header[1:])]
+        for name, histogram in sorted(self.histograms.items()):
+            micros = [histogram.mean, *map(histogram.percentile, fractions)]
+            lines.append(
+                f"{name:<{width}}{histogram.count:>10}"
+                + "".join(f"{m * 1e6:>10.1f}" for m in micros)
+            )
+        return "\n".join(lines)
+
+
+def _bucket(seconds: float) -> int:
+    """The index of the histogram bucket of a duration"""
+    if seconds <= 0:
+        return _ZERO_BUCKET
+    mantissa, exponent = frexp(seconds)
+    # the mantissa is in [0.5, 1), split into buckets of equal ratio
+    fraction = bisect_left(_MANTISSA_BOUNDS, mantissa)
+    return (exponent - 1) * _BUCKETS_PER_DOUBLING + fraction
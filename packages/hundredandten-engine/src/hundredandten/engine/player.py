@@ -1,8 +1,9 @@
 """Interact with a list of people"""
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
-from hundredandten.deck import Card
+from hundredandten.deck import Card, CardSet
 
 from .constants import RoundRole
 from .errors import HundredAndTenError
@@ -23,6 +24,39 @@ class RoundPlayer:
     roles: set[RoundRole] = field(default_factory=set, compare=False)
     hand: list[Card] = field(default_factory=list, compare=False)
 
+    @property
+    def hand_set(self) -> CardSet:
+        """The player's hand as a CardSet"""
+        return CardSet.of(self.hand)
+
+
+@dataclass(frozen=True)
+class Seats:
+    """The seat each player occupies around a table, by identifier"""
+
+    by_identifier: dict[str, int]
+
+    @classmethod
+    def of(cls, players: Sequence[Player | RoundPlayer]) -> "Seats":
+        """Seat the provided players in order."""
+        return cls({p.identifier: seat for seat, p in enumerate(players)})
+
+    def __len__(self) -> int:
+        return len(self.by_identifier)
+
+    def seat_of(self, identifier: str) -> int:
+        """Find the seat of the player with the given identifier."""
+        seat = self.by_identifier.get(identifier)
+
+        if seat is None:
+            raise HundredAndTenError(f"Unrecognized player {identifier!r}")
+
+        return seat
+
+    def seat_after(self, seat: int) -> int:
+        """Determine the seat after the provided one."""
+        return (seat + 1) % len(self)
+
 
 def player_after(players: list[RoundPlayer], identifier: str) -> RoundPlayer:
     """
@@ -0,0 +1,102 @@
+"""
+A compact binary log of the actions in a game, and replaying a game from one
+
+A game is fully determined by its seed, its players and its actions,
+so storing the seed and players alongside the log is enough to rebuild it.
+
+The log starts with a single byte for its format, followed by two bytes per action:
+    the first holds the acting seat in its low two bits and the kind of action above
+    the second holds what the action needs
+        bid: the position of the amount in BidAmount
+        select trump: the SelectableSuit index
+        discard: a bitmask over the hand the player was dealt
+        play: the Card index
+Discarded cards are replayed in the order the player was dealt them.
+"""
+
+from hundredandten.deck import ALL_CARDS, Card, SelectableSuit
+
+from .actions import Action, Bid, Discard, Play, SelectTrump
+from .constants import HAND_SIZE, BidAmount
+from .errors import HundredAndTenError
+from .game import Game
+from .player import Player
+from .round import Round
+
+FORMAT = 1
+
+_BID = 0
+_SELECT_TRUMP = 1
+_DISCARD = 2
+_PLAY = 3
+
+_BID_AMOUNTS = tuple(BidAmount)
+_BID_CODES = {amount: code for code, amount in enumerate(_BID_AMOUNTS)}
+_SUITS = tuple(sorted(SelectableSuit, key=lambda suit: suit.index))
+_PAYLOAD_LIMITS = {
+    _BID: len(_BID_AMOUNTS),
+    _SELECT_TRUMP: len(_SUITS),
+    _DISCARD: 1 << HAND_SIZE,
+    _PLAY: len(ALL_CARDS),
+}
+
+
+def encode(game: Game) -> bytes:
+    """The log of every action taken in the game"""
+    log = bytearray([FORMAT])
+    for game_round in game.rounds:
+        for action in game_round.actions:
+            seat = game_round.seats.seat_of(action.identifier)
+            kind, payload = _encode_action(game_round, seat, action)
+            log += bytes([kind << 2 | seat, payload])
+    return bytes(log)
+
+
+def replay(players: list[Player], seed: str, log: bytes, validate: bool = True) -> Game:
+    """
+    Rebuild the game with the provided players and seed from its log
+    Validation should only be skipped for logs encoded from real games
+    """
+    if not log or log[0] != FORMAT or len(log) % 2 != 1:
+        raise HundredAndTenError("Unrecognized action log.")
+
+    game = Game(players=players, seed=seed)
+    for offset in range(1, len(log), 2):
+        game.act(_decode_action(game, log[offset], log[offset + 1]), validate)
+    return game
+
+
+def _encode_action(game_round: Round, seat: int, action: Action) -> tuple[int, int]:
+    """The kind and payload of the action"""
+    if isinstance(action, Bid):
+        return _BID, _BID_CODES[action.amount]
+    if isinstance(action, SelectTrump):
+        return _SELECT_TRUMP, action.suit.index
+    if isinstance(action, Discard):
+        # a player discards before anything else changes the hand they were dealt
+        dealt = game_round.deck.cards[seat * HAND_SIZE : (seat + 1) * HAND_SIZE]
+        return _DISCARD, sum(1 << dealt.index(card.index) for card in action.cards)
+    return _PLAY, action.card.index
+
+
+def _decode_action(game: Game, header: int, payload: int) -> Action:
+    """The action in the log for the game in its current state"""
+    seat = header & 0b11
+    kind = header >> 2
+    if seat >= len(game.players) or payload >= _PAYLOAD_LIMITS.get(kind, 0):
+        raise HundredAndTenError("Unrecognized action log.")
+
+    identifier = game.players[seat].identifier
+    if kind == _BID:
+        return Bid(identifier, _BID_AMOUNTS[payload])
+    if kind == _SELECT_TRUMP:
+        return SelectTrump(identifier, _SUITS[payload])
+    if kind == _DISCARD:
+        hand = game.active_round.players[seat].hand
+        return Discard(identifier, _masked(hand, payload))
+    return Play(identifier, ALL_CARDS[payload])
+
+
+def _masked(hand: list[Card], mask: int) -> list[Card]:
+    """The cards in the hand at each position set in the mask"""
+    return [card for position, card in enumerate(hand) if mask >> position & 1]
@@ -1,11 +1,10 @@
 """Represent one round of a game of Hundred and Ten"""
 
-from dataclasses import InitVar, dataclass, field
-from functools import cached_property
-from itertools import chain
+from copy import copy
+from dataclasses import InitVar, dataclass, field, replace
 from typing import Optional
 
-from hundredandten.deck import Deck, SelectableSuit
+from hundredandten.deck import Card, CardSet, Deck, SelectableSuit
 
 from .actions import (
     Action,
@@ -22,35 +21,82 @@ from .constants import (
     Status,
 )
 from .errors import HundredAndTenError
+from .instrumentation import active_recorder, span
 from .player import (
     Player,
     RoundPlayer,
+    Seats,
     add_player_role,
-    player_after,
-    player_by_identifier,
-    players_by_role,
 )
 from .trick import Score, Trick
 
 
+def _act_span(action: Action) -> str:
+    """The name of the span acting is timed in, for each kind of action"""
+    match action:
+        case Bid():
+            return "round.act.bid"
+        case SelectTrump():
+            return "round.act.select_trump"
+        case Discard():
+            return "round.act.discard"
+        case Play():
+            return "round.act.play"
+    raise HundredAndTenError(f"{action} is not an action")  # pragma: no cover
+
+
+@dataclass(frozen=True, slots=True)
+class _Applied:
+    """The state an applied action replaced, to restore when it is undone"""
+
+    actions: int
+    tricks: int
+    status: Status
+    active_seat: Optional[int]
+    active_bid: Optional[BidAmount]
+    bidders: list[RoundPlayer]
+    hand: list[Card]
+
+
 @dataclass
-class Round:
+class Round:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """A round in the game of Hundred and Ten"""
 
     game_players: InitVar[list[Player]]
     dealer_identifier: InitVar[str]
 
     seed: str
+    # the already shuffled deck for this seed, if the caller has one
+    shuffled_deck: InitVar[Optional[Deck]] = None
     players: list[RoundPlayer] = field(init=False)
     _deck: Deck = field(init=False, repr=False)
     _bids: list[Bid] = field(default_factory=list, init=False, repr=False)
     _select_trump: Optional[SelectTrump] = field(default=None, init=False, repr=False)
     _discards: list[Discard] = field(default_factory=list, init=False, repr=False)
     _tricks: list[Trick] = field(default_factory=list, init=False, repr=False)
-
-    def __post_init__(self, player_info: list[Player], dealer_identifier: str) -> None:
+    # players are looked up by seat, their position in the players list
+    _seats: Seats = field(init=False, repr=False)
+    _dealer_seat: int = field(init=False, repr=False)
+    # state maintained by each action rather than recomputed from the history
+    _actions: list[Action] = field(default_factory=list, init=False, repr=False)
+    _status: Status = field(default=Status.BIDDING, init=False, repr=False)
+    _active_seat: Optional[int] = field(default=None, init=False, repr=False)
+    _bidders: list[RoundPlayer] = field(init=False, repr=False)
+    _active_bid: Optional[BidAmount] = field(default=None, init=False, repr=False)
+    # actions taken through apply, most recent last, for undo to reverse
+    _applied: list[_Applied] = field(default_factory=list, init=False, repr=False)
+    _scores: Optional[list[Score]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(
+        self,
+        player_info: list[Player],
+        dealer_identifier: str,
+        shuffled_deck: Optional[Deck],
+    ) -> None:
         # Create deck from seed
-        self._deck = Deck(seed=self.seed)
+        self._deck = shuffled_deck or Deck(seed=self.seed)
 
         # Create players RoundGroup by dealing hands from deck
         self.players = [
@@ -61,6 +107,12 @@ class Round:
         # Add DEALER role to dealer
         add_player_role(self.players, dealer_identifier, RoundRole.DEALER)
 
+        self._seats = Seats.of(self.players)
+        self._dealer_seat = self._seats.seat_of(dealer_identifier)
+        self._bidders = list(self.players)
+        # bidding starts with the player after the dealer
+        self._active_seat = self._seats.seat_after(self._dealer_seat)
+
     @property
     def bids(self) -> list[Bid]:
         """All bids placed in this round."""
@@ -86,89 +138,60 @@ class Round:
         """The deck for this round."""
         return self._deck
 
+    @property
+    def seats(self) -> Seats:
+        """The seat of each player in this round."""
+        return self._seats
+
     @property
     def dealer(self) -> RoundPlayer:
         """The dealer this round."""
-        dlr = next(iter(players_by_role(self.players, RoundRole.DEALER)), None)
-        if not dlr:
+        dlr = self.players[self._dealer_seat]
+        if RoundRole.DEALER not in dlr.roles:
             raise HundredAndTenError("No dealer found.")
         return dlr
 
-    @cached_property
+    @property
+    def dealer_seat(self) -> int:
+        """The seat of the dealer this round."""
+        return self._dealer_seat
+
+    @property
     def active_player(self) -> RoundPlayer:
         """The current active player."""
-        # while bidding, the active player is the one after the last bidder that can place a bid
-        if self.status == Status.BIDDING:
-            # before anyone has bid, treat the dealer as the last bidder
-            last_bidder = (
-                self.dealer.identifier if not self.bids else self.bids[-1].identifier
-            )
-            active_and_last_bidders = [
-                p
-                for p in self.players
-                if p in self.bidders or p.identifier == last_bidder
-            ]
-
-            return player_after(active_and_last_bidders, last_bidder)
-        # when in trump selection, the active bidder is the active player
-        if self.status == Status.TRUMP_SELECTION:
-            assert self.active_bidder
-            return self.active_bidder
-        if self.status == Status.DISCARD:
-            assert self.active_bidder
-            last_discarder = (
-                self.dealer.identifier
-                if not self.discards
-                else self.discards[-1].identifier
+        return self.players[self.active_seat]
+
+    @property
+    def active_seat(self) -> int:
+        """The seat of the current active player."""
+        if self._active_seat is None:
+            raise HundredAndTenError(
+                f"Cannot determine active player in {self.status} status"
             )
-            return player_after(self.players, last_discarder)
-        # while playing tricks, active player needs to consider
-        # trick number, trick status, and winner of last trick
-        if self.status == Status.TRICKS:
-            assert self.active_bidder
-            # when we're starting a new trick
-            if not self.active_trick.plays:
-                # the player after the bidder goes first on the first trick
-                if len(self.tricks) == 1:
-                    return player_after(self.players, self.active_bidder.identifier)
-                # otherwise, its the winner of the last trick
-                winning_play = self.tricks[-2].winning_play
-                winner = player_by_identifier(self.players, winning_play.identifier)
-                # when the trick has a winning play, there will be a valid player associated to it
-                assert winner
-                return winner
-            # in an ongoing trick, active player is next around the table
-            return player_after(self.players, self.active_trick.plays[-1].identifier)
-        raise HundredAndTenError(
-            f"Cannot determine active player in {self.status} status"
-        )
+        return self._active_seat
 
-    @cached_property
+    @property
     def inactive_players(self) -> list[RoundPlayer]:
         """The players that are not active."""
         return [p for p in self.players if p != self.active_player]
 
-    @cached_property
+    @property
     def active_bid(self) -> Optional[BidAmount]:
         """The maximum bid submitted this round"""
-        return max(self.bids).amount if self.bids else None
+        return self._active_bid
 
-    @cached_property
+    @property
     def bidders(self) -> list[RoundPlayer]:
         """Anyone in this round that can still submit a bid."""
-        return [
-            p
-            for p in self.players
-            if self.__current_bid(p.identifier) != Bid("", BidAmount.PASS)
-        ]
+        return list(self._bidders)
 
-    @cached_property
+    @property
     def active_bidder(self) -> Optional[RoundPlayer]:
         """The active bidder this round."""
 
-        if not self.active_bid or len(self.bidders) != 1:
+        if not self._active_bid or len(self._bidders) != 1:
             return None
-        return self.bidders[0]
+        return self._bidders[0]
 
     @property
     def active_trick(self) -> Trick:
@@ -177,39 +200,24 @@ class Round:
             raise HundredAndTenError("No active trick found.")
         return self.tricks[-1]
 
-    @cached_property
+    @property
     def trump(self) -> Optional[SelectableSuit]:
         """The selected trump"""
         if not self.selection:
             return None
         return self.selection.suit
 
-    @cached_property
+    @property
     def status(self) -> Status:
         """The status property."""
-        if self.tricks and all(not player.hand for player in self.players):
-            return Status.COMPLETED
-        if len(self.discards) == len(self.players):
-            return Status.TRICKS
-        if self.selection:
-            return Status.DISCARD
-        if self.active_bidder:
-            return Status.TRUMP_SELECTION
-        if not self.bidders:
-            return Status.COMPLETED_NO_BIDDERS
-        return Status.BIDDING
+        return self._status
 
-    @cached_property
+    @property
     def actions(self) -> list[Action]:
         """The actions that occurred in the round."""
-        return [
-            *self._bids,
-            *([self._select_trump] if self._select_trump else []),
-            *self._discards,
-            *chain.from_iterable(trick.plays for trick in self.tricks),
-        ]
+        return list(self._actions)
 
-    @cached_property
+    @property
     def scores(self) -> list[Score]:
         """
         The scores each player earned for this round
@@ -220,87 +228,215 @@ class Round:
         The list will come in the order the points were earned.
         This is to determine a disputed winner
         """
-        winning_plays = [trick.winning_play for trick in self.tricks if trick.plays]
+        if self._scores is None:
+            self._scores = self.__scores()
+        return self._scores
 
-        trump_wins = [
-            play
-            for play in winning_plays
-            if play.card.suit == self.trump or play.card.always_trump
+    def fork(self) -> "Round":
+        """
+        A copy of this round that can act independently of it
+        Only the state actions change is copied; cards, actions and seats are shared
+        """
+        players = [
+            RoundPlayer(p.identifier, roles=set(p.roles), hand=list(p.hand))
+            for p in self.players
         ]
-        highest_play = max(
-            trump_wins, key=lambda play: play.card.trump_value, default=None
-        )
 
-        base_scores = list(
-            map(
-                lambda play: Score(
-                    play.identifier,
-                    TRICK_VALUE +
-                    # treat the highest value play as two tricks
-                    (TRICK_VALUE if play == highest_play else 0),
-                ),
-                winning_plays,
-            )
-        )
-
-        # use default values here so scores can be calculated before tricks are played
-        # should return all zeros
-        acting_bidder = self.active_bidder or self.players[0]
-        acting_bid = self.active_bid or BidAmount.PASS
-
-        bidder_identifier = acting_bidder.identifier
-        bidder_base_scores = list(
-            filter(lambda score: score.identifier == bidder_identifier, base_scores)
+        def forked(bidders: list[RoundPlayer]) -> list[RoundPlayer]:
+            """The fork's players in place of the bidders"""
+            return [players[self._seats.seat_of(p.identifier)] for p in bidders]
+
+        fork = copy(self)
+        vars(fork).update(
+            players=players,
+            _deck=Deck(
+                seed=self._deck.seed, pulled=self._deck.pulled, order=self._deck.cards
+            ),
+            _bids=list(self._bids),
+            _discards=list(self._discards),
+            _tricks=[Trick(t.round_trump, list(t.plays)) for t in self._tricks],
+            _actions=list(self._actions),
+            # undoing restores the bidders an action replaced, so they must be the fork's
+            _applied=[
+                replace(applied, bidders=forked(applied.bidders))
+                for applied in self._applied
+            ],
+            _bidders=forked(self._bidders),
         )
-        non_bidder_base_scores = [
-            score for score in base_scores if score not in bidder_base_scores
-        ]
-        bidder_base_score = sum(map(lambda score: score.value, bidder_base_scores))
+        return fork
 
-        shot_the_moon = self.active_bid == BidAmount.SHOOT_THE_MOON and all(
-            score.identifier == bidder_identifier for score in base_scores
+    def apply(self, action: Action) -> None:
+        """
+        Perform an action as a player of the round so that it can be undone
+        The action is validated and performed exactly as act would
+        """
+        # actions replace the hand and bidders lists rather than change them,
+        # so holding the current ones is enough to restore them
+        applied = _Applied(
+            actions=len(self._actions),
+            tricks=len(self._tricks),
+            status=self._status,
+            active_seat=self._active_seat,
+            active_bid=self._active_bid,
+            bidders=self._bidders,
+            hand=(
+                self.players[self._active_seat].hand
+                if self._active_seat is not None
+                else []
+            ),
         )
-        met_bid = bidder_base_score >= acting_bid
-
-        if shot_the_moon:
-            return [Score(bidder_identifier, BidAmount.SHOOT_THE_MOON)]
-        if not met_bid:
-            return [Score(bidder_identifier, -1 * acting_bid)] + non_bidder_base_scores
-
-        return base_scores
+        self.act(action)
+        self._applied.append(applied)
+
+    def undo(self) -> Action:
+        """Reverse the most recent action, which must have been performed with apply"""
+        if not self._applied or self._applied[-1].actions != len(self._actions) - 1:
+            raise HundredAndTenError("The most recent action was not applied.")
+
+        applied = self._applied.pop()
+        action = self._actions.pop()
+        # remove any trick the action started
+        del self._tricks[applied.tricks :]
+        if isinstance(action, Bid):
+            self._bids.pop()
+        if isinstance(action, SelectTrump):
+            self._select_trump = None
+        if isinstance(action, Discard):
+            self._discards.pop()
+            self._deck.pulled -= len(action.cards)
+        if isinstance(action, Play):
+            self.active_trick.plays.pop()
+
+        assert applied.active_seat is not None
+        self.players[applied.active_seat].hand = applied.hand
+        self._status = applied.status
+        self._active_seat = applied.active_seat
+        self._active_bid = applied.active_bid
+        self._bidders = applied.bidders
+        self._scores = None
+        return action
+
+    def act(self, action: Action, validate: bool = True) -> None:
+        """
+        Perform an action as a player of the game
+        Validation should only be skipped for actions already known to be legal
+        """
+        # only name and time the span when something records it
+        if active_recorder() is None:
+            self.__act(action, validate)
+        else:
+            with span(_act_span(action)):
+                self.__act(action, validate)
 
-    def act(self, action: Action) -> None:
+    def __act(self, action: Action, validate: bool) -> None:
         """Perform an action as a player of the game"""
         if isinstance(action, Bid):
-            self.__bid(action)
-            self.__invalidate_cached_properties()
+            self.__bid(action, validate)
         if isinstance(action, SelectTrump):
-            self.__select_trump(action)
-            self.__invalidate_cached_properties()
+            self.__select_trump(action, validate)
         if isinstance(action, Discard):
-            self.__discard(action)
-            self.__invalidate_cached_properties()
-            self.__end_discard()
+            self.__discard(action, validate)
         if isinstance(action, Play):
-            self.__play(action)
-            self.__invalidate_cached_properties()
-            self.__end_play()
-        self.__invalidate_cached_properties()
+            self.__play(action, validate)
+        self._actions.append(action)
+        self._scores = None
 
-    def __bid(self, bid: Bid) -> None:
+    def __bid(self, bid: Bid, validate: bool) -> None:
         """Record a bid from a player"""
         identifier = bid.identifier
         amount = bid.amount
-        if (
-            self.status == Status.BIDDING
-            and self.active_player == player_by_identifier(self.players, identifier)
-        ):
-            self.__handle_bid(identifier, amount)
+        seat = self._seats.seat_of(identifier)
+        if validate:
+            if self.status != Status.BIDDING or self.active_seat != seat:
+                raise HundredAndTenError("Cannot bid out of order")
+            if amount not in self.available_bids(identifier):
+                raise HundredAndTenError(
+                    f"Player {identifier} cannot place a bid for {amount.value}"
+                )
+        self._bids.append(Bid(identifier, amount))
+
+        if amount == BidAmount.PASS:
+            self._bidders = [p for p in self._bidders if p != self.players[seat]]
+        if self._active_bid is None or amount > self._active_bid:
+            self._active_bid = amount
+
+        if self.active_bidder:
+            self._status = Status.TRUMP_SELECTION
+            self._active_seat = self._seats.seat_of(self.active_bidder.identifier)
+        elif not self._bidders:
+            self._status = Status.COMPLETED_NO_BIDDERS
+            self._active_seat = None
         else:
-            raise HundredAndTenError("Cannot bid out of order")
+            # the next player around the table that can still bid,
+            # returning to the bidder when no one else can
+            self._active_seat = next(
+                next_seat
+                for next_seat in self.__seats_after(seat)
+                if next_seat == seat or self.players[next_seat] in self._bidders
+            )
 
-    def __select_trump(self, select_trump: SelectTrump) -> None:
+    def __select_trump(self, select_trump: SelectTrump, validate: bool) -> None:
         """Select the passed suit as trump"""
+        if validate:
+            self.__validate_select_trump(select_trump)
+
+        self._select_trump = select_trump
+
+        # discarding starts with the player after the dealer
+        self._status = Status.DISCARD
+        self._active_seat = self._seats.seat_after(self._dealer_seat)
+
+    def __discard(self, discard: Discard, validate: bool) -> None:
+        """
+        Discard the selected cards from the identified player's hand and replace them
+        """
+        discarded = CardSet.of(discard.cards)
+        if validate:
+            self.__validate_discard(discard, discarded)
+
+        remaining = [c for c in self.active_player.hand if c not in discarded]
+
+        self.active_player.hand = [*remaining]
+        self.active_player.hand.extend(self.deck.draw(len(discard.cards)))
+        self._discards.append(discard)
+
+        if len(self._discards) < len(self.players):
+            self._active_seat = self._seats.seat_after(self.active_seat)
+            return
+
+        # the player after the bidder leads the first trick
+        assert self.active_bidder
+        self._status = Status.TRICKS
+        self._active_seat = self._seats.seat_after(
+            self._seats.seat_of(self.active_bidder.identifier)
+        )
+        self.__new_trick()
+
+    def __play(self, play: Play, validate: bool) -> None:
+        """Play the specified card from the identified player's hand"""
+        if validate:
+            self.__validate_play(play)
+
+        played = self.active_player.hand.index(play.card)
+        self.active_player.hand = [
+            *self.active_player.hand[:played],
+            *self.active_player.hand[played + 1 :],
+        ]
+        self.active_trick.plays.append(play)
+
+        if not self.active_player.hand and all(not p.hand for p in self.players):
+            self._status = Status.COMPLETED
+            self._active_seat = None
+        elif len(self.active_trick.plays) == len(self.players):
+            # the winner of a trick leads the next one
+            self._active_seat = self._seats.seat_of(
+                self.active_trick.winning_play.identifier
+            )
+            self.__new_trick()
+        else:
+            self._active_seat = self._seats.seat_after(self.active_seat)
+
+    def __validate_select_trump(self, select_trump: SelectTrump) -> None:
         if self.status != Status.TRUMP_SELECTION:
             raise HundredAndTenError(
                 "Cannot select trump outside of the trump selection phase."
@@ -311,41 +447,23 @@ class Round:
         ):
             raise HundredAndTenError("Only the bidder can select trump.")
 
-        self._select_trump = select_trump
-
-    def __discard(self, discard: Discard) -> None:
-        """
-        Discard the selected cards from the identified player's hand and replace them
-        """
+    def __validate_discard(self, discard: Discard, discarded: CardSet) -> None:
         if self.status != Status.DISCARD:
             raise HundredAndTenError("Cannot discard outside of the discard phase.")
         if discard.identifier != self.active_player.identifier:
             raise HundredAndTenError("Only the active player can discard.")
-        if any(card not in self.active_player.hand for card in discard.cards):
+        if not discarded <= self.active_player.hand_set:
             raise HundredAndTenError(
                 "You may only discard cards that are in your hand."
             )
 
-        remaining = list(
-            filter(lambda c: c not in discard.cards, self.active_player.hand)
-        )
-
-        self.active_player.hand = [*remaining]
-        self.active_player.hand.extend(self.deck.draw(len(discard.cards)))
-        self._discards.append(discard)
-
-    def __play(self, play: Play) -> None:
-        """Play the specified card from the identified player's hand"""
-
-        active_player_trump_cards = [
-            card
-            for card in self.active_player.hand
-            if card.trump_for_selection(self.trump)
-        ]
+    def __validate_play(self, play: Play) -> None:
+        hand = self.active_player.hand_set
+        active_player_trump_cards = hand.trumps(self.trump)
 
         if self.active_player.identifier != play.identifier:
             raise HundredAndTenError("Cannot play a card out of turn.")
-        if play.card not in self.active_player.hand:
+        if play.card not in hand:
             raise HundredAndTenError("Cannot play a card you do not have.")
         if (
             self.active_trick.bleeding
@@ -356,69 +474,86 @@ class Round:
                 "You must play a trump card when the trick is bleeding."
             )
 
-        self.active_player.hand.remove(play.card)
-        self.active_trick.plays.append(play)
-
     def available_bids(self, identifier: str) -> list[BidAmount]:
         """Compute the bid amounts available to the identified player"""
+        seat = self._seats.seat_of(identifier)
+        # the identified player must be able to submit a bid
+        if self.players[seat] not in self._bidders:
+            return []
         return [
             bid_amount
             for bid_amount in BidAmount
-            if self.__is_available_bid(identifier, bid_amount)
+            if self.__is_available_bid(seat, bid_amount)
         ]
 
-    def __handle_bid(self, identifier: str, amount: BidAmount) -> None:
-        if amount in self.available_bids(identifier):
-            self._bids.append(Bid(identifier, amount))
-        else:
-            raise HundredAndTenError(
-                f"Player {identifier} cannot place a bid for {amount.value}"
-            )
-
-    def __is_available_bid(self, identifier: str, amount: BidAmount) -> bool:
-        """Determine if the listed bid amount is available to the listed player"""
-        player = player_by_identifier(self.players, identifier)
+    def __is_available_bid(self, seat: int, amount: BidAmount) -> bool:
+        """Determine if the listed bid amount is available to the player in the seat"""
         return (
-            # the identified player must be able to submit a bid
-            player in self.bidders
-            and
             # pass is always available as a bid
-            (
-                amount == BidAmount.PASS
-                or
-                # no active bid means every bid is available
-                not self.active_bid
-                # if there is an active bid, the specified bid must be larger
-                or amount > self.active_bid
-                # unless the player is the dealer,
-                # in which case it can be the same as the active bid
-                or (self.dealer.identifier == identifier and amount == self.active_bid)
+            amount == BidAmount.PASS
+            or
+            # no active bid means every bid is available
+            not self._active_bid
+            # if there is an active bid, the specified bid must be larger
+            or amount > self._active_bid
+            # unless the player is the dealer,
+            # in which case it can be the same as the active bid
+            or (seat == self._dealer_seat and amount == self._active_bid)
+        )
+
+    def __scores(self) -> list[Score]:
+        winning_plays = [trick.winning_play for trick in self.tricks if trick.plays]
+
+        trump_wins = [
+            play for play in winning_plays if play.card.trump_for_selection(self.trump)
+        ]
+        highest_play = max(
+            trump_wins, key=lambda play: play.card.trump_value, default=None
+        )
+
+        base_scores = list(
+            map(
+                lambda play: Score(
+                    play.identifier,
+                    TRICK_VALUE +
+                    # treat the highest value play as two tricks
+                    (TRICK_VALUE if play == highest_play else 0),
+                ),
+                winning_plays,
             )
         )
 
-    def __current_bid(self, identifier: str) -> Optional[Bid]:
-        """Return the most recent bid for the provided player"""
-        loc_index = max(
-            (loc for loc, val in enumerate(self.bids) if val.identifier == identifier),
-            default=None,
+        # use default values here so scores can be calculated before tricks are played
+        # should return all zeros
+        acting_bidder = self.active_bidder or self.players[0]
+        acting_bid = self.active_bid or BidAmount.PASS
+
+        bidder_identifier = acting_bidder.identifier
+        bidder_base_scores = list(
+            filter(lambda score: score.identifier == bidder_identifier, base_scores)
+        )
+        non_bidder_base_scores = [
+            score for score in base_scores if score not in bidder_base_scores
+        ]
+        bidder_base_score = sum(map(lambda score: score.value, bidder_base_scores))
+
+        shot_the_moon = self.active_bid == BidAmount.SHOOT_THE_MOON and all(
+            score.identifier == bidder_identifier for score in base_scores
         )
-        return self.bids[loc_index] if loc_index is not None else None
+        met_bid = bidder_base_score >= acting_bid
 
-    def __end_discard(self) -> None:
-        if self.status == Status.TRICKS:
-            self.__new_trick()
+        if shot_the_moon:
+            return [Score(bidder_identifier, BidAmount.SHOOT_THE_MOON)]
+        if not met_bid:
+            return [Score(bidder_identifier, -1 * acting_bid)] + non_bidder_base_scores
 
-    def __end_play(self) -> None:
-        if self.status == Status.TRICKS and len(self.active_trick.plays) == len(
-            self.players
-        ):
-            self.__new_trick()
+        return base_scores
+
+    def __seats_after(self, seat: int) -> list[int]:
+        """Every seat in turn order after the provided one, ending with it"""
+        count = len(self.players)
+        return [(seat + offset) % count for offset in range(1, count + 1)]
 
     def __new_trick(self) -> None:
         assert self.trump
         self.tricks.append(Trick(self.trump))
-
-    def __invalidate_cached_properties(self) -> None:
-        for name, value in type(self).__dict__.items():
-            if isinstance(value, cached_property):
-                self.__dict__.pop(name, None)
@@ -0,0 +1,275 @@
+"""
+Solve the trick phase of a round with every hand known, as in double dummy bridge
+
+Once the discards are drawn, the rest of a round is a game of perfect information
+when every hand is known: the bidder tries to score as much as they can, and every
+other player tries to stop them.
+
+Every card in a hand is played by the end of the round, so the highest trump among
+them always wins its trick and the bonus for it goes to whoever holds it, however
+the round is played. The bidder's score is then decided by the number of tricks they
+win, and never falls as that grows, so the solver searches for the most tricks the
+bidder can be sure of winning.
+
+The search is alpha-beta over hands held as bitmasks over Card.index, as in CardSet,
+with the bounds it finds kept in a transposition table keyed by the remaining hands,
+the cards in the trick in progress and the seat that led it. Cards in the same hand
+with no other remaining card ranked between them win and lose the same tricks, so
+only the highest of them is searched.
+"""
+
+from hundredandten.deck import (
+    ALL_CARDS,
+    SUIT_INDICES,
+    TRICK_RANKS,
+    TRUMP_MASKS,
+    TRUMP_VALUES_BY_SELECTION,
+    WEAK_TRUMP_VALUES,
+    Card,
+    CardSuit,
+)
+
+from .constants import HAND_SIZE, TRICK_VALUE, BidAmount, Status
+from .errors import HundredAndTenError
+from .round import Round
+
+type _Key = tuple[tuple[int, ...], tuple[int, ...], int]
+
+_BITS = tuple(1 << card.index for card in ALL_CARDS)
+# a window wide enough for any number of tricks
+_WINDOW = (-1, HAND_SIZE + 1)
+# under each trump, the groups of cards that rank against each other from highest
+# to lowest: the trumps, then the cards of each suit that are not trump
+_CLASSES = tuple(
+    tuple(
+        group
+        for group in (
+            sorted(
+                (card for card in range(len(ALL_CARDS)) if values[card] >= 0),
+                key=values.__getitem__,
+                reverse=True,
+            ),
+            *(
+                sorted(
+                    (
+                        card
+                        for card in range(len(ALL_CARDS))
+                        if values[card] < 0 and SUIT_INDICES[card] == suit
+                    ),
+                    key=WEAK_TRUMP_VALUES.__getitem__,
+                    reverse=True,
+                )
+                for suit in range(len(CardSuit))
+            ),
+        )
+        if group
+    )
+    for values in TRUMP_VALUES_BY_SELECTION
+)
+
+
+class DoubleDummySolver:
+    """
+    Solve rounds in the trick phase with every hand known.
+
+    What the solver finds is kept between calls, so solving later positions of the
+    same deal, or other deals with the same trump and bidder, reuses it.
+    """
+
+    def __init__(self) -> None:
+        self.__tables: dict[tuple[int, int], dict[_Key, tuple[int, int]]] = {}
+        self.__table: dict[_Key, tuple[int, int]] = {}
+        self.__trump = 0
+        self.__bidder = 0
+        # the remaining hand of each seat as a mask, changed and restored while searching
+        self.__hands: list[int] = []
+        # the number of positions searched, for analysis
+        self.nodes = 0
+
+    def tricks(self, game_round: Round) -> int:
+        """The most of the tricks left in the round the bidder can be sure to win"""
+        trick, leader = self.__position(game_round)
+        return self.__search(trick, leader, _WINDOW)
+
+    def score(self, game_round: Round) -> int:
+        """The bidder's score for the round when every player plays their best"""
+        return self.__score(game_round, self.tricks(game_round))
+
+    def play_scores(self, game_round: Round) -> dict[Card, int]:
+        """
+        The bidder's score for the round after each card the active player can play,
+        when every player plays their best from then on
+        """
+        trick, leader = self.__position(game_round)
+        hand = self.__hands[(leader + len(trick)) % len(self.__hands)]
+        return {
+            ALL_CARDS[card]: self.__score(
+                game_round, self.__play(trick, leader, card, _WINDOW)
+            )
+            for card in _cards(self.__legal(hand, trick))
+        }
+
+    def clear(self) -> None:
+        """Forget every position found so far"""
+        self.__tables.clear()
+        self.__table = {}
+
+    def __position(self, game_round: Round) -> tuple[tuple[int, ...], int]:
+        """
+        The cards in the trick in progress and the seat that led it, ready to be
+        searched with the round's trump, bidder and remaining hands
+        """
+        if game_round.status != Status.TRICKS:
+            raise HundredAndTenError(
+                f"Cannot solve a round in {game_round.status} status"
+            )
+        assert game_round.trump is not None and game_round.active_bidder is not None
+        self.__trump = game_round.trump.index
+        self.__bidder = game_round.seats.seat_of(game_round.active_bidder.identifier)
+        self.__table = self.__tables.setdefault((self.__trump, self.__bidder), {})
+
+        plays = game_round.active_trick.plays
+        leader = (
+            game_round.seats.seat_of(plays[0].identifier)
+            if plays
+            else game_round.active_seat
+        )
+        self.__hands = [
+            sum(_BITS[card.index] for card in p.hand) for p in game_round.players
+        ]
+        return tuple(play.card.index for play in plays), leader
+
+    def __score(self, game_round: Round, tricks: int) -> int:
+        """The bidder's score for the round if they win that many more tricks"""
+        assert game_round.active_bidder is not None and game_round.active_bid
+        bidder = game_round.active_bidder.identifier
+        won = tricks + sum(
+            trick.winning_play.identifier == bidder for trick in game_round.tricks[:-1]
+        )
+        if game_round.active_bid == BidAmount.SHOOT_THE_MOON:
+            return BidAmount.SHOOT_THE_MOON * (1 if won == HAND_SIZE else -1)
+        points = TRICK_VALUE * (won + (_highest_trump(game_round) == bidder))
+        return points if points >= game_round.active_bid else -game_round.active_bid
+
+    def __legal(self, hand: int, trick: tuple[int, ...]) -> int:
+        """The cards of the hand that can be played into the trick"""
+        if trick and _BITS[trick[0]] & TRUMP_MASKS[self.__trump]:
+            # a trump was led, so trump must be played if it can be
+            return hand & TRUMP_MASKS[self.__trump] or hand
+        return hand
+
+    def __play(
+        self, trick: tuple[int, ...], leader: int, card: int, window: tuple[int, int]
+    ) -> int:
+        """The most tricks the bidder can be sure to win after the card is played"""
+        hands = self.__hands
+        mover = (leader + len(trick)) % len(hands)
+        hands[mover] ^= _BITS[card]
+        played = (*trick, card)
+        if len(played) < len(hands):
+            value = self.__search(played, leader, window)
+        else:
+            ranks = TRICK_RANKS[self.__trump][SUIT_INDICES[played[0]]]
+            best = max(range(len(played)), key=lambda offset: ranks[played[offset]])
+            winner = (leader + best) % len(hands)
+            won = int(winner == self.__bidder)
+            value = won + self.__search((), winner, (window[0] - won, window[1] - won))
+        hands[mover] ^= _BITS[card]
+        return value
+
+    def __search(
+        self, trick: tuple[int, ...], leader: int, window: tuple[int, int]
+    ) -> int:
+        """
+        The most tricks the bidder can be sure to win from the position, if it is
+        within the window, or else a bound beyond it
+        """
+        self.nodes += 1
+        mover = (leader + len(trick)) % len(self.__hands)
+        hand = self.__hands[mover]
+        if not hand:
+            return 0
+
+        key = (tuple(self.__hands), trick, leader)
+        # the mover has a card for each trick left, including the one in progress
+        lower, upper = self.__table.get(key, (0, hand.bit_count()))
+        if lower >= window[1] or lower == upper:
+            return lower
+        if upper <= window[0]:
+            return upper
+        window = max(window[0], lower), min(window[1], upper)
+        alpha, beta = window
+
+        maximizing = mover == self.__bidder
+        best = -1 if maximizing else HAND_SIZE + 1
+        for card in _representatives(
+            self.__legal(hand, trick),
+            hand,
+            sum(self.__hands) | sum(_BITS[played] for played in trick),
+            self.__trump,
+        ):
+            value = self.__play(trick, leader, card, (alpha, beta))
+            if maximizing and value > best:
+                best, alpha = value, max(alpha, value)
+            elif not maximizing and value < best:
+                best, beta = value, min(beta, value)
+            if alpha >= beta:
+                break
+
+        if best <= window[0]:
+            upper = best
+        elif best >= window[1]:
+            lower = best
+        else:
+            lower = upper = best
+        self.__table[key] = (lower, upper)
+        return best
+
+
+def _cards(mask: int) -> list[int]:
+    """The index of each card in the mask"""
+    return [card for card, bit in enumerate(_BITS) if mask & bit]
+
+
+def _representatives(legal: int, hand: int, live: int, trump: int) -> list[int]:
+    """
+    One card of the legal cards for each run of cards in the hand with no other
+    live card ranked between them, highest first
+    """
+    cards = []
+    for group in _CLASSES[trump]:
+        held = False
+        for card in group:
+            bit = _BITS[card]
+            if not live & bit:
+                continue
+            if legal & bit and not held:
+                cards.append(card)
+            held = bool(hand & bit)
+    return cards
+
+
+def _highest_trump(game_round: Round) -> str | None:
+    """
+    The identifier of the player holding, or having played, the highest trump of the
+    round, who wins the trick it is played in and the bonus for it
+    """
+    assert game_round.trump is not None
+    values = TRUMP_VALUES_BY_SELECTION[game_round.trump.index]
+    held = [
+        (play.card, play.identifier)
+        for trick in game_round.tricks
+        for play in trick.plays
+    ] + [
+        (card, player.identifier)
+        for player in game_round.players
+        for card in player.hand
+    ]
+    trumps = [(values[card.index], identifier) for card, identifier in held]
+    highest = max(trumps)
+    return highest[1] if highest[0] >= 0 else None
+
+
+def solve(game_round: Round) -> int:
+    """The bidder's score for a round in the trick phase when every player plays their best"""
+    return DoubleDummySolver().score(game_round)
@@ -29,7 +29,7 @@ class Trick:
         """Determine the winner of the trick considering the passed suit as trump"""
 
         strong_trump_winner = self.__winning_play(
-            lambda play: play.card.suit == self.round_trump or play.card.always_trump,
+            lambda play: play.card.trump_for_selection(self.round_trump),
             lambda play: play.card.trump_value,
         )
 
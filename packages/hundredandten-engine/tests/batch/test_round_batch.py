@@ -0,0 +1,219 @@
+"""Test playing many rounds at once against the rounds of the object engine"""
+
+from unittest import TestCase
+
+import numpy as np
+from hundredandten.deck import ALL_CARDS, CardSet, SelectableSuit
+from hundredandten.engine.actions import Action, Bid, Discard, Play, SelectTrump
+from hundredandten.engine.batch import BIDS, NO_SEAT, RoundBatch
+from hundredandten.engine.constants import BidAmount, Status
+from hundredandten.engine.errors import HundredAndTenError
+from hundredandten.engine.player import Player
+from hundredandten.engine.round import Round
+
+SUITS = sorted(SelectableSuit, key=lambda suit: suit.index)
+COMPLETED = (Status.COMPLETED, Status.COMPLETED_NO_BIDDERS)
+
+
+def new_rounds(
+    seeds: list[str], dealers: list[int], num_players: int
+) -> tuple[RoundBatch, list[Round]]:
+    """The same rounds as a batch and as engine rounds"""
+    players = [Player(str(seat)) for seat in range(num_players)]
+    rounds = [
+        Round(game_players=players, dealer_identifier=str(dealer), seed=seed)
+        for seed, dealer in zip(seeds, dealers)
+    ]
+    return RoundBatch.of_seeds(seeds, dealers, num_players), rounds
+
+
+def engine_action(game_round: Round, action: int) -> Action:
+    """The engine action for the batch action taken in the round"""
+    identifier = game_round.active_player.identifier
+    match game_round.status:
+        case Status.BIDDING:
+            return Bid(identifier, BidAmount(action))
+        case Status.TRUMP_SELECTION:
+            return SelectTrump(identifier, SUITS[action])
+        case Status.DISCARD:
+            return Discard(identifier, list(CardSet(action)))
+    return Play(identifier, ALL_CARDS[action])
+
+
+def playable(game_round: Round) -> set[int]:
+    """The index of every card the round accepts from its active player"""
+    player = game_round.active_player
+    cards = set()
+    for card in player.hand:
+        try:
+            game_round.fork().act(Play(player.identifier, card))
+            cards.add(card.index)
+        except HundredAndTenError:
+            pass
+    return cards
+
+
+def round_scores(game_round: Round, num_players: int) -> list[int]:
+    """The points each seat earned in the round"""
+    scores = [0] * num_players
+    for score in game_round.scores:
+        scores[int(score.identifier)] += score.value
+    return scores
+
+
+class TestRoundBatch(TestCase):
+    """Unit tests for the batched round engine"""
+
+    def assert_matches(self, batch: RoundBatch, rounds: list[Round]) -> None:
+        """Each row of the batch is in the same state as the matching round"""
+        bids = batch.legal_bids()
+        plays = batch.legal_plays()
+        for row, game_round in enumerate(rounds):
+            status = game_round.status
+            self.assertEqual(status.value, batch.status[row])
+            self.assertEqual(
+                [CardSet.of(p.hand).mask for p in game_round.players],
+                batch.hands[row].tolist(),
+            )
+            active_bid = game_round.active_bid
+            self.assertEqual(
+                -1 if active_bid is None else active_bid, batch.active_bid[row]
+            )
+            trump = game_round.trump
+            self.assertEqual(-1 if trump is None else trump.index, batch.trump[row])
+            self.assertEqual(
+                [
+                    int(trick.winning_play.identifier)
+                    for trick in game_round.tricks
+                    if len(trick.plays) == len(game_round.players)
+                ],
+                batch.winners[row, : batch.tricks[row]].tolist(),
+            )
+            if status in COMPLETED:
+                self.assertEqual(NO_SEAT, batch.active[row])
+                continue
+
+            self.assertEqual(game_round.active_seat, batch.active[row])
+            identifier = game_round.active_player.identifier
+            self.assertEqual(
+                (
+                    sorted(game_round.available_bids(identifier))
+                    if status == Status.BIDDING
+                    else []
+                ),
+                BIDS[bids[row]].tolist(),
+            )
+            self.assertEqual(
+                playable(game_round) if status == Status.TRICKS else set(),
+                {card.index for card in CardSet(int(plays[row]))},
+            )
+
+    def test_matches_rounds(self):
+        """Random legal actions leave the batch in the same state as the rounds"""
+        for num_players in (2, 3, 4):
+            rng = np.random.default_rng(num_players)
+            seeds = [f"batch-{num_players}-{i}" for i in range(40)]
+            dealers = rng.integers(0, num_players, len(seeds)).tolist()
+            batch, rounds = new_rounds(seeds, dealers, num_players)
+
+            while not batch.completed.all():
+                self.assert_matches(batch, rounds)
+                actions = batch.random_actions(rng)
+                for game_round, action in zip(rounds, actions.tolist()):
+                    if game_round.status not in COMPLETED:
+                        game_round.act(engine_action(game_round, action))
+                batch.act(actions)
+
+            self.assert_matches(batch, rounds)
+            for row, game_round in enumerate(rounds):
+                self.assertEqual(
+                    round_scores(game_round, num_players), batch.scores[row].tolist()
+                )
+
+    def test_play_random(self):
+        """Random play completes every round"""
+        batch = RoundBatch.of_seeds([str(i) for i in range(50)], [0] * 50, 3)
+
+        batch.play_random(np.random.default_rng(0))
+
+        self.assertTrue(batch.completed.all())
+        self.assertTrue((batch.random_actions(np.random.default_rng(0)) == 0).all())
+
+    def test_dealer_takes_bid(self):
+        """The dealer can take the active bid, and others must bid above it"""
+        batch = RoundBatch.of_seeds(["a", "b"], [0, 2], 3)
+
+        batch.act([BidAmount.TWENTY, BidAmount.TWENTY])
+        self.assertEqual(
+            [[True, False, False, True, True, True]] * 2, batch.legal_bids().tolist()
+        )
+
+        batch.act([BidAmount.PASS, BidAmount.TWENTY_FIVE])
+        self.assertEqual(
+            [
+                [True, False, True, True, True, True],
+                [True, False, False, True, True, True],
+            ],
+            batch.legal_bids().tolist(),
+        )
+
+    def test_unavailable_actions(self):
+        """An unavailable action in any round is rejected before any round changes"""
+        batch = RoundBatch.of_seeds(["a", "b", "c", "d"], [0, 0, 0, 0], 2)
+        batch.act([15, 0, 15, 15])
+        batch.act([20, 0, 0, 20])
+        batch.act([0, 0, 0, 25])
+        # rounds selecting trump, completed without bidders, discarding and bidding
+        self.assertEqual(
+            [
+                Status.TRUMP_SELECTION.value,
+                Status.COMPLETED_NO_BIDDERS.value,
+                Status.DISCARD.value,
+                Status.BIDDING.value,
+            ],
+            batch.status.tolist(),
+        )
+        hand = int(batch.hands[2, batch.active[2]])
+        outside = next(c for c in range(len(ALL_CARDS)) if not hand >> c & 1)
+        valid = [0, 0, hand, BidAmount.PASS]
+
+        for row, action in (
+            (0, -1),
+            (0, 4),
+            (2, -1),
+            (2, hand | 1 << outside),
+            (3, 16),
+            (3, 20),
+            (3, 61),
+            (3, -15),
+        ):
+            actions = list(valid)
+            actions[row] = action
+            before = batch.status.copy(), batch.hands.copy()
+            self.assertRaises(HundredAndTenError, batch.act, actions)
+            np.testing.assert_array_equal(before[0], batch.status)
+            np.testing.assert_array_equal(before[1], batch.hands)
+
+        batch.act(valid)
+
+    def test_unavailable_plays(self):
+        """Cards that are not playable, or are not cards, are rejected"""
+        batch = RoundBatch.of_seeds(["a", "b", "c"], [0] * 3, 2)
+        for actions in ([15] * 3, [0] * 3, [0] * 3, [0] * 3, [0] * 3):
+            batch.act(actions)
+        self.assertTrue((batch.status == Status.TRICKS.value).all())
+        legal = batch.legal_plays()
+
+        for action in (-1, len(ALL_CARDS)):
+            self.assertRaises(HundredAndTenError, batch.act, [action] * 3)
+        outside = [
+            next(c for c in range(len(ALL_CARDS)) if not int(mask) >> c & 1)
+            for mask in legal
+        ]
+        self.assertRaises(HundredAndTenError, batch.act, outside)
+
+    def test_wrong_shapes(self):
+        """Exactly one dealer and one action are needed for each round"""
+        self.assertRaises(ValueError, RoundBatch.of_seeds, ["a", "b"], [0], 2)
+        batch = RoundBatch.of_seeds(["a", "b"], [0, 0], 2)
+        self.assertRaises(ValueError, batch.act, [0])
@@ -120,3 +120,30 @@ class TestBidding(TestCase):
             game.act,
             Bid(game.active_round.inactive_players[0].identifier, BidAmount.FIFTEEN),
         )
+
+    def test_no_available_bids_for_passed_player(self):
+        """A player that passed has no bids available"""
+
+        game = arrange.game(Status.BIDDING)
+
+        once_active_player = game.active_round.active_player.identifier
+        game.act(Bid(once_active_player, BidAmount.PASS))
+
+        self.assertEqual([], game.active_round.available_bids(once_active_player))
+
+    def test_active_seat_follows_bids(self):
+        """The active seat moves around the table past players that passed"""
+
+        game = arrange.game(Status.BIDDING)
+        game_round = game.active_round
+
+        self.assertEqual(0, game_round.dealer_seat)
+        self.assertEqual(1, game_round.active_seat)
+        game.act(Bid("1", BidAmount.PASS))
+        game.act(Bid("2", BidAmount.FIFTEEN))
+        game.act(Bid("3", BidAmount.PASS))
+        game.act(Bid("0", BidAmount.FIFTEEN))
+
+        self.assertEqual(2, game_round.active_seat)
+        self.assertEqual(game.players[2], game.active_player)
+        self.assertEqual(2, game.seats.seat_of(game.active_player.identifier))
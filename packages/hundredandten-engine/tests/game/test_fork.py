@@ -0,0 +1,149 @@
+"""Test forking games and rounds to explore actions without changing the original"""
+
+from random import Random
+from unittest import TestCase
+
+from hundredandten.deck import SelectableSuit
+from hundredandten.engine import Game
+from hundredandten.engine.actions import Bid, Discard, Play, SelectTrump
+from hundredandten.engine.constants import BidAmount, Status
+from hundredandten.engine.round import Round
+from hundredandten.testing import arrange
+
+
+def snapshot(game_round: Round) -> tuple:
+    """Everything about a round that acting on it can change"""
+    return (
+        game_round.status,
+        [list(p.hand) for p in game_round.players],
+        list(game_round.actions),
+        [list(trick.plays) for trick in game_round.tricks],
+        list(game_round.bidders),
+        game_round.active_bid,
+        game_round.deck.pulled,
+    )
+
+
+def play_randomly(game: Game, rng: Random, until: Status = Status.WON) -> None:
+    """Play cards and discards chosen by the random generator until the game is in a status"""
+    while game.status != until:
+        game_round = game.active_round
+        player = game_round.active_player
+        if game.status == Status.BIDDING:
+            # the first bidder takes the round for the lowest amount
+            amount = BidAmount.PASS if game_round.active_bid else BidAmount.FIFTEEN
+            game.act(Bid(player.identifier, amount))
+        elif game.status == Status.TRUMP_SELECTION:
+            arrange.select_trump(game)
+        elif game.status == Status.DISCARD:
+            game.act(Discard(player.identifier, player.hand[: rng.randint(0, 5)]))
+        else:
+            trumps = [c for c in player.hand if c.trump_for_selection(game_round.trump)]
+            bleeding = game_round.active_trick.bleeding and trumps
+            game.act(
+                Play(player.identifier, rng.choice(trumps if bleeding else player.hand))
+            )
+
+
+class TestFork(TestCase):
+    """Unit tests for forking games and rounds"""
+
+    def test_round_fork_matches_original(self):
+        """A forked round starts in the same state as the original"""
+        game = arrange.game(Status.TRICKS)
+        arrange.play_trick(game)
+
+        fork = game.active_round.fork()
+
+        self.assertEqual(snapshot(game.active_round), snapshot(fork))
+        self.assertEqual(game.active_round.active_player, fork.active_player)
+        self.assertEqual(game.active_round.scores, fork.scores)
+
+    def test_acting_on_round_fork_leaves_original(self):
+        """Playing through a forked round does not change the original"""
+        game = arrange.game(Status.TRICKS)
+        original = game.active_round
+        before = snapshot(original)
+
+        fork = original.fork()
+        while fork.status == Status.TRICKS:
+            player = fork.active_player
+            trumps = [c for c in player.hand if c.trump_for_selection(fork.trump)]
+            fork.act(Play(player.identifier, (trumps + player.hand)[0]))
+
+        self.assertEqual(Status.COMPLETED, fork.status)
+        self.assertEqual(before, snapshot(original))
+
+    def test_acting_on_original_leaves_round_fork(self):
+        """Acting on the original round does not change a fork of it"""
+        game = arrange.game(Status.DISCARD)
+        fork = game.active_round.fork()
+        before = snapshot(fork)
+
+        arrange.discard(game)
+        game.act(
+            Play(
+                game.active_player.identifier,
+                game.active_round.active_player.hand[0],
+            )
+        )
+
+        self.assertEqual(before, snapshot(fork))
+
+    def test_round_fork_bidding(self):
+        """Bidding in a forked round does not change who can bid in the original"""
+        game = arrange.game(Status.BIDDING)
+        fork = game.active_round.fork()
+
+        fork.act(Bid(fork.active_player.identifier, BidAmount.PASS))
+
+        self.assertEqual(len(game.players), len(game.active_round.bidders))
+        self.assertEqual(len(game.players) - 1, len(fork.bidders))
+        self.assertTrue(all(p in fork.players for p in fork.bidders))
+        self.assertNotEqual(game.active_round.active_player, fork.active_player)
+
+    def test_game_fork_shares_completed_rounds(self):
+        """A forked game shares completed rounds and copies the active one"""
+        game = arrange.game(Status.COMPLETED_NO_BIDDERS)
+        arrange.bid(game)
+
+        fork = game.fork()
+
+        self.assertIs(game.rounds[0], fork.rounds[0])
+        self.assertIsNot(game.active_round, fork.active_round)
+        self.assertEqual(game.seed, fork.seed)
+        self.assertEqual(game.scores_by_round, fork.scores_by_round)
+
+        fork.act(SelectTrump(fork.active_player.identifier, SelectableSuit.HEARTS))
+
+        self.assertEqual(Status.TRUMP_SELECTION, game.status)
+        self.assertEqual(Status.DISCARD, fork.status)
+
+    def test_game_fork_plays_out_like_original(self):
+        """A forked game given the same actions ends the same as the original"""
+        game = arrange.game(Status.BIDDING, seed="fork-seed")
+        play_randomly(game, Random(7), until=Status.TRICKS)
+
+        fork = game.fork()
+        play_randomly(game, Random(8))
+        play_randomly(fork, Random(8))
+
+        self.assertEqual(game.actions, fork.actions)
+        self.assertEqual(game.scores, fork.scores)
+        self.assertEqual(game.score_history, fork.score_history)
+        self.assertEqual(game.winner, fork.winner)
+        self.assertEqual(len(game.rounds), len(fork.rounds))
+
+    def test_game_fork_keeps_original_scores(self):
+        """Finishing a forked game does not change the scores of the original"""
+        game = arrange.game(Status.TRICKS)
+        fork = game.fork()
+
+        play_randomly(fork, Random(3))
+
+        self.assertEqual(Status.WON, fork.status)
+        self.assertEqual(Status.TRICKS, game.status)
+        self.assertEqual({p.identifier: 0 for p in game.players}, game.scores)
+        self.assertEqual([], game.score_history)
+        self.assertEqual(1, len(game.scores_by_round))
+        self.assertIsNone(game.winner)
@@ -2,8 +2,9 @@
 
 from unittest import TestCase
 
-from hundredandten.engine import Bid
+from hundredandten.engine import Bid, Game
 from hundredandten.engine.constants import WINNING_SCORE, BidAmount, Status
+from hundredandten.engine.trick import Score
 from hundredandten.testing import arrange
 
 # tests in this file run off of seeded games to avoid setting up everything necessary for the tests
@@ -21,6 +22,28 @@ SEEDS_TO_SCORES = {
 }
 
 
+def reference_scores(game: Game, to_round: int) -> dict[str, int]:
+    """The totals of every completed round before the provided one, summed from scratch"""
+    scores = {player.identifier: 0 for player in game.players}
+    for game_round in game.rounds[:to_round]:
+        if game_round.status == Status.COMPLETED:
+            for score in game_round.scores:
+                scores[score.identifier] += score.value
+    return scores
+
+
+def reference_score_history(game: Game) -> list[Score]:
+    """The running total after every score of every completed round"""
+    scores: dict[str, int] = {}
+    history = []
+    for game_round in game.rounds:
+        if game_round.status == Status.COMPLETED:
+            for score in game_round.scores:
+                scores[score.identifier] = scores.get(score.identifier, 0) + score.value
+                history.append(Score(score.identifier, scores[score.identifier]))
+    return history
+
+
 class TestGameScoring(TestCase):
     """Unit tests for scoring a game"""
 
@@ -96,3 +119,39 @@ class TestGameScoring(TestCase):
         self.assertIsNone(result)
         # Verify no new rounds created
         self.assertEqual(len(game.rounds), rounds_before)
+
+    def test_running_totals_match_rescanning_rounds(self):
+        """Totals kept as rounds end match summing every round from scratch"""
+        for seed in SEEDS_TO_SCORES:
+            game = arrange.game(Status.BIDDING, seed=seed)
+            while game.status != Status.WON:
+                arrange.pass_round(game)
+                arrange.bid(game)
+                arrange.select_trump(game)
+                arrange.discard(game)
+                arrange.play_round(game)
+
+                self.assertEqual(reference_scores(game, len(game.rounds)), game.scores)
+                self.assertEqual(reference_score_history(game), game.score_history)
+                self.assertEqual(
+                    [
+                        reference_scores(game, to_round)
+                        for to_round in range(len(game.scores_by_round))
+                    ],
+                    game.scores_by_round,
+                )
+
+            # the totals after the winning round are included
+            self.assertEqual(len(game.rounds) + 1, len(game.scores_by_round))
+
+    def test_scores_are_copies(self):
+        """Changing returned scores does not change the game"""
+        game = arrange.game(Status.BIDDING)
+
+        game.scores["0"] = WINNING_SCORE
+        game.scores_by_round[-1]["0"] = WINNING_SCORE
+        game.score_history.append(Score("0", WINNING_SCORE))
+
+        self.assertEqual(0, game.scores["0"])
+        self.assertEqual(0, game.scores_by_round[-1]["0"])
+        self.assertEqual([], game.score_history)
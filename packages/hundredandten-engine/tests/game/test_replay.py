@@ -0,0 +1,113 @@
+"""Test encoding games to action logs and replaying games from them"""
+
+from random import Random
+from unittest import TestCase
+
+from hundredandten.deck import SelectableSuit
+from hundredandten.engine import Game
+from hundredandten.engine.actions import Bid, Discard, Play, SelectTrump
+from hundredandten.engine.constants import BidAmount, Status
+from hundredandten.engine.errors import HundredAndTenError
+from hundredandten.engine.player import Player
+from hundredandten.engine.replay import FORMAT, encode, replay
+
+
+def play_randomly(game: Game, rng: Random, rounds: int) -> None:
+    """Take random legal actions until the game is won or has played enough rounds"""
+    while game.status != Status.WON and len(game.rounds) <= rounds:
+        game_round = game.active_round
+        player = game_round.active_player
+        identifier = player.identifier
+        if game.status == Status.BIDDING:
+            amount = rng.choice(game_round.available_bids(identifier))
+            game.act(Bid(identifier, amount))
+        elif game.status == Status.TRUMP_SELECTION:
+            game.act(SelectTrump(identifier, rng.choice(list(SelectableSuit))))
+        elif game.status == Status.DISCARD:
+            game.act(
+                Discard(identifier, [c for c in player.hand if rng.random() < 0.5])
+            )
+        else:
+            trumps = [c for c in player.hand if c.trump_for_selection(game_round.trump)]
+            bleeding = game_round.active_trick.bleeding and trumps
+            game.act(Play(identifier, rng.choice(trumps if bleeding else player.hand)))
+
+
+def new_players(count: int) -> list[Player]:
+    """Players identified by their seat"""
+    return [Player(str(i)) for i in range(count)]
+
+
+class TestReplay(TestCase):
+    """Unit tests for encoding and replaying games"""
+
+    def test_replay_matches_game(self):
+        """Replaying the log of a game rebuilds the same game"""
+        rng = Random("replay")
+        for game_number in range(30):
+            players = new_players(2 + game_number % 3)
+            game = Game(players=players, seed=str(game_number))
+            play_randomly(game, rng, rounds=8)
+
+            log = encode(game)
+            self.assertEqual(1 + 2 * len(game.actions), len(log))
+
+            for validate in (True, False):
+                replayed = replay(players, game.seed, log, validate=validate)
+                self.assertEqual(game.actions, replayed.actions)
+                self.assertEqual(game.status, replayed.status)
+                self.assertEqual(game.scores, replayed.scores)
+                self.assertEqual(
+                    game.active_round.players, replayed.active_round.players
+                )
+
+    def test_replay_empty_game(self):
+        """A game without any actions replays to a new game"""
+        players = new_players(4)
+        game = Game(players=players, seed="empty")
+
+        self.assertEqual(bytes([FORMAT]), encode(game))
+        self.assertEqual([], replay(players, "empty", encode(game)).actions)
+
+    def test_unrecognized_logs(self):
+        """Logs that were not encoded in the current format are rejected"""
+        players = new_players(2)
+        game = Game(players=players, seed="unrecognized")
+        game.act(Bid("1", BidAmount.FIFTEEN))
+        log = encode(game)
+
+        for unrecognized in (
+            b"",
+            bytes([FORMAT + 1]) + log[1:],
+            log[:-1],
+            # a seat past the last player
+            bytes([FORMAT, 3, 0]),
+            # a bid amount past the last one
+            bytes([FORMAT, 1, len(BidAmount)]),
+            # a card past the last one
+            bytes([FORMAT, 3 << 2 | 1, 53]),
+        ):
+            self.assertRaises(
+                HundredAndTenError, replay, players, "unrecognized", unrecognized
+            )
+
+    def test_replay_validates(self):
+        """Actions in the log are validated by default"""
+        players = new_players(2)
+        # the dealer cannot bid first
+        log = bytes([FORMAT, 0, 1])
+
+        self.assertRaises(HundredAndTenError, replay, players, "invalid", log)
+
+    def test_replay_without_validation(self):
+        """Skipping validation performs actions without checking them"""
+        players = new_players(2)
+        game = Game(players=players, seed="trusted")
+        game.act(Bid("1", BidAmount.FIFTEEN))
+        game.act(Bid("0", BidAmount.PASS))
+        game.act(SelectTrump("1", SelectableSuit.HEARTS))
+
+        replayed = replay(players, "trusted", encode(game), validate=False)
+
+        self.assertEqual(Status.DISCARD, replayed.status)
+        self.assertEqual(game.actions, replayed.actions)
@@ -2,10 +2,12 @@
 
 from unittest import TestCase
 
+from hundredandten.deck import Deck, round_seed
 from hundredandten.engine.constants import HAND_SIZE, Status
 from hundredandten.engine.errors import HundredAndTenError
 from hundredandten.engine.game import Game
 from hundredandten.engine.player import Player
+from hundredandten.engine.round import Round
 from hundredandten.testing import arrange
 
 
@@ -39,6 +41,29 @@ class TestStartOfGame(TestCase):
             game_2.active_round.deck.seed, game_1.active_round.deck.seed
         )
 
+    def test_round_decks_follow_game_seed(self):
+        """Each round's deck is derived from the game seed and round number"""
+        game = arrange.game(Status.COMPLETED_NO_BIDDERS, seed="start-of-game-seed")
+
+        for index, game_round in enumerate(game.rounds):
+            self.assertEqual(game_round.seed, round_seed(game.seed, index))
+            self.assertEqual(game_round.deck.cards, Deck(game_round.seed).cards)
+
+    def test_round_without_shuffled_deck(self):
+        """A round built from only a seed deals the same hands as the game did"""
+        game = arrange.game(Status.BIDDING)
+
+        game_round = Round(
+            game_players=game.players,
+            dealer_identifier=game.active_round.dealer.identifier,
+            seed=game.active_round.seed,
+        )
+
+        self.assertEqual(
+            [p.hand for p in game_round.players],
+            [p.hand for p in game.active_round.players],
+        )
+
     def test_game_with_no_players(self):
         """Will not allow creating a game with no players"""
         self.assertRaises(HundredAndTenError, Game)
@@ -0,0 +1,217 @@
+"""Test timing spans of the engine with recorders"""
+
+from unittest import TestCase
+
+from hundredandten.engine.actions import Bid
+from hundredandten.engine.constants import BidAmount, Status
+from hundredandten.engine.instrumentation import (
+    Histogram,
+    HistogramRecorder,
+    active_recorder,
+    recording,
+    span,
+)
+from hundredandten.testing import arrange
+
+
+class ListRecorder:
+    """Keep every recorded span in order"""
+
+    def __init__(self) -> None:
+        self.spans: list[tuple[str, float]] = []
+
+    def record(self, name: str, seconds: float) -> None:
+        """Keep the span"""
+        self.spans.append((name, seconds))
+
+    @property
+    def names(self) -> list[str]:
+        """The name of each recorded span"""
+        return [name for name, _ in self.spans]
+
+
+class ClaimedBid(Bid):
+    """A bid extended outside the engine"""
+
+
+class TestRecording(TestCase):
+    """Unit tests for sending spans to the active recorder"""
+
+    def test_no_recorder(self):
+        """Without a recorder, spans are not timed"""
+        self.assertIsNone(active_recorder())
+        with span("untimed") as timed:
+            self.assertIsNone(timed)
+
+    def test_recording(self):
+        """Spans timed within the block are sent to the recorder"""
+        recorder = ListRecorder()
+
+        with recording(recorder) as active:
+            self.assertIs(recorder, active)
+            self.assertIs(recorder, active_recorder())
+            with span("timed"):
+                pass
+
+        self.assertIsNone(active_recorder())
+        self.assertEqual(["timed"], recorder.names)
+        self.assertGreaterEqual(recorder.spans[0][1], 0)
+
+    def test_nested_recording(self):
+        """The recorder of an outer block is restored when an inner block ends"""
+        outer, inner = ListRecorder(), ListRecorder()
+
+        with recording(outer):
+            with recording(inner):
+                with span("inner"):
+                    pass
+            with span("outer"):
+                pass
+
+        self.assertEqual(["inner"], inner.names)
+        self.assertEqual(["outer"], outer.names)
+
+    def test_exception(self):
+        """A span is timed even when its block raises"""
+        recorder = ListRecorder()
+
+        with self.assertRaises(ValueError), recording(recorder), span("raised"):
+            raise ValueError
+
+        self.assertEqual(["raised"], recorder.names)
+
+    def test_game_act(self):
+        """Acting in a game times the action in the game and in its round"""
+        game = arrange.game(Status.BIDDING)
+        recorder = ListRecorder()
+
+        with recording(recorder):
+            game.act(Bid(game.active_player.identifier, BidAmount.FIFTEEN))
+
+        self.assertEqual(["round.act.bid", "game.act"], recorder.names)
+
+    def test_extended_action(self):
+        """An action extending one of the engine's is timed as the one it extends"""
+        game = arrange.game(Status.BIDDING)
+        recorder = ListRecorder()
+
+        with recording(recorder):
+            game.act(ClaimedBid(game.active_player.identifier, BidAmount.FIFTEEN))
+
+        self.assertEqual(["round.act.bid", "game.act"], recorder.names)
+
+    def test_round_actions(self):
+        """Each kind of action in a round is its own span"""
+        recorder = ListRecorder()
+
+        with recording(recorder):
+            arrange.game(Status.TRICKS, massage=arrange.play_trick)
+
+        self.assertEqual(
+            {
+                "game.act",
+                "round.act.bid",
+                "round.act.select_trump",
+                "round.act.discard",
+                "round.act.play",
+                "game.new_round",
+            },
+            set(recorder.names),
+        )
+
+    def test_round_rollover(self):
+        """Ending a round times totalling its scores and dealing the next one"""
+        game = arrange.game(Status.TRICKS)
+        recorder = ListRecorder()
+
+        with recording(recorder):
+            arrange.play_round(game)
+
+        self.assertEqual(1, recorder.names.count("game.end_round"))
+        self.assertEqual(1, recorder.names.count("game.new_round"))
+
+    def test_no_bidders(self):
+        """A round without bidders deals the next round without totalling scores"""
+        game = arrange.game(Status.BIDDING)
+        recorder = ListRecorder()
+
+        with recording(recorder):
+            arrange.pass_round(game)
+
+        self.assertNotIn("game.end_round", recorder.names)
+        self.assertEqual(1, recorder.names.count("game.new_round"))
+
+
+class TestHistogramRecorder(TestCase):
+    """Unit tests for the in-memory histogram recorder"""
+
+    def test_record(self):
+        """Each span is counted in its own histogram"""
+        recorder = HistogramRecorder()
+
+        with recording(recorder):
+            arrange.game(Status.TRICKS)
+
+        bids = recorder.histograms["round.act.bid"]
+        self.assertEqual(4, bids.count)
+        self.assertEqual(4, sum(bids.buckets.values()))
+        self.assertLessEqual(bids.minimum, bids.mean)
+        self.assertLessEqual(bids.mean, bids.maximum)
+        self.assertEqual(
+            sum(
+                recorder.histograms[f"round.act.{name}"].count
+                for name in ("bid", "select_trump", "discard")
+            ),
+            recorder.histograms["game.act"].count,
+        )
+
+    def test_percentiles(self):
+        """Percentiles are estimated within a quarter of a doubling"""
+        histogram = Histogram()
+        durations = [i * 1e-6 for i in range(1, 1001)]
+        for duration in reversed(durations):
+            histogram.add(duration)
+
+        self.assertEqual(1000, histogram.count)
+        self.assertAlmostEqual(sum(durations) / 1000, histogram.mean)
+        for fraction in (0, 0.01, 0.5, 0.9, 0.99):
+            actual = durations[max(int(fraction * 1000) - 1, 0)]
+            estimate = histogram.percentile(fraction)
+            self.assertGreaterEqual(estimate, actual)
+            self.assertLess(estimate, actual * 2**0.25)
+        self.assertEqual(1e-3, histogram.percentile(1))
+
+    def test_zero_durations(self):
+        """Durations too short to measure are below every other duration"""
+        histogram = Histogram()
+        for duration in (0.0, 0.0, 0.0, 1e-3):
+            histogram.add(duration)
+
+        self.assertEqual(0.0, histogram.percentile(0.5))
+        self.assertEqual(1e-3, histogram.percentile(1))
+
+    def test_empty(self):
+        """A histogram without durations has no duration"""
+        histogram = Histogram()
+
+        self.assertEqual(0.0, histogram.mean)
+        self.assertEqual(0.0, histogram.percentile(0.5))
+
+    def test_summary(self):
+        """The summary has a row for each span"""
+        recorder = HistogramRecorder()
+        for seconds in (1e-6, 2e-6, 3e-6):
+            recorder.record("short", seconds)
+        recorder.record("a much longer span name", 1.0)
+
+        lines = recorder.summary().splitlines()
+
+        self.assertEqual(
+            ["span", "count", "mean", "p50", "p90", "p99"], lines[0].split()
+        )
+        self.assertEqual(
+            ["a much longer span name", "1", *["1000000.0"] * 4],
+            lines[1].rsplit(maxsplit=5),
+        )
+        self.assertEqual(["short", "3", "2.0"], lines[2].split()[:3])
+        self.assertEqual(len(lines[0]), len(lines[1]))
@@ -4,7 +4,12 @@ from unittest import TestCase
 
 from hundredandten.engine.constants import RoundRole
 from hundredandten.engine.errors import HundredAndTenError
-from hundredandten.engine.player import RoundPlayer, add_player_role, remove_player_role
+from hundredandten.engine.player import (
+    RoundPlayer,
+    add_player_role,
+    players_by_role,
+    remove_player_role,
+)
 
 
 class TestPeopleRoles(TestCase):
@@ -51,3 +56,10 @@ class TestPeopleRoles(TestCase):
 
         self.assertEqual(1, len(players))
         self.assertNotIn(role, players[0].roles)
+
+    def test_players_by_role(self):
+        """Finds only the players carrying a role"""
+
+        players = [RoundPlayer("1"), RoundPlayer("2", roles={RoundRole.DEALER})]
+
+        self.assertEqual([players[1]], players_by_role(players, RoundRole.DEALER))
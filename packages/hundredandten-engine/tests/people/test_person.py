@@ -22,3 +22,14 @@ class TestPlayer(TestCase):
             ),
         )
         self.assertNotEqual(Player("one"), Player("two"))
+
+    def test_hand_set_matches_hand(self):
+        """A round player's hand set holds exactly the cards in their hand"""
+        hand = [
+            Card(CardNumber.ACE, CardSuit.CLUBS),
+            Card(CardNumber.FIVE, CardSuit.HEARTS),
+        ]
+        player = RoundPlayer("1", hand=hand)
+
+        self.assertEqual(set(player.hand_set), set(hand))
+        self.assertNotIn(Card(CardNumber.TWO, CardSuit.CLUBS), player.hand_set)
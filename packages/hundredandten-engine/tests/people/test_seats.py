@@ -0,0 +1,34 @@
+"""Unit test seat lookups for a table of players"""
+
+from unittest import TestCase
+
+from hundredandten.engine.errors import HundredAndTenError
+from hundredandten.engine.player import Player, RoundPlayer, Seats
+
+
+class TestSeats(TestCase):
+    """Seats unit tests"""
+
+    def test_seats_follow_player_order(self):
+        """Players are seated in the order provided"""
+
+        seats = Seats.of([Player("a"), Player("b"), Player("c")])
+
+        self.assertEqual(3, len(seats))
+        self.assertEqual(0, seats.seat_of("a"))
+        self.assertEqual(1, seats.seat_of("b"))
+        self.assertEqual(2, seats.seat_of("c"))
+
+    def test_seat_of_unknown_player(self):
+        """Finds no seat for a player not at the table"""
+
+        seats = Seats.of([RoundPlayer("1")])
+
+        self.assertRaises(HundredAndTenError, seats.seat_of, "bad")
+
+    def test_seat_after(self):
+        """Determines the next seat around the table"""
+
+        seats = Seats.of([RoundPlayer(str(i)) for i in range(4)])
+
+        self.assertEqual([1, 2, 3, 0], [seats.seat_after(seat) for seat in range(4)])
@@ -0,0 +1,242 @@
+"""Test the state a round maintains against recomputing it from the round's history"""
+
+from itertools import chain
+from random import Random
+from typing import Any, Callable, Optional
+from unittest import TestCase
+
+from hundredandten.deck import SelectableSuit
+from hundredandten.engine.actions import Action, Bid, Discard, Play, SelectTrump
+from hundredandten.engine.constants import BidAmount, Status
+from hundredandten.engine.errors import HundredAndTenError
+from hundredandten.engine.player import (
+    Player,
+    RoundPlayer,
+    player_after,
+    player_by_identifier,
+)
+from hundredandten.engine.round import Round
+from hundredandten.engine.trick import Score
+
+# the way a round derived its state from its full history
+# before that state was maintained by each action
+
+
+def reference_current_bid(game_round: Round, identifier: str) -> Optional[Bid]:
+    """The most recent bid for the provided player"""
+    loc_index = max(
+        (
+            loc
+            for loc, val in enumerate(game_round.bids)
+            if val.identifier == identifier
+        ),
+        default=None,
+    )
+    return game_round.bids[loc_index] if loc_index is not None else None
+
+
+def reference_bidders(game_round: Round) -> list[RoundPlayer]:
+    """Anyone in the round that can still submit a bid"""
+    return [
+        p
+        for p in game_round.players
+        if reference_current_bid(game_round, p.identifier) != Bid("", BidAmount.PASS)
+    ]
+
+
+def reference_active_bid(game_round: Round) -> Optional[BidAmount]:
+    """The maximum bid submitted in the round"""
+    return max(game_round.bids).amount if game_round.bids else None
+
+
+def reference_active_bidder(game_round: Round) -> Optional[RoundPlayer]:
+    """The active bidder in the round"""
+    bidders = reference_bidders(game_round)
+    if not reference_active_bid(game_round) or len(bidders) != 1:
+        return None
+    return bidders[0]
+
+
+def reference_status(game_round: Round) -> Status:
+    """The status of the round"""
+    if game_round.tricks and all(not player.hand for player in game_round.players):
+        return Status.COMPLETED
+    if len(game_round.discards) == len(game_round.players):
+        return Status.TRICKS
+    if game_round.selection:
+        return Status.DISCARD
+    if reference_active_bidder(game_round):
+        return Status.TRUMP_SELECTION
+    if not reference_bidders(game_round):
+        return Status.COMPLETED_NO_BIDDERS
+    return Status.BIDDING
+
+
+def reference_active_player(game_round: Round) -> RoundPlayer:
+    """The active player in the round"""
+    status = reference_status(game_round)
+    active_bidder = reference_active_bidder(game_round)
+    if status == Status.BIDDING:
+        last_bidder = (
+            game_round.dealer.identifier
+            if not game_round.bids
+            else game_round.bids[-1].identifier
+        )
+        bidders = reference_bidders(game_round)
+        return player_after(
+            [
+                p
+                for p in game_round.players
+                if p in bidders or p.identifier == last_bidder
+            ],
+            last_bidder,
+        )
+    if status == Status.TRUMP_SELECTION:
+        assert active_bidder
+        return active_bidder
+    if status == Status.DISCARD:
+        last_discarder = (
+            game_round.dealer.identifier
+            if not game_round.discards
+            else game_round.discards[-1].identifier
+        )
+        return player_after(game_round.players, last_discarder)
+    if status == Status.TRICKS:
+        assert active_bidder
+        if not game_round.active_trick.plays:
+            if len(game_round.tricks) == 1:
+                return player_after(game_round.players, active_bidder.identifier)
+            return player_by_identifier(
+                game_round.players, game_round.tricks[-2].winning_play.identifier
+            )
+        return player_after(
+            game_round.players, game_round.active_trick.plays[-1].identifier
+        )
+    raise HundredAndTenError(f"Cannot determine active player in {status} status")
+
+
+def reference_actions(game_round: Round) -> list[Action]:
+    """The actions that occurred in the round"""
+    return [
+        *game_round.bids,
+        *([game_round.selection] if game_round.selection else []),
+        *game_round.discards,
+        *chain.from_iterable(trick.plays for trick in game_round.tricks),
+    ]
+
+
+def outcome(fn: Callable[[], Any]) -> Any:
+    """The value the function returns, or the type of error it raises"""
+    try:
+        return fn()
+    except HundredAndTenError as error:
+        return type(error)
+
+
+def random_action(game_round: Round, rng: Random) -> Action:
+    """A random legal action for the active player"""
+    player = game_round.active_player
+    identifier = player.identifier
+    if game_round.status == Status.BIDDING:
+        return Bid(identifier, rng.choice(game_round.available_bids(identifier)))
+    if game_round.status == Status.TRUMP_SELECTION:
+        return SelectTrump(identifier, rng.choice(list(SelectableSuit)))
+    if game_round.status == Status.DISCARD:
+        return Discard(
+            identifier, rng.sample(player.hand, rng.randint(0, len(player.hand)))
+        )
+    trumps = [c for c in player.hand if c.trump_for_selection(game_round.trump)]
+    playable = trumps if game_round.active_trick.bleeding and trumps else player.hand
+    return Play(identifier, rng.choice(playable))
+
+
+class TestRoundState(TestCase):
+    """Unit tests for the state maintained by a round as it is played"""
+
+    def assert_matches_reference(self, game_round: Round) -> None:
+        """Every maintained property matches recomputing it from the history"""
+        self.assertEqual(game_round.status, reference_status(game_round))
+        self.assertEqual(game_round.bidders, reference_bidders(game_round))
+        self.assertEqual(game_round.active_bid, reference_active_bid(game_round))
+        self.assertEqual(game_round.active_bidder, reference_active_bidder(game_round))
+        self.assertEqual(
+            outcome(lambda: game_round.active_player),
+            outcome(lambda: reference_active_player(game_round)),
+        )
+        self.assertEqual(game_round.actions, reference_actions(game_round))
+
+    def test_random_rounds_match_reference(self):
+        """Randomly played rounds match the recomputed state after every action"""
+        rng = Random("round-state")
+        for round_number in range(300):
+            players = [Player(str(i)) for i in range(2 + round_number % 3)]
+            game_round = Round(
+                game_players=players,
+                dealer_identifier=rng.choice(players).identifier,
+                seed=str(round_number),
+            )
+            self.assert_matches_reference(game_round)
+
+            while game_round.status not in (
+                Status.COMPLETED,
+                Status.COMPLETED_NO_BIDDERS,
+            ):
+                game_round.act(random_action(game_round, rng))
+                self.assert_matches_reference(game_round)
+
+    def test_rejected_actions_keep_state(self):
+        """An action that is rejected does not change the maintained state"""
+        rng = Random("rejected-actions")
+        game_round = Round(
+            game_players=[Player(str(i)) for i in range(4)],
+            dealer_identifier="0",
+            seed="rejected-actions",
+        )
+
+        while game_round.status not in (Status.COMPLETED, Status.COMPLETED_NO_BIDDERS):
+            inactive = game_round.inactive_players[0]
+            for rejected in (
+                Bid(inactive.identifier, BidAmount.SHOOT_THE_MOON),
+                Play(inactive.identifier, game_round.active_player.hand[0]),
+            ):
+                self.assertRaises(HundredAndTenError, game_round.act, rejected)
+            self.assert_matches_reference(game_round)
+            game_round.act(random_action(game_round, rng))
+
+    def test_scores_follow_tricks(self):
+        """Scores are recomputed as tricks are played"""
+        rng = Random("scores")
+        game_round = Round(
+            game_players=[Player(str(i)) for i in range(4)],
+            dealer_identifier="0",
+            seed="scores",
+        )
+        game_round.act(Bid("1", BidAmount.FIFTEEN))
+        for identifier in ("2", "3", "0"):
+            game_round.act(Bid(identifier, BidAmount.PASS))
+
+        self.assertEqual(game_round.scores, [Score("1", -BidAmount.FIFTEEN)])
+        self.assertIs(game_round.scores, game_round.scores)
+
+        while len(game_round.tricks) < 2:
+            game_round.act(random_action(game_round, rng))
+
+        self.assertEqual(
+            game_round.scores, [Score("1", -BidAmount.FIFTEEN), Score("3", 10)]
+        )
+
+    def test_returned_lists_are_copies(self):
+        """Changing the lists a round returns does not change the round"""
+        game_round = Round(
+            game_players=[Player(str(i)) for i in range(4)],
+            dealer_identifier="0",
+            seed="copies",
+        )
+        game_round.apply(Bid("1", BidAmount.FIFTEEN))
+
+        game_round.actions.pop()
+        game_round.bidders.clear()
+
+        self.assertEqual([Bid("1", BidAmount.FIFTEEN)], game_round.actions)
+        self.assertEqual(4, len(game_round.bidders))
+        self.assertEqual(Bid("1", BidAmount.FIFTEEN), game_round.undo())
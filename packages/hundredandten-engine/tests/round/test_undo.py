@@ -0,0 +1,173 @@
+"""Test applying and undoing actions on a round"""
+
+from unittest import TestCase
+
+from hundredandten.deck import SelectableSuit
+from hundredandten.engine.actions import Action, Bid, Discard, Play, SelectTrump
+from hundredandten.engine.constants import BidAmount, Status
+from hundredandten.engine.errors import HundredAndTenError
+from hundredandten.engine.player import Player
+from hundredandten.engine.round import Round
+from hypothesis import given, settings, strategies as st
+
+
+def new_round(seed: str, num_players: int) -> Round:
+    """A round between the provided number of players, dealt from the seed"""
+    return Round(
+        game_players=[Player(str(i)) for i in range(num_players)],
+        dealer_identifier="0",
+        seed=seed,
+    )
+
+
+def legal_actions(game_round: Round) -> list[Action]:
+    """Every action the active player may take"""
+    if game_round.status in (Status.COMPLETED, Status.COMPLETED_NO_BIDDERS):
+        return []
+    player = game_round.active_player
+    identifier = player.identifier
+    if game_round.status == Status.BIDDING:
+        return [Bid(identifier, a) for a in game_round.available_bids(identifier)]
+    if game_round.status == Status.TRUMP_SELECTION:
+        return [SelectTrump(identifier, suit) for suit in SelectableSuit]
+    if game_round.status == Status.DISCARD:
+        return [
+            Discard(identifier, [c for i, c in enumerate(player.hand) if mask >> i & 1])
+            for mask in range(1 << len(player.hand))
+        ]
+    trumps = [c for c in player.hand if c.trump_for_selection(game_round.trump)]
+    playable = trumps if game_round.active_trick.bleeding and trumps else player.hand
+    return [Play(identifier, card) for card in playable]
+
+
+def snapshot(game_round: Round) -> tuple:
+    """Everything about a round that acting on it can change"""
+    return (
+        game_round.status,
+        game_round.active_seat if legal_actions(game_round) else None,
+        [list(p.hand) for p in game_round.players],
+        list(game_round.actions),
+        list(game_round.bids),
+        game_round.selection,
+        list(game_round.discards),
+        [list(trick.plays) for trick in game_round.tricks],
+        list(game_round.bidders),
+        game_round.active_bid,
+        game_round.active_bidder,
+        game_round.deck.pulled,
+        game_round.scores,
+    )
+
+
+round_setups = st.tuples(st.text(max_size=8), st.integers(min_value=2, max_value=4))
+choices = st.lists(st.integers(min_value=0, max_value=1 << 16), max_size=60)
+
+
+class TestUndo(TestCase):
+    """Unit tests for undoing applied actions"""
+
+    @settings(deadline=None)
+    @given(setup=round_setups, picks=choices)
+    def test_undo_restores_every_state(self, setup, picks):
+        """Undoing applied actions one at a time walks back through every prior state"""
+        game_round = new_round(*setup)
+        history = []
+        for pick in picks:
+            actions = legal_actions(game_round)
+            if not actions:
+                break
+            history.append(snapshot(game_round))
+            game_round.apply(actions[pick % len(actions)])
+
+        while history:
+            game_round.undo()
+            self.assertEqual(history.pop(), snapshot(game_round))
+
+    @settings(deadline=None)
+    @given(setup=round_setups, picks=choices)
+    def test_apply_matches_act(self, setup, picks):
+        """Applying actions, even after undoing and reapplying each, matches acting"""
+        applied = new_round(*setup)
+        acted = new_round(*setup)
+        for pick in picks:
+            actions = legal_actions(acted)
+            if not actions:
+                break
+            action = actions[pick % len(actions)]
+            applied.apply(action)
+            self.assertEqual(action, applied.undo())
+            applied.apply(action)
+            acted.act(action)
+            self.assertEqual(snapshot(acted), snapshot(applied))
+
+    def test_undo_without_applied_action(self):
+        """Nothing can be undone before an action is applied"""
+        game_round = new_round("undo", 4)
+
+        self.assertRaises(HundredAndTenError, game_round.undo)
+
+    def test_undo_after_act(self):
+        """An action performed with act cannot be undone"""
+        game_round = new_round("undo", 4)
+        game_round.apply(Bid("1", BidAmount.PASS))
+        game_round.act(Bid("2", BidAmount.PASS))
+
+        self.assertRaises(HundredAndTenError, game_round.undo)
+        self.assertEqual(2, len(game_round.bids))
+
+    def test_rejected_apply(self):
+        """An action that is rejected is not recorded to undo"""
+        game_round = new_round("undo", 4)
+
+        self.assertRaises(
+            HundredAndTenError, game_round.apply, Bid("2", BidAmount.FIFTEEN)
+        )
+        self.assertRaises(HundredAndTenError, game_round.undo)
+
+    def test_apply_to_completed_round(self):
+        """Nothing can be applied once a round is complete"""
+        game_round = new_round("undo", 2)
+        game_round.apply(Bid("1", BidAmount.PASS))
+        game_round.apply(Bid("0", BidAmount.PASS))
+
+        self.assertRaises(
+            HundredAndTenError, game_round.apply, Bid("1", BidAmount.PASS)
+        )
+        game_round.undo()
+        self.assertEqual(Status.BIDDING, game_round.status)
+        self.assertEqual("0", game_round.active_player.identifier)
+
+    def test_fork_keeps_applied_actions(self):
+        """A forked round can undo the actions applied before it was forked"""
+        game_round = new_round("undo", 4)
+        game_round.apply(Bid("1", BidAmount.FIFTEEN))
+        before = snapshot(game_round)
+        game_round.apply(Bid("2", BidAmount.PASS))
+
+        fork = game_round.fork()
+        fork.undo()
+
+        self.assertEqual(before, snapshot(fork))
+        self.assertEqual(2, len(game_round.bids))
+        for bidder in fork.bidders:
+            self.assertIs(fork.players[int(bidder.identifier)], bidder)
+
+    def test_fork_undoes_to_its_own_players(self):
+        """Undoing in a fork restores bidders that are the fork's players"""
+        game_round = new_round("undo", 4)
+        for identifier, amount in (
+            ("1", BidAmount.FIFTEEN),
+            ("2", BidAmount.PASS),
+            ("3", BidAmount.PASS),
+            ("0", BidAmount.PASS),
+        ):
+            game_round.apply(Bid(identifier, amount))
+
+        fork = game_round.fork()
+        fork.undo()
+
+        self.assertEqual(2, len(fork.bidders))
+        for bidder in fork.bidders:
+            self.assertIs(fork.players[int(bidder.identifier)], bidder)
+        fork.apply(Bid("0", BidAmount.PASS))
+        self.assertIs(fork.players[1], fork.active_bidder)
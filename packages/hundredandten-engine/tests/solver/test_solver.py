@@ -0,0 +1,138 @@
+"""Test solving the trick phase of a round with every hand known"""
+
+from unittest import TestCase
+
+from hundredandten.deck import SelectableSuit
+from hundredandten.engine.actions import Bid, Discard, Play, SelectTrump
+from hundredandten.engine.constants import HAND_SIZE, BidAmount, Status
+from hundredandten.engine.errors import HundredAndTenError
+from hundredandten.engine.player import Player
+from hundredandten.engine.round import Round
+from hundredandten.engine.solver import DoubleDummySolver, solve
+from hypothesis import given, settings, strategies as st
+
+SEED = "solver-seed"
+
+
+def tricks_round(
+    seed: str, num_players: int, amount: BidAmount, trump: SelectableSuit
+) -> Round:
+    """A round in the trick phase, won by the first bidder with the amount"""
+    game_round = Round(
+        game_players=[Player(str(i)) for i in range(num_players)],
+        dealer_identifier="0",
+        seed=seed,
+    )
+    game_round.act(Bid(game_round.active_player.identifier, amount))
+    while game_round.status == Status.BIDDING:
+        game_round.act(Bid(game_round.active_player.identifier, BidAmount.PASS))
+    game_round.act(SelectTrump(game_round.active_player.identifier, trump))
+    while game_round.status == Status.DISCARD:
+        game_round.act(Discard(game_round.active_player.identifier, []))
+    return game_round
+
+
+def play(game_round: Round, pick: int) -> None:
+    """Play the picked card of the active player, or the next one after it they can"""
+    player = game_round.active_player
+    for offset in range(len(player.hand)):
+        try:
+            card = player.hand[(pick + offset) % len(player.hand)]
+            game_round.act(Play(player.identifier, card))
+            return
+        except HundredAndTenError:
+            continue
+
+
+def brute_force(game_round: Round, bidder: str) -> int:
+    """The bidder's best score for the round, found by trying every play"""
+    if game_round.status == Status.COMPLETED:
+        return sum(s.value for s in game_round.scores if s.identifier == bidder)
+    player = game_round.active_player
+    outcomes = []
+    for card in player.hand:
+        try:
+            game_round.apply(Play(player.identifier, card))
+        except HundredAndTenError:
+            continue
+        outcomes.append(brute_force(game_round, bidder))
+        game_round.undo()
+    return max(outcomes) if player.identifier == bidder else min(outcomes)
+
+
+rounds = st.builds(
+    tricks_round,
+    seed=st.text(max_size=8),
+    num_players=st.integers(min_value=2, max_value=4),
+    amount=st.sampled_from([a for a in BidAmount if a != BidAmount.PASS]),
+    trump=st.sampled_from(SelectableSuit),
+)
+picks = st.lists(st.integers(min_value=0, max_value=HAND_SIZE), max_size=4)
+
+
+class TestSolver(TestCase):
+    """Unit tests for the double dummy solver"""
+
+    @settings(deadline=None)
+    @given(game_round=rounds, extra=picks)
+    def test_brute_force(self, game_round, extra):
+        """The solved score matches trying every play, after every card"""
+        # leave three cards in each hand so every play can be tried
+        for pick in [0] * (HAND_SIZE - 3) * len(game_round.players) + extra:
+            play(game_round, pick)
+        assert game_round.active_bidder is not None
+        bidder = game_round.active_bidder.identifier
+        identifier = game_round.active_player.identifier
+        solver = DoubleDummySolver()
+
+        self.assertEqual(brute_force(game_round, bidder), solver.score(game_round))
+        for card, score in solver.play_scores(game_round).items():
+            game_round.apply(Play(identifier, card))
+            self.assertEqual(brute_force(game_round, bidder), score)
+            game_round.undo()
+
+    def test_full_round(self):
+        """A round can be solved from its first trick"""
+        for num_players in (2, 3, 4):
+            game_round = tricks_round(
+                SEED, num_players, BidAmount.FIFTEEN, SelectableSuit.SPADES
+            )
+            solver = DoubleDummySolver()
+            scores = solver.play_scores(game_round).values()
+            best = max if game_round.active_player == game_round.active_bidder else min
+
+            self.assertIn(solver.tricks(game_round), range(HAND_SIZE + 1))
+            self.assertEqual(best(scores), solver.score(game_round))
+
+    def test_reuse(self):
+        """Solving a position again reuses what was found until it is cleared"""
+        game_round = tricks_round(SEED, 4, BidAmount.TWENTY, SelectableSuit.HEARTS)
+        solver = DoubleDummySolver()
+        score = solver.score(game_round)
+        searched = solver.nodes
+
+        self.assertEqual(score, solver.score(game_round))
+        self.assertEqual(searched + 1, solver.nodes)
+
+        solver.clear()
+        self.assertEqual(score, solver.score(game_round))
+        self.assertEqual(2 * searched + 1, solver.nodes)
+
+    def test_solve(self):
+        """Solving a round gives the score of a new solver"""
+        game_round = tricks_round(
+            SEED, 3, BidAmount.SHOOT_THE_MOON, SelectableSuit.CLUBS
+        )
+
+        self.assertEqual(DoubleDummySolver().score(game_round), solve(game_round))
+        self.assertIn(solve(game_round), (-60, 60))
+
+    def test_status(self):
+        """Only a round in the trick phase can be solved"""
+        game_round = Round(
+            game_players=[Player(str(i)) for i in range(4)],
+            dealer_identifier="0",
+            seed=SEED,
+        )
+
+        self.assertRaises(HundredAndTenError, solve, game_round)
@@ -1,10 +1,12 @@
 """Represent the state of a game as observed by a single player"""
 
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum, IntEnum
-from itertools import combinations
+from functools import cache, cached_property
+from typing import overload
 
-from hundredandten.deck import Card, SelectableSuit
+from hundredandten.deck import Card, CardSet, SelectableSuit
 
 
 class Status(Enum):
@@ -28,7 +30,7 @@ class BidAmount(IntEnum):
     PASS = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AvailableBid:
     """
     An available bid action.
@@ -39,8 +41,14 @@ class AvailableBid:
 
     amount: BidAmount
 
+    @classmethod
+    @cache
+    def of(cls, amount: BidAmount) -> "AvailableBid":
+        """The shared bid of the amount"""
+        return cls(amount)
+
 
-@dataclass(frozen=True, eq=False)
+@dataclass(frozen=True, eq=False, slots=True)
 class AvailableDiscard:
     """
     An available discard action.
@@ -63,7 +71,7 @@ class AvailableDiscard:
         return hash(frozenset(self.cards))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AvailableSelectTrump:
     """
     An available trump selection action.
@@ -74,8 +82,14 @@ class AvailableSelectTrump:
 
     suit: SelectableSuit
 
+    @classmethod
+    @cache
+    def of(cls, suit: SelectableSuit) -> "AvailableSelectTrump":
+        """The shared selection of the suit"""
+        return cls(suit)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AvailablePlay:
     """
     An available play action.
@@ -86,29 +100,121 @@ class AvailablePlay:
 
     card: Card
 
+    @classmethod
+    @cache
+    def of(cls, card: Card) -> "AvailablePlay":
+        """The shared play of the card"""
+        return cls(card)
+
 
 type AvailableAction = AvailableBid | AvailableSelectTrump | AvailableDiscard | AvailablePlay
 
 
-@dataclass(frozen=True)
+class AvailableDiscards(Sequence[AvailableDiscard]):
+    """
+    Every discard available from a hand, indexed by a bitmask over the hand.
+    The discard at an index holds the card at each position of the hand set in it,
+    so a hand of five cards has 32 discards, from none (0) to all (31).
+
+    Discards are only built as they are accessed,
+    and checking whether a discard is available does not build any.
+    Discards from the same hand are equal, and adding them to a sequence of
+    actions builds a tuple, as the other available actions are.
+    """
+
+    __slots__ = ("hand", "__hand_set")
+
+    def __init__(self, hand: tuple[Card, ...]) -> None:
+        self.hand = hand
+        self.__hand_set = CardSet.of(hand)
+
+    def __len__(self) -> int:
+        return 1 << len(self.hand)
+
+    @overload
+    def __getitem__(self, index: int) -> AvailableDiscard: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[AvailableDiscard, ...]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> AvailableDiscard | tuple[AvailableDiscard, ...]:
+        masks = range(len(self))
+        if isinstance(index, slice):
+            return tuple(self.__discard(mask) for mask in masks[index])
+        return self.__discard(masks[index])
+
+    def __iter__(self) -> Iterator[AvailableDiscard]:
+        return (self.__discard(mask) for mask in range(len(self)))
+
+    def __contains__(self, value: object) -> bool:
+        return (
+            isinstance(value, AvailableDiscard)
+            and CardSet.of(value.cards) <= self.__hand_set
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AvailableDiscards):
+            return NotImplemented
+        return self.hand == other.hand
+
+    def __hash__(self) -> int:
+        return hash(self.hand)
+
+    def __add__(self, other: Sequence[AvailableAction]) -> tuple[AvailableAction, ...]:
+        return (*self, *other)
+
+    def __radd__(self, other: Sequence[AvailableAction]) -> tuple[AvailableAction, ...]:
+        return (*other, *self)
+
+    def __repr__(self) -> str:
+        return f"AvailableDiscards(hand={self.hand!r})"
+
+    def mask_of(self, discard: AvailableDiscard) -> int:
+        """The index of the available discard, a bitmask over the hand"""
+        if discard not in self:
+            raise ValueError(f"{discard} is not available")
+        discarded = CardSet.of(discard.cards)
+        return sum(
+            1 << position
+            for position, card in enumerate(self.hand)
+            if card in discarded
+        )
+
+    def __discard(self, mask: int) -> AvailableDiscard:
+        return AvailableDiscard(
+            tuple(
+                card for position, card in enumerate(self.hand) if mask >> position & 1
+            )
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class InHand:
     """Card is in this player's hand"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Played:
     """Card was played in a specific trick by a specific seat"""
 
     trick_index: int
     seat: int
 
+    @classmethod
+    @cache
+    def of(cls, trick_index: int, seat: int) -> "Played":
+        """The shared status of a card played in the trick by the seat"""
+        return cls(trick_index, seat)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Discarded:
     """Card was discarded by the requesting player"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Unknown:
     """Card location is not known to this player"""
 
@@ -116,31 +222,52 @@ class Unknown:
 type CardStatus = InHand | Played | Discarded | Unknown
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardKnowledge:
     """Hold the known information about a card and its status"""
 
     card: Card
     status: CardStatus
 
+    @classmethod
+    @cache
+    def of(cls, card: Card, status: CardStatus) -> "CardKnowledge":
+        """
+        The shared knowledge of the card with the status.
+        There are only so many cards and statuses, so each pair is built once.
+        """
+        return cls(card, status)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BidEvent:
     """A bid placed by a player at a relative seat"""
 
     seat: int
     amount: BidAmount
 
+    @classmethod
+    @cache
+    def of(cls, seat: int, amount: BidAmount) -> "BidEvent":
+        """The shared bid of the amount by the seat"""
+        return cls(seat, amount)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TrickPlay:
     """A card played in a trick by a player at a relative seat"""
 
     seat: int
     card: Card
 
+    @classmethod
+    @cache
+    def of(cls, seat: int, card: Card) -> "TrickPlay":
+        """The shared play of the card by the seat"""
+        return cls(seat, card)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CompletedTrick:
     """A completed trick with all plays and the winner"""
 
@@ -148,7 +275,7 @@ class CompletedTrick:
     winner_seat: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableInfo:
     """Table shape and positions.
 
@@ -161,7 +288,7 @@ class TableInfo:
     scores: tuple[int, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BiddingState:
     """Bidding phase state including the resulting trump"""
 
@@ -170,7 +297,7 @@ class BiddingState:
     trump: SelectableSuit | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrickState:
     """Trick phase state"""
 
@@ -204,82 +331,82 @@ class GameState:
     # Card knowledge (all 53 cards)
     cards: tuple[CardKnowledge, ...]
 
-    @property
-    def available_actions(self) -> tuple[AvailableAction, ...]:
+    @cached_property
+    def hand_set(self) -> CardSet:
+        """This player's hand as a CardSet"""
+        return CardSet.of(self.hand)
+
+    # the state is frozen, so the actions available from it are computed once
+
+    @cached_property
+    def available_actions(self) -> Sequence[AvailableAction]:
         """Return all available actions"""
         match self.status:
             case Status.BIDDING:
-                if any(
-                    b == BidEvent(0, BidAmount.PASS) for b in self.bidding.bid_history
-                ):
-                    return ()
-
-                dealer_steal = (
-                    [self.bidding.active_bid]
-                    if self.bidding.active_bid and self.table.dealer_seat == 0
-                    else []
-                )
-                higher_bids = [
-                    a
-                    for a in BidAmount
-                    if a.value > (self.bidding.active_bid or BidAmount.PASS).value
-                ]
-
-                return tuple(
-                    AvailableBid(amount=a)
-                    for a in sorted([BidAmount.PASS, *dealer_steal, *higher_bids])
-                )
+                return self.available_bids
             case Status.TRUMP_SELECTION:
-                return (
-                    tuple(AvailableSelectTrump(suit=s) for s in SelectableSuit)
-                    if self.table.bidder_seat == 0
-                    else ()
-                )
+                return self.available_trump_selections
             case Status.DISCARD:
-                hand_list = list(self.hand)
-                return tuple(
-                    AvailableDiscard(subset)
-                    for r in range(len(hand_list) + 1)
-                    for subset in combinations(hand_list, r)
-                )
+                return self.available_discards
             case Status.TRICKS:
-                bleeding = bool(self.tricks.current_trick_plays) and (
-                    self.tricks.current_trick_plays[0].card.trump_for_selection(
-                        self.bidding.trump
-                    )
-                )
-                player_trumps = [
-                    c for c in self.hand if c.trump_for_selection(self.bidding.trump)
-                ]
-
-                playable = (
-                    self.hand if (not bleeding or not player_trumps) else player_trumps
-                )
-
-                return tuple(AvailablePlay(card) for card in playable)
+                return self.available_plays
             case _:
                 return ()
 
-    @property
+    @cached_property
     def available_bids(self) -> tuple[AvailableBid, ...]:
         """Return only Bid actions from available_actions"""
-        return tuple(a for a in self.available_actions if isinstance(a, AvailableBid))
+        if self.status != Status.BIDDING or any(
+            b == BidEvent(0, BidAmount.PASS) for b in self.bidding.bid_history
+        ):
+            return ()
+
+        dealer_steal = (
+            [self.bidding.active_bid]
+            if self.bidding.active_bid and self.table.dealer_seat == 0
+            else []
+        )
+        higher_bids = [
+            a
+            for a in BidAmount
+            if a.value > (self.bidding.active_bid or BidAmount.PASS).value
+        ]
 
-    @property
-    def available_trump_selections(self) -> tuple[AvailableSelectTrump, ...]:
-        """Return only SelectTrump actions from available_actions"""
         return tuple(
-            a for a in self.available_actions if isinstance(a, AvailableSelectTrump)
+            AvailableBid.of(a)
+            for a in sorted([BidAmount.PASS, *dealer_steal, *higher_bids])
         )
 
-    @property
-    def available_discards(self) -> tuple[AvailableDiscard, ...]:
+    @cached_property
+    def available_trump_selections(self) -> tuple[AvailableSelectTrump, ...]:
+        """Return only SelectTrump actions from available_actions"""
+        if self.status != Status.TRUMP_SELECTION or self.table.bidder_seat != 0:
+            return ()
+        return tuple(AvailableSelectTrump.of(s) for s in SelectableSuit)
+
+    @cached_property
+    def available_discards(self) -> Sequence[AvailableDiscard]:
         """Return only Discard actions from available_actions"""
-        return tuple(
-            a for a in self.available_actions if isinstance(a, AvailableDiscard)
-        )
+        if self.status != Status.DISCARD:
+            return ()
+        return AvailableDiscards(self.hand)
 
-    @property
+    @cached_property
     def available_plays(self) -> tuple[AvailablePlay, ...]:
         """Return only Play actions from available_actions"""
-        return tuple(a for a in self.available_actions if isinstance(a, AvailablePlay))
+        if self.status != Status.TRICKS:
+            return ()
+        bleeding = bool(self.tricks.current_trick_plays) and (
+            self.tricks.current_trick_plays[0].card.trump_for_selection(
+                self.bidding.trump
+            )
+        )
+        player_trumps = self.hand_set.trumps(self.bidding.trump)
+
+        playable = (
+            self.hand
+            if (not bleeding or not player_trumps)
+            else [c for c in self.hand if c in player_trumps]
+        )
+
+        return tuple(AvailablePlay.of(card) for card in playable)
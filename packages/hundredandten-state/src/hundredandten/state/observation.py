@@ -0,0 +1,301 @@
+"""
+A fixed-shape numeric observation of a GameState, backed by NumPy.
+Requires the numpy extra: pip install hundredandten-state[numpy]
+
+An observation is a vector of OBSERVATION_SIZE values. Every value is 0 unless listed.
+Each section begins at the offset named by its constant.
+Seats are relative, as in the GameState, and sections always hold MAX_PLAYERS seats.
+
+    section        size       values
+    STATUS         5          1 at the index of the status in Status
+    CARDS          53 * 7     for each card in ALL_CARDS order, 1 at one of
+                                  0: in hand, 1: discarded, 2: unknown,
+                                  3 + seat: played by that seat
+    BID_HISTORY    4 * 7      for each seat, 1 at 0 when it has not bid,
+                                  otherwise at 1 + the position of its latest bid in BIDS
+    ACTIVE_BID     7          1 at 0 without an active bid,
+                                  otherwise at 1 + its position in BIDS
+    TRUMP          5          1 at 0 without trump, otherwise at 1 + its suit index
+    PLAYERS        3          1 at the number of players - 2
+    DEALER         4          1 at the dealer seat
+    BIDDER         5          1 at 0 without a bidder, otherwise at 1 + its seat
+    SCORES         4          each seat's score / SCORE_SCALE, or in an integer
+                                  dtype, the score clipped to the dtype's range
+    TRICK          4 * 53     for each seat, 1 at the card it played in the current trick
+    LEAD           5          1 at 0 when the current trick is empty,
+                                  otherwise at 1 + the seat that led it
+
+Actions are numbered in a single space of ACTION_SIZE indices, for a policy with one
+output per action. Each kind of action begins at the offset named by its constant.
+
+    actions          size   index
+    BID_ACTIONS      6      the position of the amount in BIDS
+    TRUMP_ACTIONS    4      the suit index
+    DISCARD_ACTIONS  32     the bitmask over the hand, as in AvailableDiscards
+    PLAY_ACTIONS     53     the card index
+"""
+
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+from hundredandten.deck import ALL_CARDS, SelectableSuit
+from numpy.typing import DTypeLike, NDArray
+
+from . import (
+    AvailableAction,
+    AvailableBid,
+    AvailableDiscard,
+    AvailableDiscards,
+    AvailablePlay,
+    AvailableSelectTrump,
+    BidAmount,
+    Discarded,
+    GameState,
+    InHand,
+    Status,
+    Unknown,
+)
+
+HAND_SIZE = 5
+MAX_PLAYERS = 4
+MIN_PLAYERS = 2
+# the score needed to win a game
+SCORE_SCALE = 110.0
+
+STATUSES = tuple(Status)
+BIDS = tuple(sorted(BidAmount))
+SUITS = tuple(sorted(SelectableSuit, key=lambda suit: suit.index))
+
+_CARD_CHANNELS = 3 + MAX_PLAYERS
+_BID_CHANNELS = 1 + len(BIDS)
+
+STATUS = 0
+CARDS = STATUS + len(STATUSES)
+BID_HISTORY = CARDS + len(ALL_CARDS) * _CARD_CHANNELS
+ACTIVE_BID = BID_HISTORY + MAX_PLAYERS * _BID_CHANNELS
+TRUMP = ACTIVE_BID + _BID_CHANNELS
+PLAYERS = TRUMP + 1 + len(SelectableSuit)
+DEALER = PLAYERS + MAX_PLAYERS - MIN_PLAYERS + 1
+BIDDER = DEALER + MAX_PLAYERS
+SCORES = BIDDER + 1 + MAX_PLAYERS
+TRICK = SCORES + MAX_PLAYERS
+LEAD = TRICK + MAX_PLAYERS * len(ALL_CARDS)
+OBSERVATION_SIZE = LEAD + 1 + MAX_PLAYERS
+
+BID_ACTIONS = 0
+TRUMP_ACTIONS = BID_ACTIONS + len(BIDS)
+DISCARD_ACTIONS = TRUMP_ACTIONS + len(SUITS)
+PLAY_ACTIONS = DISCARD_ACTIONS + (1 << HAND_SIZE)
+ACTION_SIZE = PLAY_ACTIONS + len(ALL_CARDS)
+
+_STATUS_INDEX = {status: index for index, status in enumerate(STATUSES)}
+_BID_INDEX = {amount: 1 + index for index, amount in enumerate(BIDS)}
+
+
+def encode(
+    state: GameState,
+    out: Optional[NDArray] = None,
+    dtype: DTypeLike = np.float32,
+) -> NDArray:
+    """
+    The observation of the state.
+    It is written into out when provided, which must have shape (OBSERVATION_SIZE,),
+    and otherwise into a new array of the provided dtype.
+    """
+    if out is None:
+        out = np.empty(OBSERVATION_SIZE, dtype=dtype)
+    out.fill(0)
+    out[_ones(state)] = 1
+    out[SCORES : SCORES + len(state.table.scores)] = _scores(state, out.dtype)
+    return out
+
+
+def encode_batch(
+    states: Sequence[GameState],
+    out: Optional[NDArray] = None,
+    dtype: DTypeLike = np.float32,
+) -> NDArray:
+    """
+    The observations of many states, one per row.
+    They are written into out when provided, which must have shape
+    (len(states), OBSERVATION_SIZE), and otherwise into a new array of the provided dtype.
+    """
+    if out is None:
+        out = np.empty((len(states), OBSERVATION_SIZE), dtype=dtype)
+    out.fill(0)
+    rows: list[int] = []
+    columns: list[int] = []
+    for row, state in enumerate(states):
+        ones = _ones(state)
+        rows.extend([row] * len(ones))
+        columns.extend(ones)
+        out[row, SCORES : SCORES + len(state.table.scores)] = _scores(state, out.dtype)
+    out[rows, columns] = 1
+    return out
+
+
+def action_to_index(state: GameState, action: AvailableAction) -> int:
+    """The index of the action available from the state"""
+    match action:
+        case AvailableBid():
+            return BID_ACTIONS + _BID_INDEX[action.amount] - 1
+        case AvailableSelectTrump():
+            return TRUMP_ACTIONS + action.suit.index
+        case AvailableDiscard():
+            return DISCARD_ACTIONS + AvailableDiscards(state.hand).mask_of(action)
+        case AvailablePlay():
+            return PLAY_ACTIONS + action.card.index
+    raise ValueError(f"{action} is not an action")  # pragma: no cover
+
+
+def index_to_action(state: GameState, index: int) -> AvailableAction:
+    """The action at the index, discarding from the state's hand"""
+    if BID_ACTIONS <= index < TRUMP_ACTIONS:
+        return AvailableBid.of(BIDS[index - BID_ACTIONS])
+    if TRUMP_ACTIONS <= index < DISCARD_ACTIONS:
+        return AvailableSelectTrump.of(SUITS[index - TRUMP_ACTIONS])
+    discards = AvailableDiscards(state.hand)
+    if DISCARD_ACTIONS <= index < DISCARD_ACTIONS + len(discards):
+        return discards[index - DISCARD_ACTIONS]
+    if PLAY_ACTIONS <= index < ACTION_SIZE:
+        return AvailablePlay.of(ALL_CARDS[index - PLAY_ACTIONS])
+    raise ValueError(f"{index} is not an action from this state")
+
+
+def legal_mask(state: GameState, out: Optional[NDArray] = None) -> NDArray[np.bool]:
+    """
+    Whether each action index is available from the state.
+    It is written into out when provided, which must have shape (ACTION_SIZE,).
+    """
+    if out is None:
+        out = np.empty(ACTION_SIZE, dtype=np.bool)
+    out.fill(False)
+    out[_legal_indices(state)] = True
+    return out
+
+
+def legal_mask_batch(
+    states: Sequence[GameState], out: Optional[NDArray] = None
+) -> NDArray[np.bool]:
+    """
+    Whether each action index is available from each state, one row per state.
+    They are written into out when provided, which must have shape
+    (len(states), ACTION_SIZE).
+    """
+    if out is None:
+        out = np.empty((len(states), ACTION_SIZE), dtype=np.bool)
+    out.fill(False)
+    rows: list[int] = []
+    columns: list[int] = []
+    for row, state in enumerate(states):
+        legal = _legal_indices(state)
+        rows.extend([row] * len(legal))
+        columns.extend(legal)
+    out[rows, columns] = True
+    return out
+
+
+def _legal_indices(state: GameState) -> list[int]:
+    """
+    The index of every action available from the state, found by the same rules as
+    GameState.available_actions without building the actions
+    """
+    match state.status:
+        case Status.BIDDING:
+            return _bid_indices(state)
+        case Status.TRUMP_SELECTION if state.table.bidder_seat == 0:
+            return list(range(TRUMP_ACTIONS, DISCARD_ACTIONS))
+        case Status.DISCARD:
+            # every mask over the hand is available
+            return list(
+                range(DISCARD_ACTIONS, DISCARD_ACTIONS + (1 << len(state.hand)))
+            )
+        case Status.TRICKS:
+            return _play_indices(state)
+        case _:
+            return []
+
+
+def _bid_indices(state: GameState) -> list[int]:
+    """The index of every bid available from the state"""
+    if any(
+        bid.seat == 0 and bid.amount == BidAmount.PASS
+        for bid in state.bidding.bid_history
+    ):
+        return []
+    active_bid = state.bidding.active_bid
+    # the dealer can take the active bid, and anyone can pass or bid higher
+    return [
+        BID_ACTIONS + index
+        for index, amount in enumerate(BIDS)
+        if amount == BidAmount.PASS
+        or amount > (active_bid or BidAmount.PASS)
+        or (amount == active_bid and state.table.dealer_seat == 0)
+    ]
+
+
+def _play_indices(state: GameState) -> list[int]:
+    """The index of every card the state's hand can play into the trick"""
+    playable = state.hand_set
+    plays = state.tricks.current_trick_plays
+    trump = state.bidding.trump
+    if plays and plays[0].card.trump_for_selection(trump):
+        # a trump was led, so trump must be played if it can be
+        playable = playable.trumps(trump) or playable
+    return [PLAY_ACTIONS + card.index for card in playable]
+
+
+def _scores(state: GameState, dtype: np.dtype) -> NDArray:
+    """
+    The scores section of the observation of the state in the dtype.
+    Scaled scores would truncate to 0 in an integer dtype, so those hold the
+    scores themselves, clipped to the range of the dtype.
+    """
+    if np.issubdtype(dtype, np.integer):
+        limits = np.iinfo(dtype)
+        return np.clip(state.table.scores, limits.min, limits.max)
+    return np.divide(state.table.scores, SCORE_SCALE)
+
+
+def _ones(state: GameState) -> list[int]:
+    """The position of every 1 in the observation of the state"""
+    ones = [STATUS + _STATUS_INDEX[state.status]]
+
+    for knowledge in state.cards:
+        base = CARDS + knowledge.card.index * _CARD_CHANNELS
+        match knowledge.status:
+            case InHand():
+                ones.append(base)
+            case Discarded():
+                ones.append(base + 1)
+            case Unknown():
+                ones.append(base + 2)
+            case _:
+                ones.append(base + 3 + knowledge.status.seat)
+
+    latest_bids = {
+        bid.seat: _BID_INDEX[bid.amount] for bid in state.bidding.bid_history
+    }
+    ones.extend(
+        BID_HISTORY + seat * _BID_CHANNELS + latest_bids.get(seat, 0)
+        for seat in range(state.table.num_players)
+    )
+    active_bid = state.bidding.active_bid
+    ones.append(ACTIVE_BID + (_BID_INDEX[active_bid] if active_bid is not None else 0))
+
+    trump = state.bidding.trump
+    ones.append(TRUMP + (1 + trump.index if trump is not None else 0))
+
+    table = state.table
+    ones.append(PLAYERS + table.num_players - MIN_PLAYERS)
+    ones.append(DEALER + table.dealer_seat)
+    ones.append(
+        BIDDER + (1 + table.bidder_seat if table.bidder_seat is not None else 0)
+    )
+
+    plays = state.tricks.current_trick_plays
+    ones.extend(TRICK + play.seat * len(ALL_CARDS) + play.card.index for play in plays)
+    ones.append(LEAD + (1 + plays[0].seat if plays else 0))
+
+    return ones
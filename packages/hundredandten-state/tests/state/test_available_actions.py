@@ -0,0 +1,140 @@
+"""Tests for computing the actions available from a state and sharing its parts"""
+
+from dataclasses import fields
+from unittest import TestCase
+
+from hundredandten.deck import ALL_CARDS, SelectableSuit
+from hundredandten.state import (
+    AvailableBid,
+    AvailableDiscard,
+    AvailablePlay,
+    AvailableSelectTrump,
+    BidAmount,
+    BidEvent,
+    CardKnowledge,
+    InHand,
+    Played,
+    Status,
+    TrickPlay,
+)
+from hundredandten.testing import state as build
+
+HAND = ALL_CARDS[:5]
+
+
+def states():
+    """A state in each status the active player can act in, and a won state"""
+    return [
+        build.game_state(status=Status.BIDDING, hand=HAND),
+        build.game_state(
+            status=Status.TRUMP_SELECTION,
+            hand=HAND,
+            table_info=build.table(bidder_seat=0),
+        ),
+        build.game_state(
+            status=Status.DISCARD,
+            hand=HAND,
+            bidding_state=build.bidding(trump=SelectableSuit.HEARTS),
+        ),
+        build.game_state(
+            status=Status.TRICKS,
+            hand=HAND,
+            bidding_state=build.bidding(trump=SelectableSuit.HEARTS),
+        ),
+        build.game_state(status=Status.WON, hand=HAND),
+    ]
+
+
+class TestAvailableActions(TestCase):
+    """Available actions are computed once and only for the state's phase"""
+
+    def test_available_actions_computed_once(self):
+        """Repeated access returns the same computed actions"""
+        for state in states():
+            self.assertIs(state.available_actions, state.available_actions)
+            self.assertIs(state.hand_set, state.hand_set)
+
+    def test_equal_states_have_equal_actions(self):
+        """States built alike have equal available actions in every status"""
+        for state, same in zip(states(), states()):
+            self.assertEqual(state.available_actions, same.available_actions)
+            self.assertEqual(state, same)
+
+    def test_phase_subsets_match_available_actions(self):
+        """Each phase subset is the available actions of that type"""
+        for state in states():
+            for subset, action_type in (
+                (state.available_bids, AvailableBid),
+                (state.available_trump_selections, AvailableSelectTrump),
+                (state.available_discards, AvailableDiscard),
+                (state.available_plays, AvailablePlay),
+            ):
+                self.assertEqual(
+                    tuple(subset),
+                    tuple(
+                        a for a in state.available_actions if isinstance(a, action_type)
+                    ),
+                )
+
+    def test_each_phase_has_actions(self):
+        """Every phase but a won game has available actions"""
+        self.assertEqual(
+            [True, True, True, True, False],
+            [bool(state.available_actions) for state in states()],
+        )
+
+
+def vars_of(value) -> tuple:
+    """The field values of a slotted dataclass, in order"""
+    return tuple(getattr(value, field.name) for field in fields(value))
+
+
+class TestSharedValues(TestCase):
+    """Unit tests for sharing the finite values that make up a state"""
+
+    def test_of_is_shared(self):
+        """The same arguments give the same instance"""
+        card = ALL_CARDS[7]
+        for build_value in (
+            lambda: CardKnowledge.of(card, Played.of(1, 2)),
+            lambda: Played.of(1, 2),
+            lambda: TrickPlay.of(3, card),
+            lambda: BidEvent.of(0, BidAmount.THIRTY),
+            lambda: AvailableBid.of(BidAmount.THIRTY),
+            lambda: AvailableSelectTrump.of(SelectableSuit.CLUBS),
+            lambda: AvailablePlay.of(card),
+        ):
+            self.assertIs(build_value(), build_value())
+
+    def test_of_equals_constructed(self):
+        """A shared instance equals one constructed directly"""
+        card = ALL_CARDS[7]
+
+        self.assertEqual(
+            CardKnowledge(card, InHand()), CardKnowledge.of(card, InHand())
+        )
+        self.assertEqual(TrickPlay(seat=3, card=card), TrickPlay.of(3, card))
+        self.assertEqual(AvailablePlay(card), AvailablePlay.of(card))
+
+    def test_available_actions_are_shared(self):
+        """Available bids, trump selections and plays are the shared instances"""
+        for state in states():
+            for action in (
+                *state.available_bids,
+                *state.available_trump_selections,
+                *state.available_plays,
+            ):
+                self.assertIs(type(action).of(*vars_of(action)), action)
+
+    def test_values_are_slotted(self):
+        """Values that make up a state do not carry an attribute dictionary"""
+        card = ALL_CARDS[7]
+        for value in (
+            CardKnowledge.of(card, InHand()),
+            Played.of(1, 2),
+            TrickPlay.of(3, card),
+            BidEvent.of(0, BidAmount.THIRTY),
+            AvailableDiscard((card,)),
+            AvailablePlay.of(card),
+        ):
+            self.assertFalse(hasattr(value, "__dict__"))
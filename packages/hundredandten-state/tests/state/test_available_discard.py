@@ -1,9 +1,10 @@
-"""Tests for AvailableDiscard equality and hashing"""
+"""Tests for AvailableDiscard equality and hashing, and the available discards"""
 
+from itertools import combinations
 from unittest import TestCase
 
-from hundredandten.deck import Card, CardNumber, CardSuit
-from hundredandten.state import AvailableDiscard
+from hundredandten.deck import ALL_CARDS, Card, CardNumber, CardSuit
+from hundredandten.state import AvailableDiscard, AvailableDiscards
 
 ACE_HEARTS = Card(CardNumber.ACE, CardSuit.HEARTS)
 FIVE_SPADES = Card(CardNumber.FIVE, CardSuit.SPADES)
@@ -67,3 +68,82 @@ class TestAvailableDiscardHash(TestCase):
         a = AvailableDiscard((ACE_HEARTS, FIVE_SPADES))
         b = AvailableDiscard((FIVE_SPADES, ACE_HEARTS))
         self.assertEqual(len({a, b}), 1)
+
+
+HAND = (ACE_HEARTS, FIVE_SPADES, TEN_CLUBS, *ALL_CARDS[:2])
+
+
+class TestAvailableDiscards(TestCase):
+    """The discards available from a hand are indexed by a bitmask over it"""
+
+    def test_every_subset(self):
+        """Every subset of the hand is available exactly once"""
+        discards = AvailableDiscards(HAND)
+
+        self.assertEqual(32, len(discards))
+        self.assertEqual(
+            {
+                AvailableDiscard(subset)
+                for r in range(len(HAND) + 1)
+                for subset in combinations(HAND, r)
+            },
+            set(discards),
+        )
+        self.assertEqual(32, len(set(discards)))
+
+    def test_index_is_mask(self):
+        """The discard at an index holds the cards at the positions set in it"""
+        discards = AvailableDiscards(HAND)
+
+        self.assertEqual(AvailableDiscard(()), discards[0])
+        self.assertEqual(AvailableDiscard((FIVE_SPADES, TEN_CLUBS)), discards[0b110])
+        self.assertEqual(AvailableDiscard(HAND), discards[-1])
+        self.assertEqual(tuple(discards)[3:6], discards[3:6])
+        self.assertRaises(IndexError, lambda: discards[32])
+
+    def test_mask_of(self):
+        """The mask of a discard is its index"""
+        discards = AvailableDiscards(HAND)
+
+        for mask, discard in enumerate(discards):
+            self.assertEqual(mask, discards.mask_of(discard))
+        self.assertEqual(
+            0b101, discards.mask_of(AvailableDiscard((TEN_CLUBS, ACE_HEARTS)))
+        )
+        self.assertRaises(
+            ValueError, discards.mask_of, AvailableDiscard((ALL_CARDS[-1],))
+        )
+
+    def test_contains(self):
+        """Any discard of cards in the hand is available, in any order"""
+        discards = AvailableDiscards(HAND)
+
+        self.assertIn(AvailableDiscard((TEN_CLUBS, ACE_HEARTS)), discards)
+        self.assertIn(AvailableDiscard(()), discards)
+        self.assertNotIn(AvailableDiscard((ACE_HEARTS, ALL_CARDS[-1])), discards)
+        self.assertNotIn((ACE_HEARTS,), discards)
+
+    def test_equality(self):
+        """Discards from the same hand are equal and hash alike"""
+        self.assertEqual(AvailableDiscards(HAND), AvailableDiscards(tuple(HAND)))
+        self.assertEqual(
+            hash(AvailableDiscards(HAND)), hash(AvailableDiscards(tuple(HAND)))
+        )
+        self.assertEqual(1, len({AvailableDiscards(HAND), AvailableDiscards(HAND)}))
+        self.assertNotEqual(AvailableDiscards(HAND), AvailableDiscards(HAND[:4]))
+        self.assertNotEqual(AvailableDiscards(HAND), tuple(AvailableDiscards(HAND)))
+
+    def test_add(self):
+        """Adding discards to a sequence of actions builds a tuple"""
+        discards = AvailableDiscards(HAND[:2])
+        extra = (AvailableDiscard((TEN_CLUBS,)),)
+
+        self.assertEqual((*discards, *extra), discards + extra)
+        self.assertEqual((*extra, *discards), extra + discards)
+        self.assertEqual(tuple(discards), () + discards)
+
+    def test_repr(self):
+        """The representation names the hand rather than every discard"""
+        self.assertEqual(
+            f"AvailableDiscards(hand={HAND!r})", repr(AvailableDiscards(HAND))
+        )
@@ -0,0 +1,343 @@
+"""Tests for encoding a GameState as a numeric observation"""
+
+from dataclasses import replace
+from unittest import TestCase
+
+import numpy as np
+from hundredandten.deck import ALL_CARDS, Card, SelectableSuit
+from hundredandten.state import (
+    AvailableDiscard,
+    BidAmount,
+    BidEvent,
+    CardKnowledge,
+    Discarded,
+    GameState,
+    InHand,
+    Played,
+    Status,
+    TrickPlay,
+    TrickState,
+    Unknown,
+)
+from hundredandten.state.observation import (
+    ACTION_SIZE,
+    ACTIVE_BID,
+    BID_HISTORY,
+    BIDDER,
+    BIDS,
+    CARDS,
+    DEALER,
+    LEAD,
+    OBSERVATION_SIZE,
+    PLAYERS,
+    SCORE_SCALE,
+    SCORES,
+    STATUS,
+    STATUSES,
+    TRICK,
+    TRUMP,
+    action_to_index,
+    encode,
+    encode_batch,
+    index_to_action,
+    legal_mask,
+    legal_mask_batch,
+)
+from hundredandten.testing import state as build
+
+CARD_CHANNELS = 7
+BID_CHANNELS = 1 + len(BIDS)
+
+
+def tricks_state() -> GameState:
+    """A three player state partway through a trick"""
+    hand = ALL_CARDS[:3]
+    plays = (
+        TrickPlay(seat=1, card=ALL_CARDS[10]),
+        TrickPlay(seat=2, card=ALL_CARDS[11]),
+    )
+    statuses = {
+        **{card: InHand() for card in hand},
+        ALL_CARDS[3]: Discarded(),
+        ALL_CARDS[10]: Played(trick_index=0, seat=1),
+        ALL_CARDS[11]: Played(trick_index=0, seat=2),
+    }
+    return GameState(
+        status=Status.TRICKS,
+        table=build.table(
+            num_players=3, dealer_seat=2, bidder_seat=1, scores=(20, -15, 55)
+        ),
+        hand=hand,
+        bidding=build.bidding(
+            bid_history=(
+                BidEvent(0, BidAmount.FIFTEEN),
+                BidEvent(1, BidAmount.TWENTY),
+                BidEvent(2, BidAmount.PASS),
+                BidEvent(0, BidAmount.PASS),
+            ),
+            active_bid=BidAmount.TWENTY,
+            trump=SelectableSuit.CLUBS,
+        ),
+        tricks=TrickState(completed_tricks=(), current_trick_plays=plays),
+        cards=tuple(
+            CardKnowledge(card, statuses.get(card, Unknown())) for card in ALL_CARDS
+        ),
+    )
+
+
+class TestEncode(TestCase):
+    """Unit tests for encoding a single state"""
+
+    def test_layout(self):
+        """Each section of the observation holds the documented values"""
+        observation = encode(tricks_state())
+
+        self.assertEqual((OBSERVATION_SIZE,), observation.shape)
+        self.assertEqual(np.float32, observation.dtype)
+
+        expected = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+        expected[STATUS + STATUSES.index(Status.TRICKS)] = 1
+        # unknown, except the hand, one discard, and the two cards in the trick
+        channels = {0: 0, 1: 0, 2: 0, 3: 1, 10: 3 + 1, 11: 3 + 2}
+        for card in ALL_CARDS:
+            channel = channels.get(card.index, 2)
+            expected[CARDS + card.index * CARD_CHANNELS + channel] = 1
+        for seat, amount in enumerate(
+            (BidAmount.PASS, BidAmount.TWENTY, BidAmount.PASS)
+        ):
+            expected[BID_HISTORY + seat * BID_CHANNELS + 1 + BIDS.index(amount)] = 1
+        expected[ACTIVE_BID + 1 + BIDS.index(BidAmount.TWENTY)] = 1
+        expected[TRUMP + 1 + SelectableSuit.CLUBS.index] = 1
+        expected[PLAYERS + 1] = 1
+        expected[DEALER + 2] = 1
+        expected[BIDDER + 2] = 1
+        expected[SCORES : SCORES + 3] = np.array([20, -15, 55]) / SCORE_SCALE
+        expected[TRICK + 1 * len(ALL_CARDS) + 10] = 1
+        expected[TRICK + 2 * len(ALL_CARDS) + 11] = 1
+        expected[LEAD + 2] = 1
+
+        np.testing.assert_array_equal(expected, observation)
+
+    def test_empty_sections(self):
+        """Missing bids, trump, bidder and plays have their own positions"""
+        observation = encode(build.game_state())
+
+        self.assertEqual(1, observation[STATUS + STATUSES.index(Status.BIDDING)])
+        for seat in range(4):
+            self.assertEqual(1, observation[BID_HISTORY + seat * BID_CHANNELS])
+        self.assertEqual(1, observation[ACTIVE_BID])
+        self.assertEqual(1, observation[TRUMP])
+        self.assertEqual(1, observation[PLAYERS + 2])
+        self.assertEqual(1, observation[DEALER + 1])
+        self.assertEqual(1, observation[BIDDER])
+        self.assertEqual(1, observation[LEAD])
+        self.assertEqual(11, observation.sum())
+
+    def test_encode_into_buffer(self):
+        """An observation can be written into an existing buffer of any dtype"""
+        buffer = np.full(OBSERVATION_SIZE, 7, dtype=np.int8)
+
+        result = encode(build.game_state(), out=buffer)
+
+        self.assertIs(buffer, result)
+        np.testing.assert_array_equal(encode(build.game_state()), buffer)
+
+    def test_encode_dtype(self):
+        """A new observation can be of any dtype"""
+        self.assertEqual(np.int8, encode(build.game_state(), dtype=np.int8).dtype)
+
+    def test_integer_scores(self):
+        """Integer observations hold the scores, clipped to the range of the dtype"""
+        state = tricks_state()
+        wide = replace(state, table=replace(state.table, scores=(200, -150, 55)))
+
+        observation = encode(state, dtype=np.int8)
+
+        np.testing.assert_array_equal(
+            [20, -15, 55, 0], observation[SCORES : SCORES + 4]
+        )
+        np.testing.assert_array_equal(
+            [127, -128, 55, 0], encode(wide, dtype=np.int8)[SCORES : SCORES + 4]
+        )
+        np.testing.assert_array_equal(
+            observation, encode_batch([state], dtype=np.int8)[0]
+        )
+
+
+class TestEncodeBatch(TestCase):
+    """Unit tests for encoding many states at once"""
+
+    def test_rows_match_encode(self):
+        """Each row is the observation of the matching state"""
+        states = [tricks_state(), build.game_state(), tricks_state()]
+
+        observations = encode_batch(states)
+
+        self.assertEqual((3, OBSERVATION_SIZE), observations.shape)
+        for observation, state in zip(observations, states):
+            np.testing.assert_array_equal(encode(state), observation)
+
+    def test_batch_into_buffer(self):
+        """Observations can be written into an existing buffer"""
+        buffer = np.ones((2, OBSERVATION_SIZE), dtype=np.float32)
+
+        result = encode_batch([build.game_state(), tricks_state()], out=buffer)
+
+        self.assertIs(buffer, result)
+        np.testing.assert_array_equal(encode(build.game_state()), buffer[0])
+
+    def test_empty_batch(self):
+        """No states encode to an empty batch"""
+        self.assertEqual((0, OBSERVATION_SIZE), encode_batch([]).shape)
+
+
+def acting_states() -> list[GameState]:
+    """A state in each phase with available actions, and a won state"""
+    hand = ALL_CARDS[20:25]
+    trump = build.bidding(trump=SelectableSuit.SPADES)
+    return [
+        build.game_state(
+            table_info=build.table(dealer_seat=0),
+            bidding_state=build.bidding(active_bid=BidAmount.TWENTY),
+        ),
+        build.game_state(
+            status=Status.TRUMP_SELECTION, table_info=build.table(bidder_seat=0)
+        ),
+        build.game_state(status=Status.DISCARD, hand=hand, bidding_state=trump),
+        build.game_state(status=Status.TRICKS, hand=hand, bidding_state=trump),
+        build.game_state(status=Status.WON, hand=hand),
+    ]
+
+
+def rule_states() -> list[GameState]:
+    """States at the edges of the rules for which actions are available"""
+    trump = SelectableSuit.SPADES
+    trumps = [card for card in ALL_CARDS if card.trump_for_selection(trump)]
+    others = [card for card in ALL_CARDS if not card.trump_for_selection(trump)]
+    bidding = build.bidding(active_bid=BidAmount.TWENTY, trump=trump)
+
+    def led(card: Card) -> TrickState:
+        return TrickState(
+            completed_tricks=(), current_trick_plays=(TrickPlay(seat=1, card=card),)
+        )
+
+    return [
+        # the dealer may take the active bid, others must bid higher
+        *(
+            build.game_state(
+                table_info=build.table(dealer_seat=dealer),
+                bidding_state=build.bidding(active_bid=BidAmount.TWENTY),
+            )
+            for dealer in (0, 1)
+        ),
+        # a player that passed cannot bid again
+        build.game_state(
+            bidding_state=build.bidding(bid_history=(BidEvent(0, BidAmount.PASS),))
+        ),
+        # only the bidder selects trump
+        build.game_state(
+            status=Status.TRUMP_SELECTION, table_info=build.table(bidder_seat=1)
+        ),
+        # a trump lead must be followed with trump, if there is one to play
+        *(
+            build.game_state(
+                status=Status.TRICKS,
+                hand=hand,
+                bidding_state=bidding,
+                trick_state=led(lead),
+            )
+            for hand in (tuple(trumps[1:3] + others[:3]), tuple(others[:5]))
+            for lead in (trumps[0], others[10])
+        ),
+    ]
+
+
+class TestActionIndex(TestCase):
+    """Unit tests for numbering actions in a single space"""
+
+    def test_action_size(self):
+        """There are 6 bids, 4 trumps, 32 discards and 53 plays"""
+        self.assertEqual(95, ACTION_SIZE)
+
+    def test_round_trip(self):
+        """Every available action maps to a distinct index and back"""
+        for state in acting_states():
+            indices = [action_to_index(state, a) for a in state.available_actions]
+
+            self.assertEqual(len(indices), len(set(indices)))
+            self.assertTrue(all(0 <= index < ACTION_SIZE for index in indices))
+            self.assertEqual(
+                tuple(state.available_actions),
+                tuple(index_to_action(state, index) for index in indices),
+            )
+            if state.status != Status.DISCARD:
+                for action, index in zip(state.available_actions, indices):
+                    self.assertIs(action, index_to_action(state, index))
+
+    def test_discard_in_any_order(self):
+        """A discard maps to the same index regardless of the order of its cards"""
+        state = acting_states()[2]
+
+        self.assertEqual(
+            action_to_index(state, AvailableDiscard((ALL_CARDS[21], ALL_CARDS[23]))),
+            action_to_index(state, AvailableDiscard((ALL_CARDS[23], ALL_CARDS[21]))),
+        )
+
+    def test_invalid_indices(self):
+        """Indices outside the action space, or discards past the hand, are rejected"""
+        state = build.game_state(status=Status.DISCARD, hand=ALL_CARDS[:3])
+
+        for index in (-1, ACTION_SIZE, 6 + 4 + 8):
+            self.assertRaises(ValueError, index_to_action, state, index)
+
+
+class TestLegalMask(TestCase):
+    """Unit tests for masking the available actions"""
+
+    def test_mask_matches_available_actions(self):
+        """The mask is set at exactly the index of each available action"""
+        for state in acting_states():
+            mask = legal_mask(state)
+
+            self.assertEqual((ACTION_SIZE,), mask.shape)
+            self.assertEqual(np.bool, mask.dtype)
+            self.assertEqual(
+                sorted(action_to_index(state, a) for a in state.available_actions),
+                np.flatnonzero(mask).tolist(),
+            )
+
+    def test_mask_follows_the_rules(self):
+        """The mask matches the available actions at the edges of the rules"""
+        for state in rule_states():
+            self.assertEqual(
+                sorted(action_to_index(state, a) for a in state.available_actions),
+                np.flatnonzero(legal_mask(state)).tolist(),
+            )
+
+    def test_mask_into_buffer(self):
+        """A mask can be written into an existing buffer"""
+        buffer = np.ones(ACTION_SIZE, dtype=np.bool)
+
+        result = legal_mask(acting_states()[-1], out=buffer)
+
+        self.assertIs(buffer, result)
+        self.assertFalse(buffer.any())
+
+    def test_batch_rows_match_mask(self):
+        """Each row of a batch is the mask of the matching state"""
+        states = acting_states()
+
+        masks = legal_mask_batch(states)
+
+        self.assertEqual((len(states), ACTION_SIZE), masks.shape)
+        for mask, state in zip(masks, states):
+            np.testing.assert_array_equal(legal_mask(state), mask)
+
+    def test_batch_into_buffer(self):
+        """Masks can be written into an existing buffer"""
+        buffer = np.ones((2, ACTION_SIZE), dtype=np.bool)
+
+        result = legal_mask_batch(acting_states()[3:], out=buffer)
+
+        self.assertIs(buffer, result)
+        self.assertFalse(buffer[1].any())